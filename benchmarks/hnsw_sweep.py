@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+HNSW parameter sweep for the ChromaDB vector backend.
+
+Builds one collection per (M, ef_construction) pair, then queries it at every
+ef_search value and prints a recall-vs-latency table. Recall@k is measured
+against exact brute-force neighbours; with ``--corpus golden`` the knowledge
+base is embedded and the golden questions are the queries, and the hit rate
+of the expected topic is reported too:
+
+    python benchmarks/hnsw_sweep.py --docs 20000 --m 8,16,32 --ef-search 16,32,64,128
+    python benchmarks/hnsw_sweep.py --corpus golden --output sweep.json
+
+Chosen values go into ``Settings.VECTOR_HNSW_M``, ``VECTOR_HNSW_EF_CONSTRUCTION``
+and ``VECTOR_HNSW_EF_SEARCH``.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+from chromadb.api.client import SharedSystemClient
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from eduassist.services.vector_backends import ChromaBackend
+from retrieval_benchmark import DEFAULT_GOLDEN, git_commit, load_golden, percentile
+from vector_backend_benchmark import make_corpus
+
+
+def golden_corpus(golden_path: Path, kb_path: str) -> Dict:
+    """Embed the knowledge base documents and the golden questions."""
+    from embedding_service import EmbeddingService
+
+    service = EmbeddingService(tempfile.mkdtemp(), embedding_cache_dir=None)
+    documents = service._knowledge_base_documents(kb_path)
+    ids = list(documents)
+    questions = load_golden(golden_path)["questions"]
+    return {
+        "ids": ids,
+        "vectors": np.asarray(service.embedding_fn([documents[i][0] for i in ids]), dtype=np.float32),
+        "queries": np.asarray(service.embedding_fn([q["question"] for q in questions]), dtype=np.float32),
+        "expected": [f"{q['subject']}_{q['topic']}" for q in questions],
+    }
+
+
+def synthetic_corpus(n_docs: int, dim: int, n_queries: int, seed: int) -> Dict:
+    corpus = make_corpus(n_docs, dim, 1, n_queries, seed)
+    return {"ids": [f"doc_{i}" for i in range(n_docs)], "vectors": corpus["vectors"],
+            "queries": corpus["queries"], "expected": None}
+
+
+def exact_neighbours(corpus: Dict, k: int) -> List[set]:
+    vectors = corpus["vectors"] / np.linalg.norm(corpus["vectors"], axis=1, keepdims=True)
+    similarities = corpus["queries"] @ vectors.T
+    top = np.argsort(-similarities, axis=1, kind="stable")[:, :k]
+    return [{corpus["ids"][i] for i in row} for row in top]
+
+
+def sweep_point(backend: ChromaBackend, corpus: Dict, exact: List[set], k: int, repeat: int) -> Dict:
+    """Query every test vector and score recall and latency at the backend's current ef_search."""
+    backend.query([corpus["queries"][0]], k)
+    latencies, hits, topic_hits = [], 0, 0
+    for attempt in range(repeat):
+        for row, query in enumerate(corpus["queries"]):
+            started = time.perf_counter()
+            ids = [r["id"] for r in backend.query([query], k)[0]]
+            latencies.append((time.perf_counter() - started) * 1000.0)
+            if attempt == 0:
+                hits += len(exact[row] & set(ids))
+                if corpus["expected"] is not None and corpus["expected"][row] in ids:
+                    topic_hits += 1
+    latencies.sort()
+    point = {
+        "recall_at_k": hits / (k * len(exact)),
+        "latency_ms": {"p50": percentile(latencies, 50), "p95": percentile(latencies, 95)},
+    }
+    if corpus["expected"] is not None:
+        point["topic_hit_at_k"] = topic_hits / len(corpus["expected"])
+    return point
+
+
+def print_table(points: List[Dict]):
+    has_topics = any("topic_hit_at_k" in p for p in points)
+    header = f"{'M':>4} {'ef_constr':>9} {'ef_search':>9} {'build_s':>8} {'recall':>7} {'p50_ms':>7} {'p95_ms':>7}"
+    print(header + (f" {'topic@k':>7}" if has_topics else ""))
+    for p in points:
+        line = (f"{p['m']:>4} {p['ef_construction']:>9} {p['ef_search']:>9} {p['build_seconds']:>8.2f} "
+                f"{p['recall_at_k']:>7.3f} {p['latency_ms']['p50']:>7.2f} {p['latency_ms']['p95']:>7.2f}")
+        print(line + (f" {p['topic_hit_at_k']:>7.3f}" if has_topics else ""))
+
+
+def int_list(value: str) -> List[int]:
+    return [int(v) for v in value.split(",") if v.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep HNSW parameters and report recall against latency.")
+    parser.add_argument("--corpus", choices=("synthetic", "golden"), default="synthetic", help="Test corpus")
+    parser.add_argument("--golden", type=Path, default=DEFAULT_GOLDEN, help="Golden set JSON file")
+    parser.add_argument("--kb", default=str(ROOT / "knowledge_base.json"), help="Knowledge base JSON file")
+    parser.add_argument("--docs", type=int, default=20000, help="Synthetic documents")
+    parser.add_argument("--dim", type=int, default=384, help="Synthetic embedding dimension")
+    parser.add_argument("--queries", type=int, default=200, help="Synthetic queries")
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic corpus random seed")
+    parser.add_argument("--m", type=int_list, default=[8, 16, 32], help="Comma-separated M values")
+    parser.add_argument("--ef-construction", type=int_list, default=[100, 200], help="Comma-separated values")
+    parser.add_argument("--ef-search", type=int_list, default=[10, 20, 50, 100, 200], help="Comma-separated values")
+    parser.add_argument("--k", type=int, default=5, help="Results per query")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed passes over the queries")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Documents per upsert")
+    parser.add_argument("--output", type=Path, help="Also write the JSON report here")
+    args = parser.parse_args()
+
+    if args.corpus == "golden":
+        corpus = golden_corpus(args.golden, args.kb)
+    else:
+        corpus = synthetic_corpus(args.docs, args.dim, args.queries, args.seed)
+    exact = exact_neighbours(corpus, args.k)
+
+    points: List[Dict] = []
+    for m in args.m:
+        for ef_construction in args.ef_construction:
+            with tempfile.TemporaryDirectory() as persist_dir:
+                hnsw = {"max_neighbors": m, "ef_construction": ef_construction}
+                backend = ChromaBackend(persist_dir, None, hnsw=hnsw)
+                started = time.perf_counter()
+                for offset in range(0, len(corpus["ids"]), args.batch_size):
+                    ids = corpus["ids"][offset:offset + args.batch_size]
+                    backend.upsert(ids, corpus["vectors"][offset:offset + args.batch_size],
+                                   [""] * len(ids), [{"subject": "all"}] * len(ids))
+                build_seconds = time.perf_counter() - started
+                for ef_search in args.ef_search:
+                    # ef_search is read when the index is loaded, so drop the cached client and reopen
+                    SharedSystemClient.clear_system_cache()
+                    backend = ChromaBackend(persist_dir, None, hnsw={**hnsw, "ef_search": ef_search})
+                    point = {"m": m, "ef_construction": ef_construction, "ef_search": ef_search,
+                             "build_seconds": build_seconds}
+                    point.update(sweep_point(backend, corpus, exact, args.k, args.repeat))
+                    points.append(point)
+
+    print_table(points)
+    if args.output:
+        report = {
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "corpus": args.corpus,
+            "docs": len(corpus["ids"]),
+            "queries": len(corpus["queries"]),
+            "k": args.k,
+            "points": points,
+        }
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Retrieval quality and latency benchmark for JNTU EduAssist.
+
+Runs a versioned golden set of question -> topic pairs through each retrieval
+mode and reports recall@1, recall@3, MRR and p50/p95/p99 latency as JSON, so
+numbers can be compared between commits:
+
+    python benchmarks/retrieval_benchmark.py --output bench.json
+    python benchmarks/retrieval_benchmark.py --compare bench.json
+    python benchmarks/retrieval_benchmark.py --modes keyword --semantic-cache
+
+Modes:
+    keyword    KnowledgeService (latency of find_answer, ranking from rank_topics)
+    embedding  EmbeddingService.search over the configured vector backend
+    hybrid     HybridRetriever fusing both tiers
+
+``--semantic-cache`` also measures where ``Settings.SEMANTIC_CACHE_THRESHOLD``
+should sit: golden questions about the same topic are paraphrases the
+semantic query cache should answer from each other's results, questions about
+different topics must never hit.
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from eduassist.services.knowledge_index import load_index
+from eduassist.services.knowledge_service import KnowledgeService
+from eduassist.services.hybrid_retriever import HybridRetriever
+
+DEFAULT_GOLDEN = ROOT / "benchmarks" / "golden" / "retrieval_v1.json"
+RANK_DEPTH = 10
+SEMANTIC_THRESHOLDS = [round(0.80 + 0.01 * step, 2) for step in range(19)]
+
+RankFn = Callable[[str], List[str]]
+
+
+def load_golden(path: Path) -> Dict:
+    """Load a golden set and attach the SHA-256 of its contents."""
+    raw = path.read_bytes()
+    golden = json.loads(raw.decode("utf-8"))
+    golden["sha256"] = hashlib.sha256(raw).hexdigest()
+    return golden
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100.0 * len(sorted_values)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def evaluate(rank_fn: RankFn, questions: List[Dict], repeat: int,
+             timed_fn: Optional[Callable[[str], object]] = None) -> Dict:
+    """Score one retrieval mode against the golden questions.
+
+    Args:
+        rank_fn: Returns ranked doc ids ("<subject>_<topic>") for a question
+        questions: Golden entries with question, subject and topic
+        repeat: Number of timed passes over the questions
+        timed_fn: Call to time instead of rank_fn, if latency should be measured elsewhere
+
+    Returns:
+        Dictionary of quality metrics, latency percentiles and misses
+    """
+    timed_fn = timed_fn or rank_fn
+    hits_at_1 = hits_at_3 = 0
+    reciprocal_ranks = 0.0
+    misses = []
+
+    for entry in questions:
+        expected = f"{entry['subject']}_{entry['topic']}"
+        ranked = rank_fn(entry["question"])[:RANK_DEPTH]
+        if expected in ranked:
+            position = ranked.index(expected) + 1
+            reciprocal_ranks += 1.0 / position
+            hits_at_1 += position == 1
+            hits_at_3 += position <= 3
+        if not ranked or ranked[0] != expected:
+            misses.append({"question": entry["question"], "expected": expected, "got": ranked[:3]})
+
+    latencies = []
+    for _ in range(repeat):
+        for entry in questions:
+            start = time.perf_counter()
+            timed_fn(entry["question"])
+            latencies.append((time.perf_counter() - start) * 1000.0)
+    latencies.sort()
+
+    total = len(questions) or 1
+    return {
+        "questions": len(questions),
+        "recall_at_1": hits_at_1 / total,
+        "recall_at_3": hits_at_3 / total,
+        "mrr": reciprocal_ranks / total,
+        "latency_ms": {
+            "p50": percentile(latencies, 50),
+            "p95": percentile(latencies, 95),
+            "p99": percentile(latencies, 99),
+            "mean": sum(latencies) / len(latencies) if latencies else 0.0,
+        },
+        "misses": misses,
+    }
+
+
+def semantic_thresholds(questions: List[Dict]) -> Dict:
+    """Measure how semantic cache thresholds separate paraphrases from distinct questions.
+
+    Args:
+        questions: Golden entries with question, subject and topic
+
+    Returns:
+        Similarity ranges of paraphrase and distinct pairs, the paraphrase
+        hit rate and false hit rate per threshold, and the lowest threshold
+        without false hits
+    """
+    import numpy as np
+    from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
+
+    vectors = np.asarray(DefaultEmbeddingFunction()([entry["question"] for entry in questions]), dtype=np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    similarities = vectors @ vectors.T
+    topics = [f"{entry['subject']}_{entry['topic']}" for entry in questions]
+    paraphrases, distinct = [], []
+    for i in range(len(questions)):
+        for j in range(i + 1, len(questions)):
+            (paraphrases if topics[i] == topics[j] else distinct).append(float(similarities[i, j]))
+
+    def summary(values: List[float]) -> Dict:
+        values = sorted(values)
+        return {"pairs": len(values), "min": values[0] if values else 0.0,
+                "p50": percentile(values, 50), "max": values[-1] if values else 0.0}
+
+    table = {}
+    for threshold in SEMANTIC_THRESHOLDS:
+        table[str(threshold)] = {
+            "paraphrase_hit_rate": sum(v >= threshold for v in paraphrases) / (len(paraphrases) or 1),
+            "false_hit_rate": sum(v >= threshold for v in distinct) / (len(distinct) or 1),
+        }
+    safe = [threshold for threshold in SEMANTIC_THRESHOLDS if table[str(threshold)]["false_hit_rate"] == 0.0]
+    return {
+        "paraphrase_similarity": summary(paraphrases),
+        "distinct_similarity": summary(distinct),
+        "thresholds": table,
+        "lowest_safe_threshold": safe[0] if safe else None,
+    }
+
+
+def build_modes(args) -> Dict[str, Dict]:
+    """Create the rank/timed callables for every requested mode."""
+    index = load_index(args.kb, args.index)
+    knowledge_service = KnowledgeService.from_index(index)
+    subject = args.subject
+    modes: Dict[str, Dict] = {}
+
+    def keyword_rank(question: str) -> List[str]:
+        ranked = knowledge_service.rank_topics(question, subject, limit=RANK_DEPTH)
+        return [f"{index.topics[topic_id][0]}_{index.topics[topic_id][1]}" for topic_id, _, _ in ranked]
+
+    if "keyword" in args.modes:
+        modes["keyword"] = {
+            "rank": keyword_rank,
+            "timed": lambda question: knowledge_service.find_answer(question, subject),
+        }
+
+    if "embedding" in args.modes or "hybrid" in args.modes:
+        try:
+            from embedding_service import EmbeddingService
+            embedding_service = EmbeddingService(persist_directory=args.persist_dir, backend=args.backend)
+            embedding_service.populate_from_knowledge_base(args.kb)
+        except Exception as e:
+            print(f"Skipping vector modes, embedding service unavailable: {e}", file=sys.stderr)
+            return modes
+
+        if "embedding" in args.modes:
+            modes["embedding"] = {
+                "rank": lambda question: [r["id"] for r in embedding_service.search(question, n_results=RANK_DEPTH)],
+            }
+
+        if "hybrid" in args.modes:
+            retriever = HybridRetriever(
+                knowledge_service,
+                vector_search=lambda question, n_results, _: embedding_service.search(question, n_results=n_results),
+                budget_ms=args.budget_ms,
+                depth=RANK_DEPTH,
+            )
+            modes["hybrid"] = {
+                "rank": lambda question: [doc_id for doc_id, _, _, _ in retriever.rank(question, subject)],
+            }
+
+    return modes
+
+
+def git_commit() -> str:
+    """Return the current commit hash, or "" outside a git checkout."""
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def compare(current: Dict, baseline: Dict):
+    """Print metric deltas between two benchmark reports."""
+    print(f"Comparing against {baseline.get('commit', '')[:12] or 'baseline'}")
+    for mode, metrics in current["modes"].items():
+        base = baseline.get("modes", {}).get(mode)
+        if not base:
+            print(f"  {mode}: no baseline")
+            continue
+        parts = []
+        for key in ("recall_at_1", "recall_at_3", "mrr"):
+            parts.append(f"{key} {metrics[key]:.3f} ({metrics[key] - base[key]:+.3f})")
+        for key in ("p50", "p95", "p99"):
+            value, before = metrics["latency_ms"][key], base["latency_ms"][key]
+            parts.append(f"{key} {value:.2f}ms ({value - before:+.2f})")
+        print(f"  {mode}: " + ", ".join(parts))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark retrieval quality and latency.")
+    parser.add_argument("--golden", type=Path, default=DEFAULT_GOLDEN, help="Golden set JSON file")
+    parser.add_argument("--modes", default="keyword,embedding,hybrid", help="Comma-separated modes to run")
+    parser.add_argument("--subject", default="python_programming", help="Subject key questions are asked under")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed passes over the golden set")
+    parser.add_argument("--kb", default=str(ROOT / "knowledge_base.json"), help="Knowledge base JSON file")
+    parser.add_argument("--index", default=str(ROOT / "knowledge_index.bin"), help="Compiled knowledge index")
+    parser.add_argument("--persist-dir", default=str(ROOT / "chroma_db"), help="Vector store directory")
+    parser.add_argument("--backend", default=None, help="Vector backend (numpy or chroma; defaults to Settings)")
+    parser.add_argument("--budget-ms", type=float, default=10_000, help="Vector tier budget for hybrid mode")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here instead of stdout")
+    parser.add_argument("--compare", type=Path, help="Baseline report to print deltas against")
+    parser.add_argument("--semantic-cache", action="store_true",
+                        help="Also measure semantic query cache thresholds on the golden set")
+    args = parser.parse_args()
+    args.modes = {mode.strip() for mode in args.modes.split(",") if mode.strip()}
+
+    golden = load_golden(args.golden)
+    modes = build_modes(args)
+
+    report = {
+        "golden_version": golden.get("version"),
+        "golden_sha256": golden["sha256"],
+        "kb_sha256": load_index(args.kb, args.index).content_hash,
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "repeat": args.repeat,
+        "modes": {},
+    }
+    for name, mode in modes.items():
+        mode["rank"](golden["questions"][0]["question"])
+        report["modes"][name] = evaluate(mode["rank"], golden["questions"], args.repeat, mode.get("timed"))
+    if args.semantic_cache:
+        try:
+            report["semantic_cache"] = semantic_thresholds(golden["questions"])
+        except Exception as e:
+            print(f"Skipping semantic cache thresholds, embedding model unavailable: {e}", file=sys.stderr)
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        args.output.write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+
+    if args.compare:
+        compare(report, json.loads(args.compare.read_text(encoding="utf-8")))
+
+
+if __name__ == "__main__":
+    main()
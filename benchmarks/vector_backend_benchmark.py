@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Vector backend latency and recall benchmark for JNTU EduAssist.
+
+Loads the same synthetic, clustered embedding corpus into every backend and
+reports build time, query latency percentiles (unfiltered and with a subject
+filter) and recall@k against exact brute-force neighbours, as JSON:
+
+    python benchmarks/vector_backend_benchmark.py --docs 5000 --dim 384
+    python benchmarks/vector_backend_benchmark.py --backends numpy --output numpy.json
+    python benchmarks/vector_backend_benchmark.py --backends chroma,chroma:single --subjects 200
+
+``chroma`` uses per-subject partitions (``Settings.VECTOR_SUBJECT_PARTITIONS``);
+``chroma:single`` is one collection queried with a metadata filter.
+
+Synthetic vectors keep the comparison independent of the embedding model, so
+it runs offline and measures only the vector store.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from eduassist.services.vector_backends import create_backend
+from retrieval_benchmark import git_commit, percentile
+
+
+def make_corpus(n_docs: int, dim: int, n_subjects: int, n_queries: int, seed: int) -> Dict:
+    """Generate clustered unit vectors, subject labels and perturbed queries."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(max(n_docs // 50, 1), dim)).astype(np.float32)
+    assignment = rng.integers(0, len(centers), size=n_docs)
+    vectors = centers[assignment] + 0.5 * rng.normal(size=(n_docs, dim)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    queries = vectors[rng.integers(0, n_docs, size=n_queries)] + 0.3 * rng.normal(size=(n_queries, dim)).astype(np.float32)
+    queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+    subjects = [f"subject_{i % n_subjects}" for i in range(n_docs)]
+    return {"vectors": vectors, "queries": queries.astype(np.float32), "subjects": subjects}
+
+
+def exact_neighbours(corpus: Dict, k: int, subject: str = "") -> List[List[str]]:
+    """Brute-force top-k ids per query, optionally within one subject."""
+    rows = np.arange(len(corpus["subjects"]))
+    if subject:
+        rows = np.asarray([i for i, s in enumerate(corpus["subjects"]) if s == subject])
+    similarities = corpus["queries"] @ corpus["vectors"][rows].T
+    top = np.argsort(-similarities, axis=1, kind="stable")[:, :k]
+    return [[f"doc_{rows[i]}" for i in row] for row in top]
+
+
+def run_backend(spec: str, corpus: Dict, k: int, repeat: int, batch_size: int) -> Dict:
+    """Build one backend ("name" or "name:single") from the corpus and measure it."""
+    name, _, variant = spec.partition(":")
+    with tempfile.TemporaryDirectory() as persist_dir:
+        backend = create_backend(name, persist_dir, None, partitioned=False if variant == "single" else None)
+        n_docs = len(corpus["subjects"])
+
+        start = time.perf_counter()
+        for offset in range(0, n_docs, batch_size):
+            stop = min(offset + batch_size, n_docs)
+            backend.upsert(
+                [f"doc_{i}" for i in range(offset, stop)],
+                corpus["vectors"][offset:stop],
+                [f"document {i}" for i in range(offset, stop)],
+                [{"subject": corpus["subjects"][i]} for i in range(offset, stop)]
+            )
+        backend.flush()
+        build_seconds = time.perf_counter() - start
+
+        report = {"backend": backend.name, "build_seconds": build_seconds, "docs": backend.count()}
+        for label, subject in (("unfiltered", ""), ("subject_filtered", corpus["subjects"][0])):
+            expected = exact_neighbours(corpus, k, subject)
+            hits = 0
+            latencies = []
+            for _ in range(repeat):
+                for query_row, query in enumerate(corpus["queries"]):
+                    started = time.perf_counter()
+                    results = backend.query([query], k, subject or None)[0]
+                    latencies.append((time.perf_counter() - started) * 1000.0)
+                    if _ == 0:
+                        hits += len({r["id"] for r in results} & set(expected[query_row]))
+            latencies.sort()
+            report[label] = {
+                "recall_at_k": hits / (k * len(corpus["queries"])),
+                "latency_ms": {
+                    "p50": percentile(latencies, 50),
+                    "p95": percentile(latencies, 95),
+                    "p99": percentile(latencies, 99),
+                    "mean": sum(latencies) / len(latencies),
+                },
+            }
+        return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare vector backends on latency and recall.")
+    parser.add_argument("--backends", default="numpy,chroma,chroma:single", help="Comma-separated backends to run")
+    parser.add_argument("--docs", type=int, default=5000, help="Number of documents")
+    parser.add_argument("--dim", type=int, default=384, help="Embedding dimension")
+    parser.add_argument("--subjects", type=int, default=10, help="Number of subjects")
+    parser.add_argument("--queries", type=int, default=200, help="Number of queries")
+    parser.add_argument("--k", type=int, default=5, help="Results per query")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed passes over the queries")
+    parser.add_argument("--batch-size", type=int, default=500, help="Documents per upsert")
+    parser.add_argument("--seed", type=int, default=0, help="Corpus random seed")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.docs, args.dim, args.subjects, args.queries, args.seed)
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "corpus": {"docs": args.docs, "dim": args.dim, "subjects": args.subjects,
+                   "queries": args.queries, "k": args.k, "seed": args.seed},
+        "backends": {},
+    }
+    for name in [b.strip() for b in args.backends.split(",") if b.strip()]:
+        try:
+            report["backends"][name] = run_backend(name, corpus, args.k, args.repeat, args.batch_size)
+        except ImportError as e:
+            print(f"Skipping {name} backend: {e}", file=sys.stderr)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
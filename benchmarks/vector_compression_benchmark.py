@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Memory/recall report for compressed NumPy vector indexes.
+
+Builds the full-precision NumPy index and int8 indexes (with and without PCA)
+over the same synthetic corpus as ``vector_backend_benchmark.py`` and reports,
+per configuration, the memory held for search, the memory saved, query
+latency and recall@k against the full-precision results, as JSON:
+
+    python benchmarks/vector_compression_benchmark.py --docs 20000 --pca-dims 256,128,64
+    python benchmarks/vector_compression_benchmark.py --rerank-factors 1,4,16 --output compression.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from eduassist.services.vector_backends import NumpyFlatBackend
+from retrieval_benchmark import git_commit, percentile
+from vector_backend_benchmark import make_corpus
+
+
+def build(corpus: Dict, persist_dir: str, batch_size: int, **options) -> NumpyFlatBackend:
+    """Load the corpus into a NumPy backend and flush it to ``persist_dir``."""
+    backend = NumpyFlatBackend(persist_dir, **options)
+    n_docs = len(corpus["subjects"])
+    for offset in range(0, n_docs, batch_size):
+        stop = min(offset + batch_size, n_docs)
+        backend.upsert(
+            [f"doc_{i}" for i in range(offset, stop)],
+            corpus["vectors"][offset:stop],
+            [""] * (stop - offset),
+            [{"subject": corpus["subjects"][i]} for i in range(offset, stop)]
+        )
+    backend.flush()
+    return backend
+
+
+def measure(backend: NumpyFlatBackend, corpus: Dict, k: int, repeat: int,
+            expected: Optional[List[List[str]]] = None) -> Tuple[Dict, List[List[str]]]:
+    """Time single-query search and compare the results with ``expected``."""
+    backend.query([corpus["queries"][0]], k)
+    results, latencies = [], []
+    for attempt in range(repeat):
+        for query in corpus["queries"]:
+            started = time.perf_counter()
+            ids = [r["id"] for r in backend.query([query], k)[0]]
+            latencies.append((time.perf_counter() - started) * 1000.0)
+            if attempt == 0:
+                results.append(ids)
+    latencies.sort()
+    report = {
+        "memory_bytes": sum(backend.memory_usage().values()),
+        "latency_ms": {"p50": percentile(latencies, 50), "p95": percentile(latencies, 95)},
+    }
+    if expected is not None:
+        hits = sum(len(set(got) & set(want)) for got, want in zip(results, expected))
+        report["recall_at_k"] = hits / (k * len(expected))
+    return report, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report memory saved and recall lost by vector compression.")
+    parser.add_argument("--docs", type=int, default=20000, help="Number of documents")
+    parser.add_argument("--dim", type=int, default=384, help="Embedding dimension")
+    parser.add_argument("--queries", type=int, default=200, help="Number of queries")
+    parser.add_argument("--k", type=int, default=5, help="Results per query")
+    parser.add_argument("--pca-dims", default="0,192,96", help="Comma-separated PCA dimensions (0 = no PCA)")
+    parser.add_argument("--rerank-factors", default="1,4", help="Comma-separated re-rank factors")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed passes over the queries")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Documents per upsert")
+    parser.add_argument("--seed", type=int, default=0, help="Corpus random seed")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.docs, args.dim, 10, args.queries, args.seed)
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "corpus": {"docs": args.docs, "dim": args.dim, "queries": args.queries, "k": args.k, "seed": args.seed},
+        "configurations": [],
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        baseline_report, expected = measure(build(corpus, f"{tmp}/full", args.batch_size),
+                                            corpus, args.k, args.repeat)
+        baseline_report.update({"compression": "none", "pca_dim": 0, "recall_at_k": 1.0})
+        report["configurations"].append(baseline_report)
+
+        for pca_dim in [int(d) for d in args.pca_dims.split(",") if d.strip()]:
+            for factor in [int(f) for f in args.rerank_factors.split(",") if f.strip()]:
+                backend = build(corpus, f"{tmp}/int8_{pca_dim}_{factor}", args.batch_size,
+                                compression="int8", pca_dim=pca_dim, rerank_factor=factor)
+                entry, _ = measure(backend, corpus, args.k, args.repeat, expected)
+                entry.update({
+                    "compression": "int8",
+                    "pca_dim": pca_dim,
+                    "rerank_factor": factor,
+                    "memory_saved": 1.0 - entry["memory_bytes"] / baseline_report["memory_bytes"],
+                    "recall_lost": 1.0 - entry["recall_at_k"],
+                })
+                report["configurations"].append(entry)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -16,6 +16,56 @@ class Settings:
     JNTUH_API_URL = "https://jntuhresults.dhethi.com/api/getAcademicResult"
     API_TIMEOUT = 30
     
+    DB_POOL_MIN_CONNECTIONS = 1
+    DB_POOL_MAX_CONNECTIONS = 10
+    
+    HYBRID_VECTOR_BUDGET_MS = 300
+    HYBRID_SIMILARITY_THRESHOLD = 0.5
+    HYBRID_MAX_WORKERS = 4
+    
+    KB_SHARD_CACHE_SIZE = 32
+    KB_SELECTION_CACHE_SIZE = 16
+    KB_COMPILED_INDEX_LIMIT = 64
+    
+    ANSWER_CACHE_SIZE = 2048
+    ANSWER_CACHE_TTL_SECONDS = 3600
+    ANSWER_CACHE_DEGRADED_TTL_SECONDS = 30
+    
+    SEMANTIC_CACHE_SIZE = 256
+    # all-MiniLM-L6-v2 scores paraphrases of one question at about 0.85-0.92, so
+    # 0.95 almost never hit. Re-measure on the golden set after changing the model:
+    # python benchmarks/retrieval_benchmark.py --modes keyword --semantic-cache
+    SEMANTIC_CACHE_THRESHOLD = 0.88
+    
+    VECTOR_BACKEND = "numpy"
+    VECTOR_COMPRESSION = "none"
+    VECTOR_PCA_DIM = 0
+    VECTOR_RERANK_FACTOR = 4
+    VECTOR_SUBJECT_PARTITIONS = True
+    VECTOR_GLOBAL_PARTITION = True
+    VECTOR_HNSW_M = 16
+    VECTOR_HNSW_EF_CONSTRUCTION = 100
+    VECTOR_HNSW_EF_SEARCH = 100
+    
+    EMBEDDING_BATCH_SIZE = 128
+    EMBEDDING_WORKERS = 4
+    EMBEDDING_CACHE_DIR = "embedding_cache"
+    EMBEDDING_CACHE_DTYPE = "float16"
+    
+    TRANSLATION_BACKEND = "google"
+    TRANSLATION_TIMEOUT_SECONDS = 5.0
+    TRANSLATION_BREAKER_THRESHOLD = 5
+    TRANSLATION_BREAKER_RESET_SECONDS = 30.0
+    TRANSLATION_BATCH_CHARS = 4500
+    TRANSLATION_DB_PATH = "translation_cache.db"
+    TRANSLATION_MEMORY_CACHE_SIZE = 4096
+    TRANSLATION_STORE_MAX_ENTRIES = 200000
+    TRANSLATION_STALE_SECONDS = 30 * 24 * 3600
+    TRANSLATION_TOUCH_FLUSH_SECONDS = 60.0
+    TRANSLATION_CATALOG_DIR = "translation_catalogs"
+    TRANSLATION_WORKERS = 4
+    TRANSLATION_RENDER_DEADLINE_SECONDS = 1.0
+    
     SUPPORTED_LANGUAGES = [
         ("english", "English", True),
         ("telugu", "Telugu", False),
@@ -3,19 +3,27 @@
 from .repositories import (
     load_courses,
     load_knowledge_base,
+    load_knowledge_shards,
+    knowledge_base_version,
+    load_subject_index,
     get_degree_options,
     get_branch_options,
     get_year_options,
     get_semester_options,
-    get_subjects
+    get_subjects,
+    get_subject_keys
 )
 
 __all__ = [
     "load_courses",
     "load_knowledge_base",
+    "load_knowledge_shards",
+    "knowledge_base_version",
+    "load_subject_index",
     "get_degree_options",
     "get_branch_options",
     "get_year_options",
     "get_semester_options",
-    "get_subjects"
+    "get_subjects",
+    "get_subject_keys"
 ]
@@ -1,24 +1,66 @@
 import os
 import psycopg2
+from psycopg2 import pool
 from psycopg2.extras import RealDictCursor
 from contextlib import contextmanager
 
+from ..config.settings import Settings
+from ..utils.registry import get_registry
+
 DATABASE_URL = os.environ.get("DATABASE_URL")
 
 def get_connection():
     return psycopg2.connect(DATABASE_URL, cursor_factory=RealDictCursor)
 
+def _create_pool():
+    return pool.ThreadedConnectionPool(
+        Settings.DB_POOL_MIN_CONNECTIONS, Settings.DB_POOL_MAX_CONNECTIONS,
+        DATABASE_URL, cursor_factory=RealDictCursor
+    )
+
+get_registry().register("db_pool", _create_pool, lambda db_pool: db_pool.closeall())
+
+def _is_alive(conn):
+    """Ping a pooled connection; the server may have dropped it while idle."""
+    if conn.closed:
+        return False
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        conn.rollback()
+        return True
+    except psycopg2.Error:
+        return False
+
+def _checkout(db_pool):
+    """Take a live connection from the pool, discarding dead ones."""
+    for _ in range(Settings.DB_POOL_MAX_CONNECTIONS):
+        conn = db_pool.getconn()
+        if _is_alive(conn):
+            return conn
+        db_pool.putconn(conn, close=True)
+    return db_pool.getconn()
+
 @contextmanager
 def get_db():
-    conn = get_connection()
+    db_pool = get_registry().get("db_pool")
+    try:
+        conn = _checkout(db_pool)
+    except pool.PoolError:
+        # Pool exhausted: fall back to a one-off connection
+        db_pool, conn = None, get_connection()
     try:
         yield conn
         conn.commit()
     except Exception as e:
-        conn.rollback()
+        if not conn.closed:
+            conn.rollback()
         raise e
     finally:
-        conn.close()
+        if db_pool is None:
+            conn.close()
+        else:
+            db_pool.putconn(conn, close=bool(conn.closed))
 
 def init_database():
     with get_db() as conn:
@@ -1,9 +1,14 @@
 """Data repositories for loading and accessing course data."""
 
 import json
+import os
 import streamlit as st
-from typing import Dict
+from typing import Dict, Tuple
 from pathlib import Path
+from ..config.settings import Settings
+from ..services.knowledge_index import KnowledgeIndex
+from ..services.knowledge_service import KnowledgeService
+from ..services.knowledge_shards import ShardedKnowledgeBase
 
 
 @st.cache_data
@@ -32,6 +37,36 @@ def load_knowledge_base(file_path: str = "knowledge_base.json") -> Dict:
         return {}
 
 
+def knowledge_base_version(file_path: str = "knowledge_base.json") -> str:
+    """Return a cheap version stamp of the knowledge base file (mtime and size), or "" if it is missing."""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return ""
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+@st.cache_resource(max_entries=2)
+def load_knowledge_shards(file_path: str = "knowledge_base.json", shard_dir: str = "knowledge_shards",
+                          kb_version: str = "") -> ShardedKnowledgeBase:
+    """Open the per-subject knowledge base shards, re-splitting them if the JSON changed.
+
+    ``kb_version`` only keys the cache, so passing ``knowledge_base_version()``
+    reopens the shards in-process when the file is edited.
+    """
+    return ShardedKnowledgeBase.open(file_path, shard_dir)
+
+
+@st.cache_resource(max_entries=Settings.KB_SELECTION_CACHE_SIZE)
+def load_subject_index(subject_keys: Tuple[str, ...], kb_version: str = "") -> KnowledgeIndex:
+    """Memory-map the compiled knowledge index over only the given subjects' shards.
+
+    ``kb_version`` keys the cache (see ``load_knowledge_shards``), so an edited
+    knowledge base yields a new index, and a new content hash, without a restart.
+    """
+    return load_knowledge_shards(kb_version=kb_version).load(subject_keys)
+
+
 def get_degree_options(courses: Dict) -> Dict[str, str]:
     """Get available degree options from courses data."""
     degree_data = courses.get("courses", {})
@@ -97,3 +132,11 @@ def get_subjects(courses: Dict, degree: str, branch: str, year: str, semester: s
         .get(semester, {})
         .get("subjects", {})
     )
+
+
+def get_subject_keys(subjects: Dict) -> Tuple[str, ...]:
+    """Get the knowledge base subject keys needed to answer questions on the given subjects."""
+    keys = ["general", "python_programming"]
+    for subject_data in subjects.values():
+        keys.append(KnowledgeService.get_subject_key(subject_data.get("name", "")))
+    return tuple(sorted(set(keys)))
@@ -2,11 +2,14 @@
 
 import streamlit as st
 from typing import Dict
+from ..services.answer_cache import get_answer_cache
+from ..services.hybrid_retriever import HybridRetriever
+from ..services.knowledge_index import KnowledgeIndex
 from ..services.knowledge_service import KnowledgeService
 
 
 def render_assistant_tab(
-    knowledge_base: Dict,
+    knowledge_index: KnowledgeIndex,
     subjects: Dict
 ):
     """Render the Q&A assistant tab."""
@@ -65,11 +68,12 @@ def render_assistant_tab(
                     if derived_key:
                         subject_key = derived_key
                 
-                knowledge_service = KnowledgeService(knowledge_base)
-                answer, match_type = knowledge_service.find_answer(prompt, subject_key)
-                
-                if not answer and subject_key != "python_programming":
-                    answer, match_type = knowledge_service.find_answer(prompt, "python_programming")
+                knowledge_service = KnowledgeService.from_index(knowledge_index)
+                retriever = HybridRetriever(knowledge_service)
+                answer, match_type, _ = get_answer_cache().get_or_compute(
+                    prompt, subject_key, "python_programming", knowledge_index.content_hash,
+                    lambda: retriever.retrieve_with_status(prompt, subject_key, fallback_subject_key="python_programming")
+                )
                 
                 links = {}
                 if current_subject_data:
@@ -82,7 +86,7 @@ def render_assistant_tab(
                 if answer:
                     st.markdown(answer)
                     
-                    if links and match_type == "subject":
+                    if links and match_type in ("subject", "fuzzy", "fulltext", "semantic"):
                         st.markdown("**📚 Study Materials:**")
                         link_cols = st.columns(3)
                         for i, (label, url) in enumerate(links.items()):
@@ -92,7 +96,7 @@ def render_assistant_tab(
                     st.session_state.messages.append({
                         "role": "assistant",
                         "content": answer,
-                        "links": links if match_type == "subject" else {}
+                        "links": links if match_type in ("subject", "fuzzy", "fulltext", "semantic") else {}
                     })
                 else:
                     no_match_response = """I couldn't find a specific answer for your question. Here are some suggestions:
@@ -108,6 +112,11 @@ def render_assistant_tab(
 
 Feel free to ask about any topic!"""
                     
+                    suggestions = knowledge_service.suggest_keywords(prompt)
+                    if suggestions:
+                        did_you_mean = ", ".join(f'"{keyword}"' for keyword in suggestions)
+                        no_match_response = f"Did you mean {did_you_mean}?\n\n{no_match_response}"
+                    
                     st.markdown(no_match_response)
                     st.session_state.messages.append({
                         "role": "assistant",
@@ -7,7 +7,7 @@ from eduassist.services.forum_service import (
     delete_post, delete_comment,
     CATEGORIES, get_total_posts
 )
-from eduassist.services.translation_service import translate_text
+from eduassist.services.translation_service import translate_text, translate_many
 
 def render_forum_page():
     lang = st.session_state.get('selected_language', 'english')
@@ -26,7 +26,7 @@ def render_forum_page():
     col1, col2, col3 = st.columns([2, 1, 1])
     
     with col1:
-        translated_categories = [translate_text(cat, lang) for cat in CATEGORIES]
+        translated_categories = translate_many(CATEGORIES, lang)
         all_text = translate_text("All", lang)
         selected_idx = st.selectbox(
             translate_text("Filter by Category", lang), 
@@ -87,6 +87,7 @@ def render_posts_list(category, user, lang):
         st.info(translate_text("No posts yet. Be the first to start a discussion!", lang))
         return
     
+    translate_many([post['category'] for post in posts] + [post['user_role'].title() for post in posts], lang)
     for post in posts:
         render_post_card(post, user, lang)
     
@@ -187,6 +188,7 @@ def render_post_detail(post_id, user, lang):
     st.markdown(f"### {translate_text('Comments', lang)}")
     
     comments = get_comments(post_id)
+    translate_many([comment['user_role'].title() for comment in comments], lang)
     
     if user:
         with st.form(f"comment_form_{post_id}"):
@@ -1,8 +1,10 @@
 """Practice questions page."""
 
+import secrets
 import streamlit as st
 from typing import Dict
 from ..services.knowledge_service import KnowledgeService
+from ..services.practice_bank import DIFFICULTIES
 
 
 def render_practice_tab(subjects: Dict):
@@ -11,6 +13,10 @@ def render_practice_tab(subjects: Dict):
     
     if "show_practice" not in st.session_state:
         st.session_state.show_practice = False
+    if "practice_seed" not in st.session_state:
+        st.session_state.practice_seed = secrets.token_hex(8)
+        st.session_state.practice_round = 0
+        st.session_state.practice_questions = []
     
     if subjects and isinstance(subjects, dict) and len(subjects) > 0:
         subject_names = {key: data.get('name', key) for key, data in subjects.items()}
@@ -31,11 +37,26 @@ def render_practice_tab(subjects: Dict):
             key="practice_topic"
         )
         
+        selected_difficulty = st.selectbox(
+            "Select Difficulty",
+            options=['any'] + list(DIFFICULTIES),
+            format_func=lambda x: x.title(),
+            key="practice_difficulty"
+        )
+        
         if st.button("🎯 Generate Practice Questions", key="generate_practice"):
+            st.session_state.practice_questions = KnowledgeService.generate_practice_questions(
+                selected_subject,
+                selected_topic,
+                difficulty=None if selected_difficulty == 'any' else selected_difficulty,
+                seed=st.session_state.practice_seed,
+                round_number=st.session_state.practice_round
+            )
+            st.session_state.practice_round += 1
             st.session_state.show_practice = True
         
         if st.session_state.show_practice:
-            questions = KnowledgeService.generate_practice_questions(selected_subject, selected_topic)
+            questions = st.session_state.practice_questions
             st.markdown("#### 📋 Practice Questions:")
             for i, q in enumerate(questions, 1):
                 st.markdown(f"""
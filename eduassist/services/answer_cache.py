@@ -0,0 +1,135 @@
+"""Process-wide LRU/TTL cache of assistant answers."""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+from ..config.settings import Settings
+from ..utils.registry import get_registry
+
+_WHITESPACE = re.compile(r"\s+")
+_TRAILING_PUNCTUATION = re.compile(r"[\s?!.]+$")
+
+Answer = Tuple[str, str, float]
+
+
+def normalize_question(question: str) -> str:
+    """Lowercase a question and collapse whitespace and trailing punctuation."""
+    return _TRAILING_PUNCTUATION.sub("", _WHITESPACE.sub(" ", question.strip().lower()))
+
+
+class AnswerCache:
+    """Bounded LRU cache whose entries also expire after a time-to-live.
+
+    Keys include the knowledge base version (the index content hash), so an
+    edited knowledge base never serves answers computed from the old one;
+    the old entries simply stop being hit and age out.
+
+    Degraded answers (keyword-only because the vector tier was unavailable,
+    and "not_found" results) only live for ``degraded_ttl_seconds``, so the
+    answers cached right after a deploy are replaced once the embedding
+    service is warm.
+    """
+
+    def __init__(self, max_entries: int = Settings.ANSWER_CACHE_SIZE,
+                 ttl_seconds: float = Settings.ANSWER_CACHE_TTL_SECONDS,
+                 degraded_ttl_seconds: float = Settings.ANSWER_CACHE_DEGRADED_TTL_SECONDS,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.degraded_ttl_seconds = degraded_ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Answer]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def make_key(question: str, subject_key: str, fallback_subject_key: Optional[str],
+                 kb_version: str) -> Tuple[str, str, str, str]:
+        """Build the cache key for a question asked under a subject and knowledge base version."""
+        return normalize_question(question), subject_key, fallback_subject_key or "", kb_version
+
+    def get(self, key: Hashable) -> Optional[Answer]:
+        """Return a cached answer and mark it recently used, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._clock() > entry[0]:
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, answer: Answer, ttl_seconds: Optional[float] = None):
+        """Store an answer, evicting the least recently used entries beyond capacity.
+
+        Args:
+            key: Key from ``make_key``
+            answer: (answer, match_type, score)
+            ttl_seconds: Lifetime of this entry; defaults to the cache's ``ttl_seconds``
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, answer)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, question: str, subject_key: str, fallback_subject_key: Optional[str],
+                       kb_version: str, compute: Callable[[], Tuple[Answer, bool]]) -> Answer:
+        """
+        Return the cached answer for a question, computing and caching it on a miss.
+
+        Args:
+            question: The user's question
+            subject_key: The subject it was asked under
+            fallback_subject_key: Fallback subject used by retrieval
+            kb_version: Content hash of the knowledge index used for retrieval
+            compute: Runs retrieval and returns ((answer, match_type, score), complete),
+                where complete is False if a retrieval tier was unavailable
+
+        Returns:
+            Tuple of (answer, match_type, score)
+        """
+        key = self.make_key(question, subject_key, fallback_subject_key, kb_version)
+        answer = self.get(key)
+        if answer is None:
+            answer, complete = compute()
+            degraded = not complete or answer[1] == "not_found"
+            self.put(key, answer, self.degraded_ttl_seconds if degraded else None)
+        return answer
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """Return entry count, hit/miss/eviction/expiration counters and the hit rate."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+get_registry().register("answer_cache", AnswerCache)
+
+
+def get_answer_cache() -> AnswerCache:
+    """Get or create the process-wide answer cache."""
+    return get_registry().get("answer_cache")
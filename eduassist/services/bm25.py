@@ -0,0 +1,189 @@
+"""BM25 full-text ranking over knowledge base topics."""
+
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "can", "do", "does", "for",
+    "from", "how", "i", "in", "is", "it", "me", "of", "on", "or", "please",
+    "tell", "that", "the", "this", "to", "what", "when", "where", "which",
+    "why", "with", "you", "your", "explain", "about",
+})
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase ``text`` and split it into indexable terms."""
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+
+class BM25Ranker:
+    """Okapi BM25 ranker backed by a precomputed term-major sparse matrix.
+
+    Each term owns a contiguous slice of ``doc_ids``/``weights`` (CSR layout,
+    doc ids ascending) holding its fully weighted BM25 contribution per
+    document, so scoring a query is a gather plus one ``np.bincount`` over the
+    postings of its terms - no per-document Python loop.
+    """
+
+    ARRAY_NAMES = ("term_ptr", "doc_ids", "weights")
+
+    def __init__(self, vocabulary: Sequence[str], term_ptr: np.ndarray,
+                 doc_ids: np.ndarray, weights: np.ndarray, n_docs: int):
+        self.vocabulary = list(vocabulary)
+        self._term_ids = {term: term_id for term_id, term in enumerate(self.vocabulary)}
+        self.term_ptr = term_ptr
+        self.doc_ids = doc_ids
+        self.weights = weights
+        self.n_docs = n_docs
+
+    @classmethod
+    def build(cls, documents: Sequence[str], k1: float = 1.2, b: float = 0.75) -> "BM25Ranker":
+        """Tokenize ``documents`` and precompute their BM25 term weights.
+
+        Args:
+            documents: One text per document; list position is the doc id
+            k1: Term frequency saturation
+            b: Document length normalization
+
+        Returns:
+            BM25Ranker over the documents
+        """
+        term_ids: Dict[str, int] = {}
+        rows: List[int] = []
+        cols: List[int] = []
+        freqs: List[int] = []
+        lengths = np.zeros(len(documents), dtype=np.float32)
+
+        for doc_id, text in enumerate(documents):
+            tokens = tokenize(text)
+            lengths[doc_id] = len(tokens)
+            counts: Dict[int, int] = {}
+            for token in tokens:
+                term_id = term_ids.setdefault(token, len(term_ids))
+                counts[term_id] = counts.get(term_id, 0) + 1
+            for term_id, count in counts.items():
+                rows.append(term_id)
+                cols.append(doc_id)
+                freqs.append(count)
+
+        vocabulary = list(term_ids)
+        term_array = np.asarray(rows, dtype=np.int32)
+        doc_array = np.asarray(cols, dtype=np.int32)
+        tf = np.asarray(freqs, dtype=np.float32)
+
+        order = np.argsort(term_array, kind="stable")
+        term_array, doc_array, tf = term_array[order], doc_array[order], tf[order]
+        doc_freq = np.bincount(term_array, minlength=len(vocabulary))
+        term_ptr = np.zeros(len(vocabulary) + 1, dtype=np.int64)
+        term_ptr[1:] = np.cumsum(doc_freq)
+        df = doc_freq.astype(np.float32)
+
+        n_docs = len(documents)
+        avg_length = float(lengths.mean()) if n_docs else 0.0
+        if avg_length <= 0.0:
+            avg_length = 1.0
+        idf = np.log1p((n_docs - df + 0.5) / (df + 0.5))
+        norm = k1 * (1.0 - b + b * lengths[doc_array] / avg_length)
+        weights = (idf[term_array] * tf * (k1 + 1.0) / (tf + norm)).astype(np.float32)
+
+        return cls(vocabulary, term_ptr, doc_array, weights, n_docs)
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Return the sparse matrix as named arrays for persisting."""
+        return {name: getattr(self, name) for name in self.ARRAY_NAMES}
+
+    def scores(self, query: str, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """Score documents ``start <= doc_id < stop`` against ``query``.
+
+        Args:
+            query: Free-text query
+            start: First doc id to score
+            stop: One past the last doc id to score (defaults to all)
+
+        Returns:
+            Float32 array of BM25 scores, indexed by ``doc_id - start``
+        """
+        stop = self.n_docs if stop is None else stop
+        term_ids = {self._term_ids[token] for token in tokenize(query) if token in self._term_ids}
+        if not term_ids or stop <= start:
+            return np.zeros(max(stop - start, 0), dtype=np.float32)
+
+        doc_slices = []
+        weight_slices = []
+        for term_id in term_ids:
+            lo, hi = int(self.term_ptr[term_id]), int(self.term_ptr[term_id + 1])
+            if start or stop < self.n_docs:
+                postings = self.doc_ids[lo:hi]
+                lo, hi = lo + int(np.searchsorted(postings, start)), lo + int(np.searchsorted(postings, stop))
+            doc_slices.append(self.doc_ids[lo:hi])
+            weight_slices.append(self.weights[lo:hi])
+
+        docs = np.concatenate(doc_slices)
+        return np.bincount(docs - start, weights=np.concatenate(weight_slices),
+                           minlength=stop - start).astype(np.float32)
+
+    def scores_many(self, queries: Sequence[str], start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """Score a batch of queries against documents ``start <= doc_id < stop``.
+
+        All postings of the batch are gathered once and accumulated with a
+        single ``np.bincount`` into a (len(queries), stop - start) matrix.
+
+        Args:
+            queries: Free-text queries
+            start: First doc id to score
+            stop: One past the last doc id to score (defaults to all)
+
+        Returns:
+            Float32 matrix of BM25 scores, row per query, column per ``doc_id - start``
+        """
+        stop = self.n_docs if stop is None else stop
+        width = max(stop - start, 0)
+        doc_slices = []
+        weight_slices = []
+        for row, query in enumerate(queries):
+            for term_id in {self._term_ids[token] for token in tokenize(query) if token in self._term_ids}:
+                lo, hi = int(self.term_ptr[term_id]), int(self.term_ptr[term_id + 1])
+                postings = self.doc_ids[lo:hi]
+                lo, hi = lo + int(np.searchsorted(postings, start)), lo + int(np.searchsorted(postings, stop))
+                doc_slices.append(self.doc_ids[lo:hi].astype(np.int64) - start + row * width)
+                weight_slices.append(self.weights[lo:hi])
+
+        if not doc_slices or not width:
+            return np.zeros((len(queries), width), dtype=np.float32)
+        flat = np.bincount(np.concatenate(doc_slices), weights=np.concatenate(weight_slices),
+                           minlength=len(queries) * width)
+        return flat.reshape(len(queries), width).astype(np.float32)
+
+    def top(self, query: str, k: int, start: int = 0, stop: Optional[int] = None) -> List[Tuple[int, float]]:
+        """Return up to ``k`` (doc_id, score) pairs with a positive score, best first.
+
+        Args:
+            query: Free-text query
+            k: Maximum number of documents to return
+            start: First doc id to consider
+            stop: One past the last doc id to consider (defaults to all)
+
+        Returns:
+            List of (doc_id, score) sorted by descending score
+        """
+        doc_scores = self.scores(query, start, stop)
+        if not doc_scores.size or k <= 0:
+            return []
+        if k < doc_scores.size:
+            kth = np.partition(doc_scores, doc_scores.size - k)[doc_scores.size - k]
+            above = np.flatnonzero(doc_scores > kth)
+            ties = np.flatnonzero(doc_scores == kth)[:k - above.size]
+            candidates = np.sort(np.concatenate([above, ties]))
+        else:
+            candidates = np.arange(doc_scores.size)
+        candidates = candidates[np.argsort(-doc_scores[candidates], kind="stable")]
+        return [(start + int(i), float(doc_scores[i])) for i in candidates if doc_scores[i] > 0.0]
+
+    def best(self, query: str, start: int = 0, stop: Optional[int] = None) -> Tuple[int, float]:
+        """Return (doc_id, score) of the top document in range, or (-1, 0.0) if none scores."""
+        results = self.top(query, 1, start, stop)
+        return results[0] if results else (-1, 0.0)
@@ -0,0 +1,219 @@
+"""Persistent, memory-mapped cache of document embeddings.
+
+Vectors are keyed by the embedding model id plus the SHA-256 of the text, so
+unchanged documents are never embedded twice - not after a collection reset,
+not on a new replica that ships the cache directory. Each model gets three
+files under the cache directory:
+
+    <key>.json   model id, dimension and storage dtype
+    <key>.vec    vectors as a flat row-major array (float16 or float32)
+    <key>.idx    32-byte text digests; digest ``i`` belongs to vector row ``i``
+
+    <key>.lock   lock file that serializes writers
+
+Both data files are append-only. Vectors are appended before their digests,
+and before appending, both files are truncated to the rows present in both, so
+a crash mid-write never leaves a digest pointing at a missing or partial
+vector.
+
+Several processes on one host may share the directory, e.g. the app's warm-up
+thread and a manual ``python embedding_service.py`` run. Writers hold an
+exclusive ``flock`` on the lock file while appending and number new rows from
+the vector file's size, not from what their process has seen; readers pick up
+rows other processes appended whenever ``.idx`` grows.
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from ..config.settings import Settings
+
+DIGEST_SIZE = 32
+
+
+def embedding_model_id(embedding_fn) -> str:
+    """Identify an embedding function by its class, name and configuration."""
+    parts = [type(embedding_fn).__name__]
+    for attribute in ("name", "get_config"):
+        method = getattr(embedding_fn, attribute, None)
+        if callable(method):
+            try:
+                parts.append(json.dumps(method(), sort_keys=True, default=str))
+            except Exception:
+                continue
+    return "/".join(parts)
+
+
+class EmbeddingCache:
+    """Append-only on-disk vector store keyed by text hash, read through ``np.memmap``."""
+
+    def __init__(self, cache_dir: str = Settings.EMBEDDING_CACHE_DIR, model_id: str = "",
+                 dtype: str = Settings.EMBEDDING_CACHE_DTYPE):
+        self.cache_dir = cache_dir
+        self.model_id = model_id
+        self.dtype = np.dtype(dtype)
+        key = hashlib.sha256(model_id.encode("utf-8")).hexdigest()[:16]
+        self._meta_path = os.path.join(cache_dir, f"{key}.json")
+        self._vector_path = os.path.join(cache_dir, f"{key}.vec")
+        self._index_path = os.path.join(cache_dir, f"{key}.idx")
+        self._lock_path = os.path.join(cache_dir, f"{key}.lock")
+        self._lock = threading.Lock()
+        self._rows: Dict[bytes, int] = {}
+        self._count = 0
+        self._vectors: Optional[np.ndarray] = None
+        self.dim = 0
+        if self._read_meta():
+            with self._file_lock():
+                self._repair()
+                self._refresh()
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Hold the exclusive cross-process writer lock."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(self._lock_path, "a") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _read_meta(self) -> bool:
+        """Load the dimension from the metadata file; return whether it matches this cache."""
+        try:
+            with open(self._meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return False
+        if meta.get("model_id") != self.model_id or meta.get("dtype") != self.dtype.name:
+            return False
+        self.dim = int(meta["dim"])
+        return True
+
+    def _repair(self) -> int:
+        """Truncate both data files to the rows present in both; return that row count.
+
+        Must hold the file lock, since the tail it cuts may be another writer's
+        append in progress otherwise.
+        """
+        row_bytes = self.dim * self.dtype.itemsize
+        sizes = {path: os.path.getsize(path) if os.path.exists(path) else 0
+                 for path in (self._index_path, self._vector_path)}
+        rows = min(sizes[self._index_path] // DIGEST_SIZE, sizes[self._vector_path] // row_bytes)
+        for path, size in ((self._index_path, rows * DIGEST_SIZE), (self._vector_path, rows * row_bytes)):
+            if sizes[path] != size:
+                with open(path, "r+b") as f:
+                    f.truncate(size)
+        return rows
+
+    def _refresh(self):
+        """Read digests appended to ``.idx`` since the last read, by any process.
+
+        A digest is only appended after its vector is on disk, so every whole
+        digest in the file is safe to serve.
+        """
+        if not self.dim and not self._read_meta():
+            return
+        try:
+            size = os.path.getsize(self._index_path)
+        except FileNotFoundError:
+            return
+        rows = size // DIGEST_SIZE
+        if rows <= self._count:
+            return
+        with open(self._index_path, "rb") as f:
+            f.seek(self._count * DIGEST_SIZE)
+            digests = f.read((rows - self._count) * DIGEST_SIZE)
+        rows = self._count + len(digests) // DIGEST_SIZE
+        for row in range(self._count, rows):
+            offset = (row - self._count) * DIGEST_SIZE
+            self._rows[digests[offset:offset + DIGEST_SIZE]] = row
+        self._count = rows
+
+    @staticmethod
+    def digest(text: str) -> bytes:
+        return hashlib.sha256(text.encode("utf-8")).digest()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _mapped(self, row: int) -> np.ndarray:
+        """Return the memory map, re-mapping it if ``row`` was appended after the last map."""
+        if self._vectors is None or row >= self._vectors.shape[0]:
+            self._vectors = np.memmap(self._vector_path, dtype=self.dtype, mode="r",
+                                      shape=(self._count, self.dim))
+        return self._vectors
+
+    def get_many(self, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """Look up cached vectors for texts.
+
+        Args:
+            texts: Document texts
+
+        Returns:
+            One float32 vector per text, or None where the text is not cached
+        """
+        with self._lock:
+            self._refresh()
+            rows = [self._rows.get(self.digest(text)) for text in texts]
+            found = [row for row in rows if row is not None]
+            if not found:
+                return [None] * len(texts)
+            vectors = self._mapped(max(found))
+            return [None if row is None else np.asarray(vectors[row], dtype=np.float32) for row in rows]
+
+    def put_many(self, texts: Sequence[str], vectors: Sequence) -> int:
+        """Append vectors for texts that are not cached yet.
+
+        Args:
+            texts: Document texts
+            vectors: One embedding per text
+
+        Returns:
+            Number of vectors written
+        """
+        with self._lock, self._file_lock():
+            self._refresh()
+            new_digests: Dict[bytes, None] = {}
+            new_vectors = []
+            for text, vector in zip(texts, vectors):
+                digest = self.digest(text)
+                if digest in self._rows or digest in new_digests:
+                    continue
+                new_digests[digest] = None
+                new_vectors.append(np.asarray(vector, dtype=np.float32).ravel())
+            if not new_digests:
+                return 0
+
+            if not self.dim:
+                self.dim = new_vectors[0].size
+                for path in (self._vector_path, self._index_path):
+                    open(path, "wb").close()
+                with open(self._meta_path, "w", encoding="utf-8") as f:
+                    json.dump({"model_id": self.model_id, "dim": self.dim, "dtype": self.dtype.name}, f)
+            if any(vector.size != self.dim for vector in new_vectors):
+                print(f"Embedding cache dimension mismatch for {self.model_id}; skipping write")
+                return 0
+
+            # Number new rows from the files, which other processes may have grown
+            start = self._repair()
+            if start != self._count:
+                self._rows, self._count, self._vectors = {}, 0, None
+                self._refresh()
+            with open(self._vector_path, "ab") as f:
+                f.write(np.stack(new_vectors).astype(self.dtype).tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+            with open(self._index_path, "ab") as f:
+                f.write(b"".join(new_digests))
+            for i, digest in enumerate(new_digests):
+                self._rows[digest] = start + i
+            self._count = start + len(new_digests)
+            return len(new_digests)
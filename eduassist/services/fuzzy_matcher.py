@@ -0,0 +1,161 @@
+"""Trigram-indexed, typo-tolerant keyword matching."""
+
+import re
+from typing import Dict, FrozenSet, Iterable, List, Sequence, Set, Tuple
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def trigrams(text: str) -> Set[str]:
+    """Return the padded character trigrams of ``text``."""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def bounded_edit_distance(a: str, b: str, max_distance: int) -> int:
+    """Optimal string alignment distance between ``a`` and ``b``, capped at ``max_distance + 1``.
+
+    Only a diagonal band of width ``2 * max_distance + 1`` is filled and the
+    computation stops as soon as every cell of a row exceeds the bound.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    if a == b:
+        return 0
+
+    too_far = max_distance + 1
+    previous_previous: List[int] = []
+    previous = [j if j <= max_distance else too_far for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        current = [too_far] * (len(b) + 1)
+        if i <= max_distance:
+            current[0] = i
+        lo = max(1, i - max_distance)
+        hi = min(len(b), i + max_distance)
+        for j in range(lo, hi + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                value = min(value, previous_previous[j - 2] + 1)
+            current[j] = min(value, too_far)
+        if min(current[lo - 1:hi + 1]) > max_distance:
+            return too_far
+        previous_previous, previous = previous, current
+    return previous[len(b)]
+
+
+class FuzzyKeywordMatcher:
+    """Find keywords a question contains with small spelling mistakes.
+
+    Keywords are indexed by their character trigrams. For each word (or run
+    of words, for multi-word keywords) of a question, candidates sharing
+    enough trigrams are collected from the posting lists and only those are
+    verified with a bounded edit distance - there is no scan over every
+    keyword per query. Terms made only of ``known_words`` (words that occur
+    in the knowledge base) are taken as correctly spelled and skipped.
+    """
+
+    def __init__(self, keywords: Sequence[str], known_words: Iterable[str] = ()):
+        self.keywords = list(keywords)
+        self.known_words = frozenset(known_words)
+        self._postings: Dict[str, List[int]] = {}
+        self._grams: List[FrozenSet[str]] = []
+        self.max_words = 1
+        for keyword_id, keyword in enumerate(self.keywords):
+            grams = frozenset(trigrams(keyword))
+            self._grams.append(grams)
+            self.max_words = max(self.max_words, len(keyword.split()))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(keyword_id)
+
+    @staticmethod
+    def max_distance(term: str) -> int:
+        """Edit distance tolerated for a term of this length."""
+        if len(term) <= 4:
+            return 0
+        if len(term) <= 7:
+            return 1
+        return 2
+
+    def _candidates(self, term: str, max_distance: int) -> Set[int]:
+        """Keyword ids that may be within ``max_distance`` edits of ``term``.
+
+        Each edit changes at most four trigrams (three for an insertion,
+        deletion or substitution, four for a transposition), so a match shares
+        at least ``len(grams) - 4 * max_distance`` trigrams with the term and
+        therefore appears in one of the ``4 * max_distance + 1`` rarest posting
+        lists. Only those lists are read, which skips the long lists of common
+        trigrams such as the padded word start. Where that bound drops to zero
+        (short terms with the extra edit ``suggest`` allows) a candidate still
+        has to share one trigram with the term. Candidates read from those
+        lists are then checked against the same bound using the keyword's own
+        trigram count before any edit distance is computed.
+        """
+        term_grams = trigrams(term)
+        grams = sorted(term_grams, key=lambda gram: len(self._postings.get(gram, ())))
+        required = max(len(grams) - 4 * max_distance, 1)
+        seen: Set[int] = set()
+        candidates: Set[int] = set()
+        for gram in grams[:len(grams) - required + 1]:
+            for keyword_id in self._postings.get(gram, ()):
+                if keyword_id in seen:
+                    continue
+                seen.add(keyword_id)
+                if abs(len(self.keywords[keyword_id]) - len(term)) > max_distance:
+                    continue
+                keyword_grams = self._grams[keyword_id]
+                bound = max(len(term_grams), len(keyword_grams)) - 4 * max_distance
+                if len(term_grams & keyword_grams) >= max(bound, 1):
+                    candidates.add(keyword_id)
+        return candidates
+
+    def _terms(self, question: str) -> List[str]:
+        """Words of the question plus runs of up to ``max_words`` consecutive words."""
+        words = WORD_PATTERN.findall(question.lower())
+        terms = []
+        for size in range(1, self.max_words + 1):
+            for start in range(len(words) - size + 1):
+                terms.append(" ".join(words[start:start + size]))
+        return terms
+
+    def _closest(self, question: str, slack: int) -> Dict[int, int]:
+        """Map keyword ids to their smallest edit distance from any question term."""
+        matches: Dict[int, int] = {}
+        for term in self._terms(question):
+            limit = self.max_distance(term)
+            if not limit or self.known_words.issuperset(term.split()):
+                continue
+            limit += slack
+            for keyword_id in self._candidates(term, limit):
+                distance = bounded_edit_distance(term, self.keywords[keyword_id], limit)
+                if 0 < distance <= limit and distance < matches.get(keyword_id, limit + 1):
+                    matches[keyword_id] = distance
+        return matches
+
+    def find(self, question: str) -> Set[int]:
+        """Return ids of keywords that appear in the question misspelled.
+
+        Args:
+            question: The user's question
+
+        Returns:
+            Set of keyword ids within the length-based edit distance bound
+        """
+        return set(self._closest(question, slack=0))
+
+    def suggest(self, question: str, limit: int = 3) -> List[str]:
+        """Return "did you mean" keywords for a question, closest first.
+
+        Args:
+            question: The user's question
+            limit: Maximum number of suggestions
+
+        Returns:
+            Keywords within one more edit than ``find`` allows
+        """
+        matches = self._closest(question, slack=1)
+        ranked: List[Tuple[int, int, int]] = sorted(
+            (distance, -len(self.keywords[keyword_id]), keyword_id)
+            for keyword_id, distance in matches.items()
+        )
+        return [self.keywords[keyword_id] for _, _, keyword_id in ranked[:limit]]
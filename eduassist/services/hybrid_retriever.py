@@ -0,0 +1,167 @@
+"""Hybrid keyword + vector retrieval with reciprocal-rank fusion."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..config.settings import Settings
+from .knowledge_service import KnowledgeService
+
+VectorSearch = Callable[[str, int, Optional[str]], Optional[List[Dict]]]
+RankedDoc = Tuple[str, str, str, float]
+
+_executor = ThreadPoolExecutor(max_workers=Settings.HYBRID_MAX_WORKERS, thread_name_prefix="hybrid-vector")
+# One slot per worker: a search is only submitted when a worker is free to start it,
+# so searches that missed their deadline never pile up in the executor's queue. A
+# search that overruns is not stopped; it holds its worker and slot until it
+# finishes, and the done callback then releases the slot.
+_vector_slots = threading.BoundedSemaphore(Settings.HYBRID_MAX_WORKERS)
+
+
+def embedding_search(query: str, n_results: int, subject_filter: Optional[str]) -> Optional[List[Dict]]:
+    """Query the shared embedding service, or return None while it is unavailable or still warming up."""
+    try:
+        from embedding_service import get_ready_embedding_service
+    except ImportError:
+        return None
+    service = get_ready_embedding_service()
+    if service is None:
+        return None
+    return service.search(query, n_results=n_results, subject_filter=subject_filter)
+
+
+class HybridRetriever:
+    """Fuse keyword and vector rankings under a latency budget.
+
+    The vector tier is submitted to a shared thread pool while the keyword
+    tier runs on the calling thread. If the vector tier has not answered by
+    the deadline the keyword answer is returned on its own, so a slow or cold
+    embedding model never adds its full latency to a chat turn. When every
+    worker is still busy with earlier searches the vector tier is skipped
+    for the turn instead of queueing behind them.
+    """
+
+    RRF_K = 60
+
+    def __init__(self, knowledge_service: KnowledgeService,
+                 vector_search: Optional[VectorSearch] = embedding_search,
+                 budget_ms: float = Settings.HYBRID_VECTOR_BUDGET_MS,
+                 similarity_threshold: float = Settings.HYBRID_SIMILARITY_THRESHOLD,
+                 depth: int = 5):
+        self.knowledge_service = knowledge_service
+        self.vector_search = vector_search
+        self.budget_ms = budget_ms
+        self.similarity_threshold = similarity_threshold
+        self.depth = depth
+
+    def _vector_results(self, question: str, subject_key: str) -> Optional[List[Dict]]:
+        results = self.vector_search(question, self.depth, subject_key)
+        if results is None:
+            return None
+        return [r for r in results if r.get("similarity", 0.0) >= self.similarity_threshold]
+
+    def rank(self, question: str, subject_key: str = "python_programming",
+             fallback_subject_key: Optional[str] = None) -> List[RankedDoc]:
+        """
+        Rank candidate documents from both tiers, best first.
+
+        Args:
+            question: The user's question
+            subject_key: The subject to search in
+            fallback_subject_key: Subject the keyword tier tries when subject_key has no match
+
+        Returns:
+            List of (doc_id, answer, match_type, score). match_type is the
+            keyword tier's type for topics it found and "semantic" for topics
+            only the vector tier found; score is the fused RRF score, or the
+            keyword score when the vector tier missed its deadline
+        """
+        return self.rank_with_status(question, subject_key, fallback_subject_key)[0]
+
+    def rank_with_status(self, question: str, subject_key: str = "python_programming",
+                         fallback_subject_key: Optional[str] = None) -> Tuple[List[RankedDoc], bool]:
+        """
+        Like ``rank``, also reporting whether the vector tier took part.
+
+        Returns:
+            Tuple of (ranked documents, complete). complete is False when the
+            vector tier was skipped, still warming up, failed or missed its
+            deadline, i.e. the ranking is keyword-only by necessity
+        """
+        deadline = time.monotonic() + self.budget_ms / 1000.0
+        future = None
+        if self.vector_search is not None and _vector_slots.acquire(blocking=False):
+            future = _executor.submit(self._vector_results, question, subject_key)
+            future.add_done_callback(lambda _: _vector_slots.release())
+
+        keyword_ranked = self.knowledge_service.rank_topics(
+            question, subject_key, fallback_subject_key, limit=self.depth
+        )
+
+        vector_ranked: Optional[List[Dict]] = None
+        if future is not None:
+            try:
+                vector_ranked = future.result(timeout=max(deadline - time.monotonic(), 0.0))
+            except FutureTimeoutError:
+                # Left to finish in the background; its slot is released when it does
+                vector_ranked = None
+            except Exception as e:
+                print(f"Vector tier error: {e}")
+                vector_ranked = None
+
+        index = self.knowledge_service.index
+        keyword_docs = []
+        for topic_id, match_type, score in keyword_ranked:
+            subject, topic, _ = index.topics[topic_id]
+            keyword_docs.append((f"{subject}_{topic}", index.answer(topic_id), match_type, score))
+
+        complete = self.vector_search is None or vector_ranked is not None
+        if not vector_ranked:
+            return keyword_docs, complete
+
+        fused: Dict[str, float] = {}
+        candidates: Dict[str, Tuple[str, str]] = {}
+
+        for rank, (doc_id, answer, match_type, _) in enumerate(keyword_docs, start=1):
+            fused[doc_id] = fused.get(doc_id, 0.0) + 1.0 / (self.RRF_K + rank)
+            candidates.setdefault(doc_id, (answer, match_type))
+
+        for rank, result in enumerate(vector_ranked, start=1):
+            doc_id = result["id"]
+            fused[doc_id] = fused.get(doc_id, 0.0) + 1.0 / (self.RRF_K + rank)
+            metadata = result.get("metadata", {})
+            match_type = "general" if metadata.get("subject") == "general" else "semantic"
+            candidates.setdefault(doc_id, (metadata.get("answer", ""), match_type))
+
+        order = sorted(fused, key=lambda doc_id: -fused[doc_id])
+        return [(doc_id, *candidates[doc_id], fused[doc_id]) for doc_id in order], complete
+
+    def retrieve(self, question: str, subject_key: str = "python_programming",
+                 fallback_subject_key: Optional[str] = None) -> Tuple[str, str, float]:
+        """
+        Find an answer using both tiers.
+
+        Args:
+            question: The user's question
+            subject_key: The subject to search in
+            fallback_subject_key: Subject the keyword tier tries when subject_key has no match
+
+        Returns:
+            Tuple of (answer, match_type, score) for the top result of ``rank``
+        """
+        return self.retrieve_with_status(question, subject_key, fallback_subject_key)[0]
+
+    def retrieve_with_status(self, question: str, subject_key: str = "python_programming",
+                             fallback_subject_key: Optional[str] = None) -> Tuple[Tuple[str, str, float], bool]:
+        """
+        Like ``retrieve``, also reporting whether the vector tier took part.
+
+        Returns:
+            Tuple of ((answer, match_type, score), complete); see ``rank_with_status``
+        """
+        ranked, complete = self.rank_with_status(question, subject_key, fallback_subject_key)
+        if not ranked:
+            return ("", "not_found", 0.0), complete
+        _, answer, match_type, score = ranked[0]
+        return (answer, match_type, score), complete
@@ -3,6 +3,14 @@
 import requests
 from typing import Dict
 from ..config.settings import Settings
+from ..utils.registry import get_registry
+
+get_registry().register("http_session", requests.Session, lambda session: session.close())
+
+
+def get_http_session() -> requests.Session:
+    """Get the process-wide HTTP session, which reuses pooled keep-alive connections."""
+    return get_registry().get("http_session")
 
 
 class JNTUHClient:
@@ -24,7 +32,7 @@ class JNTUHClient:
         """
         try:
             url = f"{self.api_url}?rollNumber={hall_ticket}"
-            response = requests.get(url, timeout=self.timeout, allow_redirects=True)
+            response = get_http_session().get(url, timeout=self.timeout, allow_redirects=True)
             
             if response.status_code == 200:
                 data = response.json()
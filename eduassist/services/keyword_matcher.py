@@ -0,0 +1,137 @@
+"""Aho-Corasick keyword automaton for knowledge base matching."""
+
+from array import array
+from bisect import bisect_left
+from collections import deque
+from typing import Dict, Iterable, List, Sequence, Set
+
+
+class KeywordMatcher:
+    """Multi-pattern substring matcher compiled once from a keyword list.
+
+    The automaton is frozen into flat integer arrays after construction so a
+    single left-to-right pass over a question reports every keyword it
+    contains, independent of how many keywords were compiled in.
+    """
+
+    ARRAY_NAMES = ("edge_start", "edge_chars", "edge_targets", "fail", "out_start", "out_ids")
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: List[str] = []
+        keyword_ids: Dict[str, int] = {}
+        for keyword in keywords:
+            keyword = keyword.lower()
+            if keyword and keyword not in keyword_ids:
+                keyword_ids[keyword] = len(self.keywords)
+                self.keywords.append(keyword)
+        self._compile()
+
+    @classmethod
+    def from_arrays(cls, keywords: List[str], arrays: Dict[str, Sequence[int]]) -> "KeywordMatcher":
+        """Rebuild a matcher from previously compiled arrays without recompiling.
+
+        Args:
+            keywords: Keyword list in id order, as produced by ``self.keywords``
+            arrays: Mapping of ``ARRAY_NAMES`` to integer sequences (arrays or memoryviews)
+
+        Returns:
+            KeywordMatcher backed by the given arrays
+        """
+        matcher = cls.__new__(cls)
+        matcher.keywords = list(keywords)
+        for name in cls.ARRAY_NAMES:
+            setattr(matcher, f"_{name}", arrays[name])
+        return matcher
+
+    def to_arrays(self) -> Dict[str, array]:
+        """Return the compiled automaton as named int32 arrays."""
+        return {name: getattr(self, f"_{name}") for name in self.ARRAY_NAMES}
+
+    def _compile(self):
+        """Build the trie, failure links and outputs, then flatten them."""
+        goto: List[Dict[int, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+
+        for keyword_id, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword:
+                code = ord(char)
+                next_state = goto[state].get(code)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][code] = next_state
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(keyword_id)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for code, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and code not in goto[fallback]:
+                    fallback = fail[fallback]
+                candidate = goto[fallback].get(code, 0)
+                fail[next_state] = candidate if candidate != next_state else 0
+                outputs[next_state].extend(outputs[fail[next_state]])
+
+        self._edge_start = array("i", [0])
+        self._edge_chars = array("i")
+        self._edge_targets = array("i")
+        for edges in goto:
+            for code in sorted(edges):
+                self._edge_chars.append(code)
+                self._edge_targets.append(edges[code])
+            self._edge_start.append(len(self._edge_chars))
+
+        self._fail = array("i", fail)
+        self._out_start = array("i", [0])
+        self._out_ids = array("i")
+        for keyword_ids in outputs:
+            self._out_ids.extend(keyword_ids)
+            self._out_start.append(len(self._out_ids))
+
+    def _step(self, state: int, code: int) -> int:
+        """Follow the transition for ``code`` from ``state``, or return -1."""
+        lo = self._edge_start[state]
+        hi = self._edge_start[state + 1]
+        if lo == hi:
+            return -1
+        pos = bisect_left(self._edge_chars, code, lo, hi)
+        if pos < hi and self._edge_chars[pos] == code:
+            return self._edge_targets[pos]
+        return -1
+
+    def find_all(self, text: str) -> Set[int]:
+        """Return the ids of every keyword occurring in ``text``.
+
+        Args:
+            text: Text to scan (matched case-insensitively)
+
+        Returns:
+            Set of keyword ids, indexes into ``self.keywords``
+        """
+        found: Set[int] = set()
+        state = 0
+        fail = self._fail
+        out_start = self._out_start
+        out_ids = self._out_ids
+
+        for char in text.lower():
+            code = ord(char)
+            next_state = self._step(state, code)
+            while next_state < 0 and state:
+                state = fail[state]
+                next_state = self._step(state, code)
+            state = next_state if next_state >= 0 else 0
+            lo, hi = out_start[state], out_start[state + 1]
+            if lo != hi:
+                found.update(out_ids[lo:hi])
+
+        return found
+
+    def __len__(self) -> int:
+        return len(self.keywords)
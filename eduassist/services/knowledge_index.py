@@ -0,0 +1,319 @@
+"""Compiled, memory-mapped knowledge base index.
+
+The index bundles everything ``KnowledgeService`` needs at query time - the
+keyword automaton, the topic table, the BM25 term matrix and the answer
+texts - into a single binary artifact keyed by the SHA-256 of
+``knowledge_base.json``. Processes memory-map the artifact at boot and only
+recompile it when the JSON changes.
+
+Build it ahead of a deploy with::
+
+    python -m eduassist.services.knowledge_index knowledge_base.json knowledge_index.bin
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .bm25 import BM25Ranker
+from .fuzzy_matcher import FuzzyKeywordMatcher
+from .keyword_matcher import KeywordMatcher
+
+MAGIC = b"EAKIDX01"
+FORMAT_VERSION = 2
+_NUMPY_TYPECODES = {np.dtype(np.int32): "i", np.dtype(np.int64): "q", np.dtype(np.float32): "f"}
+_HEADER_LEN = struct.Struct("<I")
+_ALIGN = 8
+
+
+def _section_bytes(values) -> Tuple[bytes, str]:
+    """Serialize an ``array.array`` or numpy array, returning (bytes, struct typecode)."""
+    if isinstance(values, array):
+        return values.tobytes(), values.typecode
+    values = np.ascontiguousarray(values)
+    return values.tobytes(), _NUMPY_TYPECODES[values.dtype]
+
+
+def hash_file(file_path: str) -> str:
+    """Return the SHA-256 hex digest of a file's raw bytes, or "" if it is missing."""
+    try:
+        with open(file_path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return ""
+
+
+class KnowledgeIndex:
+    """Topic table, keyword automaton, BM25 matrix and answer store for a knowledge base."""
+
+    def __init__(self, content_hash: str, matcher: KeywordMatcher, ranker: BM25Ranker,
+                 topics: List[Tuple[str, str, List[str]]],
+                 keyword_topic_start: Sequence[int], keyword_topic_ids: Sequence[int],
+                 answer_offsets: Sequence[int], answers: bytes,
+                 source: Optional[mmap.mmap] = None):
+        self.content_hash = content_hash
+        self.matcher = matcher
+        self.ranker = ranker
+        self.topics = topics
+        self._subject_ranges: Dict[str, Tuple[int, int]] = {}
+        for topic_id, (subject_key, _, _) in enumerate(topics):
+            start, _ = self._subject_ranges.get(subject_key, (topic_id, topic_id))
+            self._subject_ranges[subject_key] = (start, topic_id + 1)
+        self._keyword_topic_start = keyword_topic_start
+        self._keyword_topic_ids = keyword_topic_ids
+        self._answer_offsets = answer_offsets
+        self._answers = answers
+        self._source = source
+        self._fuzzy: Optional[FuzzyKeywordMatcher] = None
+
+    @classmethod
+    def from_knowledge_base(cls, knowledge_base: Dict, content_hash: str = "") -> "KnowledgeIndex":
+        """Compile an in-memory index from a parsed knowledge base.
+
+        Args:
+            knowledge_base: Subject -> topic -> {keywords, answer} mapping
+            content_hash: Hash of the source JSON, recorded for staleness checks
+
+        Returns:
+            KnowledgeIndex over every topic in the knowledge base
+        """
+        topics: List[Tuple[str, str, List[str]]] = []
+        answer_chunks: List[bytes] = []
+        documents: List[str] = []
+        keyword_topics: Dict[str, List[int]] = {}
+
+        for subject_key, subject_topics in knowledge_base.items():
+            if not isinstance(subject_topics, dict):
+                continue
+            for topic_key, data in subject_topics.items():
+                if not isinstance(data, dict):
+                    continue
+                topic_id = len(topics)
+                keywords = list(data.get("keywords", []))
+                topics.append((subject_key, topic_key, keywords))
+                answer = data.get("answer", "")
+                answer_chunks.append(answer.encode("utf-8"))
+                documents.append(f"{topic_key.replace('_', ' ')} {' '.join(keywords)} {answer}")
+                for keyword in keywords:
+                    keyword_topics.setdefault(keyword.lower(), []).append(topic_id)
+
+        matcher = KeywordMatcher(keyword_topics.keys())
+        keyword_topic_start = array("i", [0])
+        keyword_topic_ids = array("i")
+        for keyword in matcher.keywords:
+            keyword_topic_ids.extend(keyword_topics[keyword])
+            keyword_topic_start.append(len(keyword_topic_ids))
+
+        answer_offsets = array("q", [0])
+        for chunk in answer_chunks:
+            answer_offsets.append(answer_offsets[-1] + len(chunk))
+
+        return cls(content_hash, matcher, BM25Ranker.build(documents), topics,
+                   keyword_topic_start, keyword_topic_ids, answer_offsets, b"".join(answer_chunks))
+
+    def __len__(self) -> int:
+        return len(self.topics)
+
+    @property
+    def fuzzy(self) -> FuzzyKeywordMatcher:
+        """Trigram index over the keywords, built on first use."""
+        if self._fuzzy is None:
+            self._fuzzy = FuzzyKeywordMatcher(self.matcher.keywords, self.ranker.vocabulary)
+        return self._fuzzy
+
+    def topic_subject(self, topic_id: int) -> str:
+        """Return the subject key a topic belongs to."""
+        return self.topics[topic_id][0]
+
+    def subject_range(self, subject_key: str) -> Tuple[int, int]:
+        """Return the contiguous [start, stop) topic id range of a subject."""
+        return self._subject_ranges.get(subject_key, (0, 0))
+
+    def keyword_topics(self, keyword_id: int) -> Sequence[int]:
+        """Return the topic ids that list a given keyword."""
+        return self._keyword_topic_ids[self._keyword_topic_start[keyword_id]:self._keyword_topic_start[keyword_id + 1]]
+
+    def keyword_topic_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the keyword -> topic CSR arrays (start offsets, topic ids) as numpy views."""
+        return (np.frombuffer(self._keyword_topic_start, dtype=np.int32),
+                np.frombuffer(self._keyword_topic_ids, dtype=np.int32))
+
+    def answer(self, topic_id: int) -> str:
+        """Decode a topic's answer text straight from the answer store."""
+        start = self._answer_offsets[topic_id]
+        end = self._answer_offsets[topic_id + 1]
+        return bytes(self._answers[start:end]).decode("utf-8")
+
+    def iter_topics(self) -> Iterator[Tuple[str, str, List[str], str]]:
+        """Yield (subject_key, topic_key, keywords, answer) for every topic in order."""
+        for topic_id, (subject_key, topic_key, keywords) in enumerate(self.topics):
+            yield subject_key, topic_key, keywords, self.answer(topic_id)
+
+    def save(self, index_path: str):
+        """Write the index artifact atomically to ``index_path``."""
+        sections = dict(self.matcher.to_arrays())
+        sections["keyword_topic_start"] = self._keyword_topic_start
+        sections["keyword_topic_ids"] = self._keyword_topic_ids
+        sections["answer_offsets"] = self._answer_offsets
+        for name, values in self.ranker.to_arrays().items():
+            sections[f"bm25_{name}"] = values
+
+        layout = {}
+        payload: List[bytes] = []
+        offset = 0
+        for name, values in sections.items():
+            data, typecode = _section_bytes(values)
+            layout[name] = [offset, len(data), typecode]
+            payload.append(data + b"\0" * (-len(data) % _ALIGN))
+            offset += len(payload[-1])
+        layout["answers"] = [offset, len(self._answers), "B"]
+        payload.append(bytes(self._answers))
+
+        header = json.dumps({
+            "version": FORMAT_VERSION,
+            "content_hash": self.content_hash,
+            "byteorder": sys.byteorder,
+            "keywords": self.matcher.keywords,
+            "topics": self.topics,
+            "bm25_vocabulary": self.ranker.vocabulary,
+            "sections": layout,
+        }, ensure_ascii=False).encode("utf-8")
+        header += b" " * (-(len(MAGIC) + _HEADER_LEN.size + len(header)) % _ALIGN)
+
+        directory = os.path.dirname(os.path.abspath(index_path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(MAGIC)
+                f.write(_HEADER_LEN.pack(len(header)))
+                f.write(header)
+                for chunk in payload:
+                    f.write(chunk)
+            os.replace(tmp_path, index_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @classmethod
+    def open(cls, index_path: str, expected_hash: Optional[str] = None) -> Optional["KnowledgeIndex"]:
+        """Memory-map an index artifact.
+
+        Args:
+            index_path: Path to the artifact written by ``save``
+            expected_hash: If given, reject artifacts compiled from other content
+
+        Returns:
+            KnowledgeIndex backed by the mapped file, or None if the artifact is
+            missing, malformed, stale or from another format version
+        """
+        try:
+            with open(index_path, "rb") as f:
+                source = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError, OSError):
+            return None
+
+        try:
+            if source[:len(MAGIC)] != MAGIC:
+                raise ValueError("bad magic")
+            start = len(MAGIC) + _HEADER_LEN.size
+            (header_len,) = _HEADER_LEN.unpack(source[len(MAGIC):start])
+            header = json.loads(source[start:start + header_len].decode("utf-8"))
+            if header.get("version") != FORMAT_VERSION or header.get("byteorder") != sys.byteorder:
+                raise ValueError("incompatible index format")
+            if expected_hash is not None and header.get("content_hash") != expected_hash:
+                raise ValueError("stale index")
+
+            base = start + header_len
+            view = memoryview(source)
+            sections = {}
+            for name, (offset, length, typecode) in header["sections"].items():
+                section = view[base + offset:base + offset + length]
+                sections[name] = section if typecode == "B" else section.cast(typecode)
+        except (ValueError, KeyError, TypeError, struct.error):
+            source.close()
+            return None
+
+        matcher = KeywordMatcher.from_arrays(header["keywords"], sections)
+        topics = [(subject, topic, keywords) for subject, topic, keywords in header["topics"]]
+        ranker = BM25Ranker(header["bm25_vocabulary"],
+                            *(np.asarray(sections[f"bm25_{name}"]) for name in BM25Ranker.ARRAY_NAMES),
+                            n_docs=len(topics))
+        return cls(header["content_hash"], matcher, ranker, topics, sections["keyword_topic_start"],
+                   sections["keyword_topic_ids"], sections["answer_offsets"],
+                   sections["answers"], source=source)
+
+
+def default_index_path(kb_path: str) -> str:
+    """Return the artifact path for ``kb_path``: ``knowledge_index.bin`` beside the JSON."""
+    return os.path.join(os.path.dirname(kb_path), "knowledge_index.bin")
+
+
+def build_index(kb_path: str = "knowledge_base.json",
+                index_path: Optional[str] = None) -> KnowledgeIndex:
+    """Compile ``kb_path`` and write the artifact to ``index_path``.
+
+    Args:
+        kb_path: Path to knowledge base JSON file
+        index_path: Where to write the compiled artifact; defaults to
+            ``default_index_path(kb_path)``
+
+    Returns:
+        The freshly compiled in-memory index
+    """
+    with open(kb_path, "rb") as f:
+        raw = f.read()
+    knowledge_base = json.loads(raw.decode("utf-8"))
+    index = KnowledgeIndex.from_knowledge_base(knowledge_base, hashlib.sha256(raw).hexdigest())
+    index.save(index_path or default_index_path(kb_path))
+    return index
+
+
+def load_index(kb_path: str = "knowledge_base.json",
+               index_path: Optional[str] = None) -> KnowledgeIndex:
+    """Memory-map the artifact for ``kb_path``, rebuilding it only if the JSON changed.
+
+    Args:
+        kb_path: Path to knowledge base JSON file
+        index_path: Path of the compiled artifact; defaults to
+            ``default_index_path(kb_path)``, so callers outside the repository
+            root do not leave artifacts in their working directory
+
+    Returns:
+        KnowledgeIndex for the current knowledge base; empty if the JSON is
+        missing or invalid
+    """
+    content_hash = hash_file(kb_path)
+    if not content_hash:
+        return KnowledgeIndex.from_knowledge_base({})
+    index_path = index_path or default_index_path(kb_path)
+
+    index = KnowledgeIndex.open(index_path, expected_hash=content_hash)
+    if index is not None:
+        return index
+
+    try:
+        built = build_index(kb_path, index_path)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return KnowledgeIndex.from_knowledge_base({})
+    except OSError as e:
+        print(f"Could not write knowledge index {index_path}: {e}")
+        with open(kb_path, "rb") as f:
+            return KnowledgeIndex.from_knowledge_base(json.loads(f.read().decode("utf-8")), content_hash)
+
+    return KnowledgeIndex.open(index_path, expected_hash=content_hash) or built
+
+
+if __name__ == "__main__":
+    kb_file = sys.argv[1] if len(sys.argv) > 1 else "knowledge_base.json"
+    index_file = sys.argv[2] if len(sys.argv) > 2 else "knowledge_index.bin"
+    compiled = build_index(kb_file, index_file)
+    print(f"Compiled {len(compiled)} topics and {len(compiled.matcher)} keywords "
+          f"from {kb_file} ({compiled.content_hash[:12]}) into {index_file}")
@@ -1,6 +1,11 @@
 """Knowledge base service for Q&A functionality."""
 
-from typing import Dict, Tuple, List
+from typing import Dict, Tuple, List, Optional, Sequence
+
+import numpy as np
+
+from .knowledge_index import KnowledgeIndex
+from .practice_bank import PracticeBank, get_practice_bank
 
 
 class KnowledgeService:
@@ -16,44 +21,220 @@ class KnowledgeService:
         "C Programming": "c_programming",
     }
     
-    def __init__(self, knowledge_base: Dict):
+    FULLTEXT_MIN_SCORE = 1.5
+    
+    def __init__(self, knowledge_base: Dict, index: Optional[KnowledgeIndex] = None):
         self.knowledge_base = knowledge_base
+        self.index = index if index is not None else KnowledgeIndex.from_knowledge_base(knowledge_base)
+    
+    @classmethod
+    def from_index(cls, index: KnowledgeIndex) -> "KnowledgeService":
+        """Create a service over a precompiled (typically memory-mapped) index."""
+        return cls({}, index=index)
+    
+    def match_topics(self, question: str) -> Dict[int, int]:
+        """
+        Count keyword hits per topic across every subject in one pass.
+        
+        Args:
+            question: The user's question
+            
+        Returns:
+            Mapping of topic id to the number of its keywords found in the question
+        """
+        return self._count_topics(self.index.matcher.find_all(question))
+    
+    def _count_topics(self, keyword_ids) -> Dict[int, int]:
+        """Count how many of the given keywords each topic lists."""
+        counts: Dict[int, int] = {}
+        for keyword_id in keyword_ids:
+            for topic_id in self.index.keyword_topics(keyword_id):
+                counts[topic_id] = counts.get(topic_id, 0) + 1
+        return counts
     
-    def find_answer(self, question: str, subject_key: str = "python_programming") -> Tuple[str, str]:
+    def suggest_keywords(self, question: str, limit: int = 3) -> List[str]:
+        """Return "did you mean" keywords close to the words of a question."""
+        return self.index.fuzzy.suggest(question, limit)
+    
+    def rank_topics(self, question: str, subject_key: str = "python_programming",
+                    fallback_subject_key: Optional[str] = None, limit: int = 5) -> List[Tuple[int, str, float]]:
+        """
+        Rank candidate topics for a question, best first.
+        
+        The order is: the first matching "general" topic, then keyword matches
+        in the subject and the fallback subject (most hits first), then
+        misspelled keyword matches found through the trigram index, then BM25
+        matches over their answers and keywords.
+        
+        Args:
+            question: The user's question
+            subject_key: The subject to search in
+            fallback_subject_key: Subject to try after subject_key
+            limit: Maximum number of topics to return
+            
+        Returns:
+            List of (topic_id, match_type, score) where score is the keyword hit
+            count for "general"/"subject"/"fuzzy" matches and the BM25 score for
+            "fulltext"
+        """
+        subject_keys = [key for key in (subject_key, fallback_subject_key) if key]
+        counts = self.match_topics(question)
+        ranked: List[Tuple[int, str, float]] = []
+        seen = set()
+        
+        general_ids = [topic_id for topic_id in counts if self.index.topic_subject(topic_id) == "general"]
+        if general_ids:
+            topic_id = min(general_ids)
+            ranked.append((topic_id, "general", float(counts[topic_id])))
+            seen.add(topic_id)
+        
+        def add_keyword_hits(hit_counts: Dict[int, int], match_type: str):
+            for key in subject_keys:
+                subject_hits = sorted(
+                    (topic_id for topic_id in hit_counts if self.index.topic_subject(topic_id) == key),
+                    key=lambda topic_id: (-hit_counts[topic_id], topic_id)
+                )
+                for topic_id in subject_hits:
+                    if len(ranked) >= limit:
+                        return
+                    if topic_id not in seen:
+                        ranked.append((topic_id, match_type, float(hit_counts[topic_id])))
+                        seen.add(topic_id)
+        
+        add_keyword_hits(counts, "subject")
+        if len(ranked) < limit:
+            add_keyword_hits(self._count_topics(self.index.fuzzy.find(question)), "fuzzy")
+        
+        for key in subject_keys:
+            if len(ranked) >= limit:
+                break
+            for topic_id, score in self.index.ranker.top(question, limit, *self.index.subject_range(key)):
+                if len(ranked) >= limit or score < self.FULLTEXT_MIN_SCORE:
+                    break
+                if topic_id not in seen:
+                    ranked.append((topic_id, "fulltext", score))
+                    seen.add(topic_id)
+        
+        return ranked[:limit]
+    
+    def find_answer(self, question: str, subject_key: str = "python_programming",
+                    fallback_subject_key: Optional[str] = None) -> Tuple[str, str, float]:
         """
         Find an answer for a given question.
         
+        Keyword matches are tried first; if no keyword of the subject (or the
+        fallback subject) occurs in the question, topics are ranked with BM25
+        over their answers and keywords.
+        
         Args:
             question: The user's question
             subject_key: The subject to search in
+            fallback_subject_key: Subject to try when nothing in subject_key matches
+            
+        Returns:
+            Tuple of (answer, match_type, score), see ``rank_topics``
+        """
+        ranked = self.rank_topics(question, subject_key, fallback_subject_key, limit=1)
+        if not ranked:
+            return "", "not_found", 0.0
+        topic_id, match_type, score = ranked[0]
+        return self.index.answer(topic_id), match_type, score
+    
+    def answer_many(self, questions: Sequence[str], subject_key: str = "python_programming",
+                    fallback_subject_key: Optional[str] = None,
+                    batch_size: int = 256) -> List[Tuple[str, str, float]]:
+        """
+        Answer a batch of questions, e.g. to replay query logs or precompute FAQs.
+        
+        Gives the same result as calling ``find_answer`` per question, but the
+        per-topic keyword counts and BM25 scores of each batch are computed
+        as matrices rather than question by question.
+        
+        Args:
+            questions: Questions to answer
+            subject_key: The subject to search in
+            fallback_subject_key: Subject to try when nothing in subject_key matches
+            batch_size: Questions scored per matrix
             
         Returns:
-            Tuple of (answer, match_type)
+            List of (answer, match_type, score), one per question, in order
         """
-        question_lower = question.lower()
-        
-        if "general" in self.knowledge_base:
-            for topic, data in self.knowledge_base["general"].items():
-                keywords = data.get("keywords", [])
-                for keyword in keywords:
-                    if keyword.lower() in question_lower:
-                        return data.get("answer", ""), "general"
-        
-        subject_kb = self.knowledge_base.get(subject_key, {})
-        best_match = None
-        max_matches = 0
-        
-        for topic, data in subject_kb.items():
-            keywords = data.get("keywords", [])
-            match_count = sum(1 for keyword in keywords if keyword.lower() in question_lower)
-            if match_count > max_matches:
-                max_matches = match_count
-                best_match = data
-        
-        if best_match and max_matches > 0:
-            return best_match.get("answer", ""), "subject"
-        
-        return "", "not_found"
+        results: List[Tuple[str, str, float]] = []
+        for offset in range(0, len(questions), batch_size):
+            results.extend(self._answer_batch(questions[offset:offset + batch_size],
+                                              subject_key, fallback_subject_key))
+        return results
+    
+    def _answer_batch(self, questions: Sequence[str], subject_key: str,
+                      fallback_subject_key: Optional[str]) -> List[Tuple[str, str, float]]:
+        """Answer one batch of questions with matrix keyword, fuzzy and BM25 scoring."""
+        n_questions = len(questions)
+        subject_keys = [key for key in (subject_key, fallback_subject_key) if key]
+        keyword_topic_start, keyword_topic_ids = self.index.keyword_topic_arrays()
+        
+        def topic_hits(find, rows_to_scan) -> Tuple[np.ndarray, np.ndarray]:
+            rows: List[int] = []
+            keyword_ids: List[int] = []
+            for row in rows_to_scan:
+                hits = find(questions[row])
+                rows.extend([row] * len(hits))
+                keyword_ids.extend(hits)
+            keyword_array = np.asarray(keyword_ids, dtype=np.int64)
+            starts = keyword_topic_start[keyword_array].astype(np.int64)
+            lengths = keyword_topic_start[keyword_array + 1] - starts
+            hit_rows = np.repeat(np.asarray(rows, dtype=np.int64), lengths)
+            within = np.arange(int(lengths.sum())) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+            return hit_rows, keyword_topic_ids[np.repeat(starts, lengths) + within].astype(np.int64)
+        
+        def range_counts(hits: Tuple[np.ndarray, np.ndarray], key: str) -> Tuple[np.ndarray, int]:
+            hit_rows, hit_topics = hits
+            start, stop = self.index.subject_range(key)
+            width = stop - start
+            mask = (hit_topics >= start) & (hit_topics < stop)
+            flat = np.bincount(hit_rows[mask] * width + hit_topics[mask] - start,
+                               minlength=n_questions * width)
+            return flat.reshape(n_questions, width), start
+        
+        answers: List[Optional[Tuple[str, str, float]]] = [None] * n_questions
+        
+        def assign_best(hits: Tuple[np.ndarray, np.ndarray], match_type: str):
+            for key in subject_keys:
+                counts, start = range_counts(hits, key)
+                if not counts.size:
+                    continue
+                best = counts.argmax(axis=1)
+                for row in range(n_questions):
+                    count = counts[row, best[row]]
+                    if answers[row] is None and count > 0:
+                        answers[row] = (self.index.answer(start + int(best[row])), match_type, float(count))
+        
+        exact_hits = topic_hits(self.index.matcher.find_all, range(n_questions))
+        general_counts, start = range_counts(exact_hits, "general")
+        if general_counts.size:
+            matched = general_counts > 0
+            first = matched.argmax(axis=1)
+            for row in np.flatnonzero(matched.any(axis=1)):
+                topic_id = start + int(first[row])
+                answers[row] = (self.index.answer(topic_id), "general", float(general_counts[row, first[row]]))
+        
+        assign_best(exact_hits, "subject")
+        pending = [row for row in range(n_questions) if answers[row] is None]
+        if pending:
+            assign_best(topic_hits(self.index.fuzzy.find, pending), "fuzzy")
+        
+        for key in subject_keys:
+            pending = [row for row in range(n_questions) if answers[row] is None]
+            start, stop = self.index.subject_range(key)
+            if not pending or stop <= start:
+                continue
+            scores = self.index.ranker.scores_many([questions[row] for row in pending], start, stop)
+            best = scores.argmax(axis=1)
+            for position, row in enumerate(pending):
+                score = float(scores[position, best[position]])
+                if score > 0.0 and score >= self.FULLTEXT_MIN_SCORE:
+                    answers[row] = (self.index.answer(start + int(best[position])), "fulltext", score)
+        
+        return [answer if answer is not None else ("", "not_found", 0.0) for answer in answers]
     
     @classmethod
     def get_subject_key(cls, subject_name: str) -> str:
@@ -61,52 +242,24 @@ class KnowledgeService:
         return cls.SUBJECT_KEY_MAPPING.get(subject_name, "python_programming")
     
     @staticmethod
-    def generate_practice_questions(subject: str, topic: str) -> List[str]:
-        """Generate practice questions for a given subject and topic."""
-        questions = {
-            "python_programming": {
-                "default": [
-                    "What is the difference between a list and a tuple in Python?",
-                    "Explain the concept of list comprehension with an example.",
-                    "What are decorators in Python and how do they work?",
-                    "Write a program to check if a number is prime.",
-                    "Explain the difference between shallow copy and deep copy."
-                ],
-                "loops": [
-                    "What is the difference between for and while loops?",
-                    "How do you use break and continue statements?",
-                    "Write a program to print Fibonacci series using loops.",
-                    "Explain nested loops with an example.",
-                    "What is an infinite loop and how to avoid it?"
-                ],
-                "oop": [
-                    "What are the four pillars of OOP?",
-                    "Explain inheritance with an example.",
-                    "What is polymorphism in Python?",
-                    "Difference between class variables and instance variables?",
-                    "What is method overriding?"
-                ]
-            },
-            "data_structures": {
-                "default": [
-                    "What is the difference between an array and a linked list?",
-                    "Explain the time complexity of different sorting algorithms.",
-                    "What is a binary search tree?",
-                    "How does a hash table work?",
-                    "Explain the difference between BFS and DFS."
-                ]
-            },
-            "dbms": {
-                "default": [
-                    "What is normalization and why is it important?",
-                    "Explain ACID properties in database transactions.",
-                    "What is the difference between SQL and NoSQL databases?",
-                    "What are indexes and how do they improve performance?",
-                    "Explain different types of joins in SQL."
-                ]
-            }
-        }
-        
-        subject_questions = questions.get(subject, {"default": ["Practice questions for this subject coming soon!"]})
-        topic_questions = subject_questions.get(topic, subject_questions.get("default", []))
-        return topic_questions
+    def generate_practice_questions(subject: str, topic: str, difficulty: Optional[str] = None,
+                                    count: int = 5, seed: str = "", round_number: int = 0,
+                                    bank: Optional[PracticeBank] = None) -> List[str]:
+        """
+        Generate practice questions for a given subject and topic.
+        
+        Args:
+            subject: Subject key
+            topic: Topic key, or "default" for general subject questions
+            difficulty: "easy", "medium", "hard", or None for any
+            count: Number of questions
+            seed: Per-student seed so each student gets their own order
+            round_number: Number of sets already generated with this seed
+            bank: Question bank to sample from (defaults to the shared bank)
+            
+        Returns:
+            List of questions, or a placeholder if the bank has none for the subject
+        """
+        bank = bank if bank is not None else get_practice_bank()
+        questions = bank.sample(subject, topic, difficulty, count, seed, round_number)
+        return questions or ["Practice questions for this subject coming soon!"]
@@ -0,0 +1,218 @@
+"""Per-subject knowledge base shards with a bounded, shared LRU.
+
+``knowledge_base.json`` is split into one JSON file per subject plus a
+``manifest.json`` recording the source hash and each shard's hash. A session
+only loads the shards for the subjects of its selected semester, so the size
+of the whole knowledge base no longer matters per rerun. The index compiled
+for a selection is saved under ``indexes/``, named by the hash of its shards,
+and memory-mapped by every later process that selects the same subjects.
+
+Split it ahead of a deploy with::
+
+    python -m eduassist.services.knowledge_shards knowledge_base.json knowledge_shards
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+
+from ..config.settings import Settings
+from .knowledge_index import KnowledgeIndex, hash_file
+
+MANIFEST_NAME = "manifest.json"
+INDEX_DIR_NAME = "indexes"
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9_-]")
+
+
+def _write_atomic(path: str, data: bytes):
+    """Write ``data`` to ``path`` through a temporary file and ``os.replace``."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def write_shards(kb_path: str = "knowledge_base.json", shard_dir: str = "knowledge_shards") -> Dict:
+    """Split a knowledge base JSON file into per-subject shards.
+
+    Args:
+        kb_path: Path to knowledge base JSON file
+        shard_dir: Directory to write the shards and manifest into
+
+    Returns:
+        The written manifest
+    """
+    with open(kb_path, "rb") as f:
+        raw = f.read()
+    knowledge_base = json.loads(raw.decode("utf-8"))
+    os.makedirs(shard_dir, exist_ok=True)
+
+    subjects = {}
+    for subject_key, topics in knowledge_base.items():
+        file_name = f"{_UNSAFE_CHARS.sub('_', subject_key)}.json"
+        data = json.dumps(topics, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        _write_atomic(os.path.join(shard_dir, file_name), data)
+        subjects[subject_key] = {
+            "file": file_name,
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "topics": len(topics),
+        }
+
+    manifest = {"source_hash": hashlib.sha256(raw).hexdigest(), "subjects": subjects}
+    _write_atomic(os.path.join(shard_dir, MANIFEST_NAME),
+                  json.dumps(manifest, indent=2, ensure_ascii=False).encode("utf-8"))
+
+    kept = {entry["file"] for entry in subjects.values()} | {MANIFEST_NAME}
+    for file_name in os.listdir(shard_dir):
+        if file_name.endswith(".json") and file_name not in kept:
+            os.unlink(os.path.join(shard_dir, file_name))
+    return manifest
+
+
+def _read_manifest(shard_dir: str) -> Optional[Dict]:
+    try:
+        with open(os.path.join(shard_dir, MANIFEST_NAME), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+class ShardedKnowledgeBase:
+    """Loads knowledge base shards on demand and keeps a bounded number in memory.
+
+    One instance is shared by every session of the process, so the LRU is
+    guarded by a lock.
+    """
+
+    def __init__(self, shard_dir: str, manifest: Dict,
+                 capacity: int = Settings.KB_SHARD_CACHE_SIZE):
+        self.shard_dir = shard_dir
+        self.manifest = manifest
+        self.capacity = capacity
+        self._shards: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, kb_path: str = "knowledge_base.json", shard_dir: str = "knowledge_shards",
+             capacity: int = Settings.KB_SHARD_CACHE_SIZE) -> "ShardedKnowledgeBase":
+        """Open the shards for ``kb_path``, re-splitting it only if the JSON changed.
+
+        If ``kb_path`` is missing, existing shards are used as they are.
+
+        Args:
+            kb_path: Path to knowledge base JSON file
+            shard_dir: Directory holding the shards
+            capacity: Maximum number of shards kept in memory
+
+        Returns:
+            ShardedKnowledgeBase; empty if neither the JSON nor shards exist
+        """
+        manifest = _read_manifest(shard_dir)
+        content_hash = hash_file(kb_path)
+        if content_hash and (manifest is None or manifest.get("source_hash") != content_hash):
+            try:
+                manifest = write_shards(kb_path, shard_dir)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                manifest = None
+            except OSError as e:
+                print(f"Could not write knowledge shards to {shard_dir}: {e}")
+                manifest = None
+        return cls(shard_dir, manifest or {"source_hash": "", "subjects": {}}, capacity)
+
+    def subjects(self) -> List[str]:
+        """Return the subject keys that have a shard."""
+        return list(self.manifest["subjects"])
+
+    def shard(self, subject_key: str) -> Dict:
+        """Return one subject's topics, reading the shard from disk on a cache miss.
+
+        Args:
+            subject_key: Subject key in the knowledge base
+
+        Returns:
+            The subject's topic dictionary, or {} if it has no readable shard
+        """
+        with self._lock:
+            if subject_key in self._shards:
+                self._shards.move_to_end(subject_key)
+                return self._shards[subject_key]
+
+        entry = self.manifest["subjects"].get(subject_key)
+        if entry is None:
+            return {}
+        try:
+            with open(os.path.join(self.shard_dir, entry["file"]), "r", encoding="utf-8") as f:
+                topics = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            print(f"Could not read knowledge shard {entry['file']}: {e}")
+            return {}
+
+        with self._lock:
+            self._shards[subject_key] = topics
+            self._shards.move_to_end(subject_key)
+            while len(self._shards) > self.capacity:
+                self._shards.popitem(last=False)
+        return topics
+
+    def _index_path(self, digest: str) -> str:
+        return os.path.join(self.shard_dir, INDEX_DIR_NAME, f"{digest}.bin")
+
+    def _save_index(self, index: KnowledgeIndex, index_path: str):
+        """Save a compiled selection, keeping only the most recently used artifacts."""
+        index_dir = os.path.dirname(index_path)
+        try:
+            os.makedirs(index_dir, exist_ok=True)
+            index.save(index_path)
+            artifacts = sorted(
+                (os.path.join(index_dir, name) for name in os.listdir(index_dir) if name.endswith(".bin")),
+                key=os.path.getmtime, reverse=True
+            )
+            for stale_path in artifacts[Settings.KB_COMPILED_INDEX_LIMIT:]:
+                os.unlink(stale_path)
+        except OSError as e:
+            print(f"Could not write knowledge index {index_path}: {e}")
+
+    def load(self, subject_keys: Iterable[str]) -> KnowledgeIndex:
+        """Memory-map the index over the given subjects, compiling it on first use.
+
+        Args:
+            subject_keys: Subjects to include; keys without a shard are skipped
+
+        Returns:
+            KnowledgeIndex whose content hash covers the selected shards
+        """
+        keys = [key for key in dict.fromkeys(subject_keys) if key in self.manifest["subjects"]]
+        digest = hashlib.sha256(
+            "".join(f"{key}:{self.manifest['subjects'][key]['sha256']};" for key in keys).encode("utf-8")
+        ).hexdigest()
+        index_path = self._index_path(digest)
+        index = KnowledgeIndex.open(index_path, expected_hash=digest)
+        if index is not None:
+            try:
+                os.utime(index_path)
+            except OSError:
+                pass
+            return index
+
+        knowledge_base = {key: self.shard(key) for key in keys}
+        built = KnowledgeIndex.from_knowledge_base(knowledge_base, digest)
+        self._save_index(built, index_path)
+        return KnowledgeIndex.open(index_path, expected_hash=digest) or built
+
+if __name__ == "__main__":
+    kb_file = sys.argv[1] if len(sys.argv) > 1 else "knowledge_base.json"
+    shard_path = sys.argv[2] if len(sys.argv) > 2 else "knowledge_shards"
+    written = write_shards(kb_file, shard_path)
+    print(f"Split {kb_file} ({written['source_hash'][:12]}) into "
+          f"{len(written['subjects'])} subject shards in {shard_path}")
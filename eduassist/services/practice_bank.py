@@ -0,0 +1,329 @@
+"""Indexed practice question bank.
+
+Questions live in a SQLite file keyed by (subject, topic, difficulty,
+position), where ``position`` numbers the questions of each group densely
+from 0. Looking up a group is a primary-key read, and sampling picks
+positions arithmetically instead of loading the group, so the cost of a
+sample depends only on its size, not on how many questions the bank holds.
+
+``practice_questions.json`` seeds the bank. When it changes, the questions it
+contributed are replaced by its new contents, so edited and removed seed
+questions do not linger. Larger sets are bulk imported from JSON or CSV::
+
+    python -m eduassist.services.practice_bank import questions.csv
+"""
+
+import csv
+import hashlib
+import json
+import math
+import random
+import sqlite3
+import sys
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..utils.registry import get_registry
+
+DIFFICULTIES = ("easy", "medium", "hard")
+DEFAULT_TOPIC = "default"
+
+QuestionRow = Tuple[str, str, str, str]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS question_groups (
+    subject TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    PRIMARY KEY (subject, topic, difficulty)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS questions (
+    subject TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    question TEXT NOT NULL,
+    PRIMARY KEY (subject, topic, difficulty, position)
+) WITHOUT ROWID;
+CREATE UNIQUE INDEX IF NOT EXISTS questions_text
+    ON questions (subject, topic, difficulty, question);
+CREATE TABLE IF NOT EXISTS bank_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS seed_questions (
+    source TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    question TEXT NOT NULL,
+    PRIMARY KEY (source, subject, topic, difficulty, question)
+) WITHOUT ROWID;
+"""
+
+
+def _permutation(n: int, seed: str) -> Tuple[int, int]:
+    """Return (a, b) of the seeded affine permutation ``i -> (a * i + b) % n``."""
+    rng = random.Random(seed)
+    b = rng.randrange(n)
+    a = 1
+    for _ in range(64):
+        candidate = rng.randrange(1, n) if n > 1 else 1
+        if math.gcd(candidate, n) == 1:
+            a = candidate
+            # Strides of 1 and n - 1 only rotate or reverse the group.
+            if 1 < candidate < n - 1:
+                break
+    return a, b
+
+
+def rows_from_nested(data: Dict) -> Iterable[QuestionRow]:
+    """Yield rows from a ``{subject: {topic: {difficulty: [questions]}}}`` dict."""
+    for subject, topics in data.items():
+        for topic, difficulties in topics.items():
+            for difficulty, questions in difficulties.items():
+                for question in questions:
+                    yield subject, topic, difficulty, question
+
+
+def rows_from_csv(file_path: str) -> Iterable[QuestionRow]:
+    """Yield rows from a CSV file with subject, topic, difficulty and question columns."""
+    with open(file_path, "r", encoding="utf-8", newline="") as f:
+        for record in csv.DictReader(f):
+            yield (record["subject"], record.get("topic") or DEFAULT_TOPIC,
+                   record.get("difficulty") or "medium", record["question"])
+
+
+class PracticeBank:
+    """Practice questions indexed by (subject, topic, difficulty)."""
+
+    def __init__(self, db_path: str = "practice_bank.db"):
+        self.db_path = db_path
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _insert_rows(self, rows: Iterable[QuestionRow]) -> List[QuestionRow]:
+        """Append rows to their groups, skipping duplicates; the caller holds the lock and transaction.
+
+        Returns:
+            The normalised rows that were added
+        """
+        added = []
+        sizes: Dict[Tuple[str, str, str], int] = {}
+        for subject, topic, difficulty, question in rows:
+            question = question.strip()
+            difficulty = difficulty.strip().lower()
+            if not question:
+                continue
+            group = (subject, topic, difficulty)
+            if group not in sizes:
+                row = self._conn.execute(
+                    "SELECT size FROM question_groups WHERE subject = ? AND topic = ? AND difficulty = ?",
+                    group
+                ).fetchone()
+                sizes[group] = row[0] if row else 0
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO questions (subject, topic, difficulty, position, question) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (*group, sizes[group], question)
+            )
+            if cursor.rowcount:
+                sizes[group] += 1
+                added.append((*group, question))
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO question_groups (subject, topic, difficulty, size) VALUES (?, ?, ?, ?)",
+            [(*group, size) for group, size in sizes.items()]
+        )
+        return added
+
+    def _remove_rows(self, rows: Iterable[QuestionRow]):
+        """Delete questions and renumber their groups densely; the caller holds the lock and transaction."""
+        groups: Dict[Tuple[str, str, str], List[str]] = {}
+        for subject, topic, difficulty, question in rows:
+            groups.setdefault((subject, topic, difficulty), []).append(question)
+        for group, questions in groups.items():
+            self._conn.executemany(
+                "DELETE FROM questions WHERE subject = ? AND topic = ? AND difficulty = ? AND question = ?",
+                [(*group, question) for question in questions]
+            )
+            remaining = [row[0] for row in self._conn.execute(
+                "SELECT question FROM questions WHERE subject = ? AND topic = ? AND difficulty = ? "
+                "ORDER BY position", group
+            )]
+            self._conn.execute(
+                "DELETE FROM questions WHERE subject = ? AND topic = ? AND difficulty = ?", group
+            )
+            self._conn.executemany(
+                "INSERT INTO questions (subject, topic, difficulty, position, question) VALUES (?, ?, ?, ?, ?)",
+                [(*group, position, question) for position, question in enumerate(remaining)]
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO question_groups (subject, topic, difficulty, size) VALUES (?, ?, ?, ?)",
+                (*group, len(remaining))
+            )
+
+    def import_questions(self, rows: Iterable[QuestionRow]) -> int:
+        """Append questions to the bank in one transaction, skipping duplicates.
+
+        Args:
+            rows: (subject, topic, difficulty, question) tuples
+
+        Returns:
+            Number of questions added
+        """
+        with self._lock, self._conn:
+            return len(self._insert_rows(rows))
+
+    def import_file(self, file_path: str) -> int:
+        """Bulk import a nested JSON file or a CSV file of questions.
+
+        Args:
+            file_path: ``.json`` in the ``practice_questions.json`` layout, or ``.csv``
+
+        Returns:
+            Number of questions added
+        """
+        if file_path.endswith(".csv"):
+            return self.import_questions(rows_from_csv(file_path))
+        with open(file_path, "r", encoding="utf-8") as f:
+            return self.import_questions(rows_from_nested(json.load(f)))
+
+    def sync(self, file_path: str = "practice_questions.json") -> int:
+        """Replace the seed file's questions with its current contents if it changed since the last sync.
+
+        Questions the previous version of the file contributed but the current
+        one lacks are deleted, and the affected groups renumbered. A question
+        also imported from another source is deleted with it.
+
+        Args:
+            file_path: Path to the seed JSON file
+
+        Returns:
+            Number of questions added
+        """
+        try:
+            with open(file_path, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return 0
+        content_hash = hashlib.sha256(raw).hexdigest()
+        key = f"source:{file_path}"
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM bank_meta WHERE key = ?", (key,)).fetchone()
+        if row and row[0] == content_hash:
+            return 0
+        try:
+            rows = {(subject, topic, difficulty.strip().lower(), question.strip())
+                    for subject, topic, difficulty, question in rows_from_nested(json.loads(raw.decode("utf-8")))
+                    if question.strip()}
+        except (json.JSONDecodeError, UnicodeDecodeError, AttributeError) as e:
+            print(f"Could not import practice questions from {file_path}: {e}")
+            return 0
+
+        with self._lock, self._conn:
+            previous = set(self._conn.execute(
+                "SELECT subject, topic, difficulty, question FROM seed_questions WHERE source = ?", (file_path,)
+            ).fetchall())
+            self._remove_rows(previous - rows)
+            added = self._insert_rows(sorted(rows - previous))
+            self._conn.execute("DELETE FROM seed_questions WHERE source = ?", (file_path,))
+            self._conn.executemany(
+                "INSERT INTO seed_questions (source, subject, topic, difficulty, question) VALUES (?, ?, ?, ?, ?)",
+                [(file_path, *row) for row in rows]
+            )
+            self._conn.execute("INSERT OR REPLACE INTO bank_meta (key, value) VALUES (?, ?)", (key, content_hash))
+        return len(added)
+
+    def _group_sizes(self, subject: str, topic: str, difficulty: Optional[str]) -> List[Tuple[str, int]]:
+        query = "SELECT difficulty, size FROM question_groups WHERE subject = ? AND topic = ?"
+        params: Tuple = (subject, topic)
+        if difficulty:
+            query += " AND difficulty = ?"
+            params += (difficulty,)
+        with self._lock:
+            return sorted(self._conn.execute(query, params).fetchall())
+
+    def count(self, subject: str, topic: str = DEFAULT_TOPIC, difficulty: Optional[str] = None) -> int:
+        """Return the number of questions for a subject/topic, optionally of one difficulty."""
+        return sum(size for _, size in self._group_sizes(subject, topic, difficulty))
+
+    def sample(self, subject: str, topic: str = DEFAULT_TOPIC, difficulty: Optional[str] = None,
+               k: int = 5, seed: str = "", round_number: int = 0) -> List[str]:
+        """Draw up to ``k`` distinct questions, reproducibly for a given seed.
+
+        Each seed fixes a permutation of the matching questions; round ``r``
+        returns its slice ``[r * k, (r + 1) * k)``, so consecutive rounds for
+        one student keep producing unseen questions until the group is
+        exhausted, and then wrap around. Topics without questions fall back to
+        the subject's "default" topic.
+
+        Args:
+            subject: Subject key
+            topic: Topic key, or "default" for general subject questions
+            difficulty: One of DIFFICULTIES, or None for any
+            k: Number of questions to draw
+            seed: Per-student seed
+            round_number: How many sets this student has drawn before
+
+        Returns:
+            List of question texts
+        """
+        groups = self._group_sizes(subject, topic, difficulty)
+        if not groups and topic != DEFAULT_TOPIC:
+            topic = DEFAULT_TOPIC
+            groups = self._group_sizes(subject, topic, difficulty)
+        total = sum(size for _, size in groups)
+        if not total or k <= 0:
+            return []
+
+        a, b = _permutation(total, f"{seed}:{subject}:{topic}:{difficulty or ''}")
+        start = round_number * min(k, total)
+        keys = []
+        for i in range(start, start + min(k, total)):
+            position = (a * (i % total) + b) % total
+            for group_difficulty, size in groups:
+                if position < size:
+                    keys.append((group_difficulty, position))
+                    break
+                position -= size
+
+        questions = []
+        with self._lock:
+            for group_difficulty, position in keys:
+                row = self._conn.execute(
+                    "SELECT question FROM questions "
+                    "WHERE subject = ? AND topic = ? AND difficulty = ? AND position = ?",
+                    (subject, topic, group_difficulty, position)
+                ).fetchone()
+                if row:
+                    questions.append(row[0])
+        return questions
+
+
+def _open_practice_bank(db_path: str = "practice_bank.db",
+                        seed_path: str = "practice_questions.json") -> PracticeBank:
+    bank = PracticeBank(db_path)
+    bank.sync(seed_path)
+    return bank
+
+
+get_registry().register("practice_bank", _open_practice_bank, PracticeBank.close)
+
+
+def get_practice_bank() -> PracticeBank:
+    """Get or create the process-wide practice bank, importing the seed file if it changed."""
+    return get_registry().get("practice_bank")
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3 or sys.argv[1] != "import":
+        print("Usage: python -m eduassist.services.practice_bank import <questions.json|questions.csv> [bank.db]")
+        sys.exit(1)
+    bank = PracticeBank(sys.argv[3] if len(sys.argv) > 3 else "practice_bank.db")
+    print(f"Imported {bank.import_file(sys.argv[2])} questions from {sys.argv[2]} into {bank.db_path}")
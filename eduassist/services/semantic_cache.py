@@ -0,0 +1,113 @@
+"""Near-duplicate query cache for vector search results."""
+
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from ..config.settings import Settings
+
+
+class SemanticQueryCache:
+    """Cache search results under their query embedding.
+
+    Recent query embeddings are kept L2-normalized in a fixed-size matrix, so
+    a lookup is one matrix-vector product: a query whose cosine similarity to
+    a cached query (asked with the same subject filter and at least as many
+    results) reaches the threshold reuses that query's results. When full,
+    the least recently used slot is overwritten.
+    """
+
+    def __init__(self, capacity: int = Settings.SEMANTIC_CACHE_SIZE,
+                 threshold: float = Settings.SEMANTIC_CACHE_THRESHOLD):
+        self.capacity = capacity
+        self.threshold = threshold
+        self._matrix: Optional[np.ndarray] = None
+        self._filters: List[Optional[str]] = []
+        self._n_results = np.zeros(capacity, dtype=np.int32)
+        self._last_used = np.zeros(capacity, dtype=np.int64)
+        self._results: List[List[Dict]] = []
+        self._tick = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _normalize(embedding) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else vector
+
+    def lookup(self, embedding, n_results: int, subject_filter: Optional[str] = None) -> Optional[List[Dict]]:
+        """
+        Return cached results for a near-duplicate query, or None on a miss.
+
+        Args:
+            embedding: Embedding of the new query
+            n_results: Number of results wanted
+            subject_filter: Subject filter of the new query
+
+        Returns:
+            The first ``n_results`` results of the most similar cached query
+        """
+        vector = self._normalize(embedding)
+        with self._lock:
+            size = len(self._results)
+            if not size or self._matrix is None or self._matrix.shape[1] != vector.size:
+                self.misses += 1
+                return None
+            similarities = self._matrix[:size] @ vector
+            eligible = (self._n_results[:size] >= n_results) & np.fromiter(
+                (cached == subject_filter for cached in self._filters), dtype=bool, count=size
+            )
+            similarities[~eligible] = -np.inf
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.threshold:
+                self.misses += 1
+                return None
+            self._tick += 1
+            self._last_used[best] = self._tick
+            self.hits += 1
+            return self._results[best][:n_results]
+
+    def store(self, embedding, n_results: int, subject_filter: Optional[str], results: List[Dict]):
+        """Cache the results of a query, evicting the least recently used entry when full."""
+        if self.capacity <= 0:
+            return
+        vector = self._normalize(embedding)
+        with self._lock:
+            if self._matrix is None or self._matrix.shape[1] != vector.size:
+                self._matrix = np.zeros((self.capacity, vector.size), dtype=np.float32)
+                self._filters, self._results = [], []
+            if len(self._results) < self.capacity:
+                slot = len(self._results)
+                self._filters.append(subject_filter)
+                self._results.append(results)
+            else:
+                slot = int(np.argmin(self._last_used))
+                self._filters[slot] = subject_filter
+                self._results[slot] = results
+                self.evictions += 1
+            self._matrix[slot] = vector
+            self._n_results[slot] = n_results
+            self._tick += 1
+            self._last_used[slot] = self._tick
+
+    def clear(self):
+        """Drop every entry, e.g. after the collection changed."""
+        with self._lock:
+            self._filters, self._results = [], []
+            self._last_used[:] = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Return entry count, hit/miss/eviction counters and the hit rate."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._results),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,203 @@
+"""Machine translation backends behind a common interface.
+
+``translation_service`` talks to a ``TranslationBackend`` chosen by
+``Settings.TRANSLATION_BACKEND``:
+
+- ``GoogleBackend`` calls the Google Translate endpoint that deep-translator
+  uses, but through a pool of reusable clients per language pair. Each client
+  owns a ``requests.Session``, so consecutive requests reuse the same
+  keep-alive connection instead of opening a new one, and every request has a
+  timeout.
+- ``StubBackend`` translates locally and deterministically (``"[te] text"``),
+  for tests and offline development.
+
+``CircuitBreaker`` stops calling an upstream that keeps failing: after
+``threshold`` consecutive failures it opens and callers fail fast until
+``reset_seconds`` have passed, then a single probe request decides whether it
+closes again.
+"""
+
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+
+import requests
+from bs4 import BeautifulSoup
+from deep_translator.constants import BASE_URLS
+
+from ..config.settings import Settings
+
+
+class UpstreamError(Exception):
+    """The translation upstream failed or is unreachable."""
+
+
+class TranslationBackend:
+    """Translates one text at a time between language codes."""
+
+    name = ""
+
+    def translate(self, text: str, source_code: str, target_code: str) -> Optional[str]:
+        """Return the translation, or None if the upstream answered without one; raise UpstreamError on failure."""
+        raise NotImplementedError
+
+    def close(self):
+        """Release pooled connections."""
+
+
+class _GoogleClient:
+    """One keep-alive connection to Google Translate for a language pair."""
+
+    URL = BASE_URLS["GOOGLE_TRANSLATE"]
+
+    def __init__(self, source_code: str, target_code: str, timeout: float):
+        self.params = {"sl": source_code, "tl": target_code}
+        self.timeout = timeout
+        self.session = requests.Session()
+
+    def translate(self, text: str) -> Optional[str]:
+        try:
+            response = self.session.get(self.URL, params={**self.params, "q": text}, timeout=self.timeout)
+        except requests.RequestException as e:
+            raise UpstreamError(str(e)) from e
+        if response.status_code == 404:
+            return None
+        if response.status_code != 200:
+            # 429 throttling, 403 blocks and 5xx errors all mean the upstream is unusable for now
+            raise UpstreamError(f"HTTP {response.status_code}")
+        soup = BeautifulSoup(response.text, "html.parser")
+        element = soup.find("div", {"class": "t0"}) or soup.find("div", {"class": "result-container"})
+        # Keep the newlines: a batched request is split back into lines by the caller
+        return element.get_text() if element else None
+
+
+class GoogleBackend(TranslationBackend):
+    """Google Translate through pooled, reusable clients per language pair."""
+
+    name = "google"
+
+    def __init__(self, timeout: float = Settings.TRANSLATION_TIMEOUT_SECONDS):
+        self.timeout = timeout
+        self._pools: Dict[Tuple[str, str], "queue.LifoQueue[_GoogleClient]"] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _client(self, source_code: str, target_code: str) -> Iterator[_GoogleClient]:
+        """Check out a client for the pair, creating one if all are busy.
+
+        At most one client per concurrent caller is ever created, so the pool
+        grows to the size of the translation worker pool and no further.
+        """
+        with self._lock:
+            pool = self._pools.setdefault((source_code, target_code), queue.LifoQueue())
+        try:
+            client = pool.get_nowait()
+        except queue.Empty:
+            client = _GoogleClient(source_code, target_code, self.timeout)
+        try:
+            yield client
+        finally:
+            pool.put(client)
+
+    def translate(self, text: str, source_code: str, target_code: str) -> Optional[str]:
+        text = text.strip()
+        if not text or source_code == target_code:
+            return text
+        with self._client(source_code, target_code) as client:
+            return client.translate(text)
+
+    def close(self):
+        with self._lock:
+            pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            while True:
+                try:
+                    pool.get_nowait().session.close()
+                except queue.Empty:
+                    break
+
+
+class StubBackend(TranslationBackend):
+    """Local, deterministic translator: prefixes every line with the target code."""
+
+    name = "stub"
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+
+    def translate(self, text: str, source_code: str, target_code: str) -> Optional[str]:
+        if self.latency:
+            time.sleep(self.latency)
+        return "\n".join(f"[{target_code}] {line}" for line in text.split("\n"))
+
+
+class CircuitBreaker:
+    """Fail fast after repeated upstream errors, probing again after a cool-down."""
+
+    def __init__(self, threshold: int = Settings.TRANSLATION_BREAKER_THRESHOLD,
+                 reset_seconds: float = Settings.TRANSLATION_BREAKER_RESET_SECONDS):
+        self.threshold = threshold
+        self.reset_seconds = reset_seconds
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if self._probing or time.monotonic() - self._opened_at >= self.reset_seconds:
+                return "half-open"
+            return "open"
+
+    def allow(self) -> bool:
+        """Return whether a request may go upstream now.
+
+        While open, only the first caller after the cool-down is let through,
+        as the probe.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._probing or time.monotonic() - self._opened_at < self.reset_seconds:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_inconclusive(self):
+        """Note a request that neither proved nor disproved the upstream's health.
+
+        A probe that ends this way leaves the breaker open but lets the next
+        caller probe again.
+        """
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self) -> bool:
+        """Count a failure; return True if this opened the breaker."""
+        with self._lock:
+            self._failures += 1
+            if self._probing or (self._opened_at is None and self._failures >= self.threshold):
+                self._opened_at = time.monotonic()
+                self._probing = False
+                return True
+            return False
+
+
+def create_translation_backend(name: str) -> TranslationBackend:
+    """Create the translation backend called ``name`` ("google" or "stub")."""
+    if name == GoogleBackend.name:
+        return GoogleBackend()
+    if name == StubBackend.name:
+        return StubBackend()
+    raise ValueError(f"Unknown translation backend: {name}")
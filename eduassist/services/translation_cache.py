@@ -0,0 +1,198 @@
+"""Persistent translation store with an in-process LRU in front.
+
+Translations live in a SQLite table keyed by the SHA-256 of the source text
+plus the source and target language codes. Every process of a replica reads
+and writes the same table, so a string is translated once per language there
+and survives restarts. The file is per replica: SQLite's WAL mode needs shared
+memory on one host, so ``TRANSLATION_DB_PATH`` must not point at a network
+filesystem shared between replicas. The table is bounded: beyond
+``max_entries`` rows, the least recently used ones are pruned. Reads never
+write: the times entries are used, whether served from memory or SQLite, are
+collected in memory and written to ``last_used`` in one batch every
+``touch_flush_seconds`` (and before pruning), so pruning sees real recency
+without a write lock on every lookup.
+
+Entries older than ``stale_seconds`` are still served, but reported as stale
+so the caller can refresh them in the background (stale-while-revalidate).
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Sequence, Tuple
+
+from ..config.settings import Settings
+from ..utils.registry import get_registry
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    source_hash TEXT NOT NULL,
+    source_lang TEXT NOT NULL,
+    target_lang TEXT NOT NULL,
+    source_text TEXT NOT NULL,
+    translated TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (source_hash, source_lang, target_lang)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS translations_last_used ON translations (last_used);
+"""
+
+CacheKey = Tuple[str, str, str]
+CachedTranslation = Tuple[str, bool]
+
+
+def source_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class TranslationStore:
+    """SQLite-backed translation cache with a bounded in-memory LRU."""
+
+    SQLITE_MAX_PARAMETERS = 900
+
+    def __init__(self, db_path: str = Settings.TRANSLATION_DB_PATH,
+                 memory_size: int = Settings.TRANSLATION_MEMORY_CACHE_SIZE,
+                 max_entries: int = Settings.TRANSLATION_STORE_MAX_ENTRIES,
+                 stale_seconds: float = Settings.TRANSLATION_STALE_SECONDS,
+                 touch_flush_seconds: float = Settings.TRANSLATION_TOUCH_FLUSH_SECONDS):
+        self.db_path = db_path
+        self.memory_size = memory_size
+        self.max_entries = max_entries
+        self.stale_seconds = stale_seconds
+        self.touch_flush_seconds = touch_flush_seconds
+        self._memory: "OrderedDict[CacheKey, Tuple[str, float]]" = OrderedDict()
+        self._touched: Dict[CacheKey, float] = {}
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+        self._writes_since_prune = 0
+
+    def close(self):
+        with self._lock:
+            self._flush_touched()
+            self._conn.close()
+
+    def _remember(self, key: CacheKey, translated: str, updated_at: float):
+        self._memory[key] = (translated, updated_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def get_many(self, texts: Sequence[str], source_lang: str, target_lang: str) -> Dict[str, CachedTranslation]:
+        """
+        Look up cached translations, first in memory and then in SQLite.
+
+        Args:
+            texts: Distinct source texts
+            source_lang: Source language code
+            target_lang: Target language code
+
+        Returns:
+            (translation, is_stale) keyed by source text, for the texts found
+        """
+        now = time.time()
+        found: Dict[str, Tuple[str, float]] = {}
+        with self._lock:
+            pending: Dict[str, str] = {}
+            for text in texts:
+                entry = self._memory.get((text, source_lang, target_lang))
+                if entry is None:
+                    pending[source_hash(text)] = text
+                else:
+                    self._memory.move_to_end((text, source_lang, target_lang))
+                    self._touched[(text, source_lang, target_lang)] = now
+                    found[text] = entry
+
+            hashes = list(pending)
+            for start in range(0, len(hashes), self.SQLITE_MAX_PARAMETERS):
+                chunk = hashes[start:start + self.SQLITE_MAX_PARAMETERS]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT source_hash, translated, updated_at FROM translations "
+                    f"WHERE source_lang = ? AND target_lang = ? AND source_hash IN ({placeholders})",
+                    (source_lang, target_lang, *chunk)
+                ).fetchall()
+                for digest, translated, updated_at in rows:
+                    text = pending[digest]
+                    self._remember((text, source_lang, target_lang), translated, updated_at)
+                    self._touched[(text, source_lang, target_lang)] = now
+                    found[text] = (translated, updated_at)
+
+            if (len(self._touched) >= self.memory_size
+                    or time.monotonic() - self._last_flush >= self.touch_flush_seconds):
+                self._flush_touched()
+
+        return {text: (translated, now - updated_at > self.stale_seconds)
+                for text, (translated, updated_at) in found.items()}
+
+    def put_many(self, translations: Dict[str, str], source_lang: str, target_lang: str):
+        """Store or refresh translations keyed by source text."""
+        if not translations:
+            return
+        now = time.time()
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO translations "
+                    "(source_hash, source_lang, target_lang, source_text, translated, updated_at, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [(source_hash(text), source_lang, target_lang, text, translated, now, now)
+                     for text, translated in translations.items()]
+                )
+            for text, translated in translations.items():
+                self._remember((text, source_lang, target_lang), translated, now)
+            self._writes_since_prune += len(translations)
+            if self._writes_since_prune >= max(self.max_entries // 10, 1):
+                self._prune()
+
+    def _flush_touched(self):
+        """Write the collected use times to ``last_used`` in one transaction."""
+        self._last_flush = time.monotonic()
+        if not self._touched:
+            return
+        touched, self._touched = self._touched, {}
+        with self._conn:
+            self._conn.executemany(
+                "UPDATE translations SET last_used = MAX(last_used, ?) "
+                "WHERE source_hash = ? AND source_lang = ? AND target_lang = ?",
+                [(used, source_hash(text), source_lang, target_lang)
+                 for (text, source_lang, target_lang), used in touched.items()]
+            )
+
+    def _prune(self):
+        """Delete the least recently used rows beyond ``max_entries``."""
+        self._writes_since_prune = 0
+        self._flush_touched()
+        with self._conn:
+            count = self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+            if count > self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM translations WHERE (source_hash, source_lang, target_lang) IN "
+                    "(SELECT source_hash, source_lang, target_lang FROM translations ORDER BY last_used LIMIT ?)",
+                    (count - self.max_entries,)
+                )
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+
+    def clear(self):
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM translations")
+            self._memory.clear()
+            self._touched.clear()
+
+
+get_registry().register("translation_store", TranslationStore, TranslationStore.close)
+
+
+def get_translation_store() -> TranslationStore:
+    """Get or create the process-wide translation store."""
+    return get_registry().get("translation_store")
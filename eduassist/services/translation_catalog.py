@@ -0,0 +1,207 @@
+"""Precompiled UI translation catalogs.
+
+UI strings are static English literals, so they are translated once at build
+time instead of on every cold render. ``extract`` walks the sources with
+``ast`` and collects the literals passed to the translation helpers, following
+module-level constants such as ``HEADER_TEXT`` or ``CATEGORIES`` (including
+ones imported from another module). ``build`` pre-translates them into one
+catalog file per language, ``<catalog dir>/<code>.json``, translating only
+strings the existing catalog lacks::
+
+    python -m eduassist.services.translation_catalog build
+    python -m eduassist.services.translation_catalog check
+
+At runtime ``translation_service.get_catalog`` loads a language's catalog
+once, and ``translate_text`` resolves hits with a dictionary lookup, without
+touching the translation store or the network. The runtime side lives there so
+that importing the app never imports this tool.
+"""
+
+import ast
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from ..config.settings import Settings
+from .translation_service import LANGUAGE_CODES, _translate_upstream, catalog_path, read_catalog
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+
+# Translation helpers and the position of the argument holding the texts
+TRANSLATION_CALLS = {
+    "translate_text": 0,
+    "translate_many": 0,
+    "translate_ui_elements": 0,
+    "prefetch_page_text": 1,
+}
+
+DEFAULT_SOURCES = ("main.py", "eduassist")
+
+class _Module:
+    """A parsed source file with its module-level constants and imports."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+        self.constants: Dict[str, ast.expr] = {}
+        self.imports: Dict[str, tuple] = {}
+        for node in self.tree.body:
+            if isinstance(node, ast.Assign):
+                for target in node.targets:
+                    if isinstance(target, ast.Name):
+                        self.constants[target.id] = node.value
+            elif isinstance(node, ast.ImportFrom):
+                for alias in node.names:
+                    self.imports[alias.asname or alias.name] = (node.module or "", node.level, alias.name)
+
+
+class _Extractor:
+    def __init__(self, root: Path):
+        self.root = root
+        self._modules: Dict[Path, Optional[_Module]] = {}
+
+    def module(self, path: Path) -> Optional[_Module]:
+        if path not in self._modules:
+            try:
+                self._modules[path] = _Module(path)
+            except (OSError, SyntaxError) as e:
+                print(f"Skipping {path}: {e}")
+                self._modules[path] = None
+        return self._modules[path]
+
+    def _import_path(self, module: _Module, name: str, level: int) -> Path:
+        base = module.path.parent
+        for _ in range(level - 1):
+            base = base.parent
+        if not level:
+            base = self.root
+        target = base.joinpath(*name.split(".")) if name else base
+        return target.with_suffix(".py") if not target.is_dir() else target / "__init__.py"
+
+    def resolve(self, module: _Module, name: str, depth: int) -> Iterable[str]:
+        if name in module.constants:
+            yield from self.strings(module, module.constants[name], depth + 1)
+        elif name in module.imports:
+            source, level, original = module.imports[name]
+            imported = self.module(self._import_path(module, source, level))
+            if imported is not None:
+                yield from self.resolve(imported, original, depth + 1)
+
+    def strings(self, module: _Module, node: ast.expr, depth: int = 0) -> Iterable[str]:
+        """Yield the string literals an argument expression can evaluate to."""
+        if depth > 8:
+            return
+        if isinstance(node, ast.Constant):
+            if isinstance(node.value, str) and node.value.strip():
+                yield node.value
+        elif isinstance(node, ast.Name):
+            yield from self.resolve(module, node.id, depth)
+        elif isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+            for item in node.elts:
+                yield from self.strings(module, item, depth)
+        elif isinstance(node, ast.Dict):
+            for value in node.values:
+                yield from self.strings(module, value, depth)
+        elif isinstance(node, ast.BoolOp):
+            for value in node.values:
+                yield from self.strings(module, value, depth)
+        elif isinstance(node, ast.IfExp):
+            yield from self.strings(module, node.body, depth)
+            yield from self.strings(module, node.orelse, depth)
+        elif isinstance(node, ast.BinOp):
+            yield from self.strings(module, node.left, depth)
+            yield from self.strings(module, node.right, depth)
+
+    def calls(self, path: Path) -> Iterable[str]:
+        module = self.module(path)
+        if module is None:
+            return
+        for node in ast.walk(module.tree):
+            if not isinstance(node, ast.Call):
+                continue
+            func = node.func
+            name = func.id if isinstance(func, ast.Name) else func.attr if isinstance(func, ast.Attribute) else None
+            position = TRANSLATION_CALLS.get(name)
+            if position is not None and len(node.args) > position:
+                yield from self.strings(module, node.args[position])
+
+
+def extract(sources: Iterable[str] = DEFAULT_SOURCES, root: Path = ROOT) -> List[str]:
+    """
+    Collect the static UI strings passed to the translation helpers.
+
+    Args:
+        sources: Files or directories, relative to ``root``
+        root: Repository root, used to resolve absolute imports
+
+    Returns:
+        Sorted distinct strings
+    """
+    extractor = _Extractor(root)
+    found: Set[str] = set()
+    for source in sources:
+        path = root / source
+        files = sorted(path.rglob("*.py")) if path.is_dir() else [path]
+        for file in files:
+            found.update(extractor.calls(file))
+    return sorted(found)
+
+
+def build(catalog_dir: str = Settings.TRANSLATION_CATALOG_DIR,
+          sources: Iterable[str] = DEFAULT_SOURCES) -> Dict[str, int]:
+    """
+    Pre-translate the extracted strings into a catalog file per language.
+
+    Strings already in a catalog are kept, strings no longer in the sources are
+    dropped, and only the rest are sent upstream.
+
+    Args:
+        catalog_dir: Directory for the catalog files
+        sources: Files or directories to extract strings from
+
+    Returns:
+        Number of strings still untranslated, per language code
+    """
+    strings = extract(sources)
+    os.makedirs(catalog_dir, exist_ok=True)
+    untranslated = {}
+    for code in sorted(set(LANGUAGE_CODES.values()) - {"en"}):
+        path = catalog_path(code, catalog_dir)
+        existing = read_catalog(path)
+        catalog = {text: existing[text] for text in strings if text in existing}
+        missing = [text for text in strings if text not in catalog]
+        if missing:
+            catalog.update(_translate_upstream(missing, "en", code))
+        untranslated[code] = len(strings) - len(catalog)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"language": code, "strings": dict(sorted(catalog.items()))}, f, ensure_ascii=False, indent=0)
+    return untranslated
+
+
+def check(catalog_dir: str = Settings.TRANSLATION_CATALOG_DIR,
+          sources: Iterable[str] = DEFAULT_SOURCES) -> Dict[str, int]:
+    """Return, per language code, how many extracted strings its catalog lacks."""
+    strings = extract(sources)
+    missing = {}
+    for code in sorted(set(LANGUAGE_CODES.values()) - {"en"}):
+        catalog = read_catalog(catalog_path(code, catalog_dir))
+        missing[code] = sum(text not in catalog for text in strings)
+    return missing
+
+
+if __name__ == "__main__":
+    commands = ("extract", "build", "check")
+    if len(sys.argv) < 2 or sys.argv[1] not in commands:
+        print("Usage: python -m eduassist.services.translation_catalog <extract|build|check> [catalog_dir]")
+        sys.exit(1)
+    command = sys.argv[1]
+    target_dir = sys.argv[2] if len(sys.argv) > 2 else Settings.TRANSLATION_CATALOG_DIR
+    if command == "extract":
+        print("\n".join(extract()))
+        sys.exit(0)
+    missing = build(target_dir) if command == "build" else check(target_dir)
+    for code, count in missing.items():
+        print(f"{code}: {count} untranslated")
+    sys.exit(1 if command == "check" and any(missing.values()) else 0)
@@ -1,8 +1,16 @@
-"""Translation service using deep-translator for multilingual support."""
+"""Translation service with pluggable machine translation backends for multilingual support."""
 
-from deep_translator import GoogleTranslator
-from typing import Optional
-import streamlit as st
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..config.settings import Settings
+from ..utils.registry import get_registry
+from .translation_backends import CircuitBreaker, TranslationBackend, UpstreamError, create_translation_backend
+from .translation_cache import get_translation_store
 
 LANGUAGE_CODES = {
     "english": "en",
@@ -43,21 +51,287 @@ LANGUAGE_NATIVE = {
     "malayalam": "മലയാളം"
 }
 
-@st.cache_data(ttl=3600)
-def translate_text(text: str, target_lang: str, source_lang: str = "en") -> str:
-    """Translate text to target language."""
-    if not text or target_lang == "english" or target_lang == source_lang:
-        return text
-    
+BATCH_SEPARATOR = "\n"
+
+_upstream_executor = ThreadPoolExecutor(max_workers=Settings.TRANSLATION_WORKERS, thread_name_prefix="translation")
+_in_flight: Dict[Tuple[str, str, str], Future] = {}
+_in_flight_lock = threading.Lock()
+_render = threading.local()
+_catalogs: Dict[str, Dict[str, str]] = {}
+_catalogs_lock = threading.Lock()
+_breaker = CircuitBreaker()
+
+get_registry().register("translation_backend", lambda: create_translation_backend(Settings.TRANSLATION_BACKEND),
+                        TranslationBackend.close)
+
+
+def get_translation_backend() -> TranslationBackend:
+    """Get the process-wide translation backend selected by ``Settings.TRANSLATION_BACKEND``."""
+    return get_registry().get("translation_backend")
+
+
+def catalog_path(code: str, catalog_dir: str = Settings.TRANSLATION_CATALOG_DIR) -> str:
+    return os.path.join(catalog_dir, f"{code}.json")
+
+
+def read_catalog(path: str) -> Dict[str, str]:
+    """Read a catalog file, returning an empty catalog if it is missing or unreadable."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)["strings"]
+    except FileNotFoundError:
+        return {}
+    except (json.JSONDecodeError, KeyError, TypeError) as e:
+        print(f"Could not read translation catalog {path}: {e}")
+        return {}
+
+
+def get_catalog(code: str) -> Dict[str, str]:
+    """Get the precompiled UI catalog of a target language code, loading it on first use.
+
+    Catalogs are built by ``python -m eduassist.services.translation_catalog build``.
+    """
+    catalog = _catalogs.get(code)
+    if catalog is None:
+        with _catalogs_lock:
+            catalog = _catalogs.get(code)
+            if catalog is None:
+                catalog = read_catalog(catalog_path(code)) if code != "en" else {}
+                _catalogs[code] = catalog
+    return catalog
+
+
+def _language_codes(target_lang: str, source_lang: str) -> Tuple[str, str]:
     target_code = LANGUAGE_CODES.get(target_lang, "en")
     source_code = LANGUAGE_CODES.get(source_lang, "en") if source_lang != "en" else "en"
+    return source_code, target_code
+
+
+def _pack_batches(texts: Sequence[str], max_chars: int) -> List[List[str]]:
+    """Group texts into newline-joined requests of at most ``max_chars``.
+    
+    Texts containing a newline, or longer than ``max_chars``, get a request
+    of their own.
+    """
+    batches: List[List[str]] = []
+    current: List[str] = []
+    size = 0
+    for text in texts:
+        if BATCH_SEPARATOR in text or len(text) > max_chars:
+            batches.append([text])
+            continue
+        if current and size + len(BATCH_SEPARATOR) + len(text) > max_chars:
+            batches.append(current)
+            current, size = [], 0
+        size += len(text) + (len(BATCH_SEPARATOR) if current else 0)
+        current.append(text)
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _request(text: str, source_code: str, target_code: str) -> Optional[str]:
+    """
+    Send one request to the backend through the circuit breaker.
+    
+    Any exception from the backend counts as a failure; only a non-empty
+    translation counts as a success.
+    
+    Raises:
+        UpstreamError: The breaker is open, or the request failed
+    """
+    if not _breaker.allow():
+        raise UpstreamError("circuit open")
+    try:
+        translated = get_translation_backend().translate(text, source_code, target_code)
+    except Exception as e:
+        if not isinstance(e, UpstreamError):
+            print(f"Error translating text: {e}")
+        if _breaker.record_failure():
+            print(f"Translation upstream failing ({e}); serving source text for "
+                  f"{_breaker.reset_seconds}s")
+        raise UpstreamError(str(e)) from e
+    if translated:
+        _breaker.record_success()
+    else:
+        _breaker.record_inconclusive()
+    return translated
+
+
+def _translate_upstream(texts: Sequence[str], source_code: str, target_code: str) -> Dict[str, str]:
+    """
+    Translate texts with as few upstream requests as possible.
+    
+    Each packed request is translated as one newline-separated text. The
+    response is split into lines, blank lines dropped and each line stripped;
+    if that does not give one line per text, the texts of that request are
+    translated one by one. Once a request fails, the rest of
+    its batch is skipped; while the circuit breaker is open, every request
+    fails fast.
     
+    Args:
+        texts: Distinct, non-empty texts
+        source_code: Source language code
+        target_code: Target language code
+        
+    Returns:
+        Translations keyed by source text; texts that failed are left out
+    """
+    results: Dict[str, str] = {}
+    for batch in _pack_batches(texts, Settings.TRANSLATION_BATCH_CHARS):
+        try:
+            if len(batch) > 1:
+                response = _request(BATCH_SEPARATOR.join(batch), source_code, target_code) or ""
+                lines = [line.strip() for line in response.split(BATCH_SEPARATOR) if line.strip()]
+                if len(lines) == len(batch):
+                    results.update(zip(batch, lines))
+                    continue
+            for text in batch:
+                translated = (_request(text, source_code, target_code) or "").strip()
+                if translated:
+                    results[text] = translated
+        except UpstreamError:
+            continue
+    return results
+
+
+def start_render_deadline(seconds: float = Settings.TRANSLATION_RENDER_DEADLINE_SECONDS):
+    """
+    Bound the time the current script run may spend waiting for translations.
+    
+    Streamlit runs each script run on its own thread, so the deadline is
+    thread-local and shared by every translation call of the run. Texts not
+    translated in time are shown untranslated; their translations keep
+    running in the background and are served from the store on the next rerun.
+    
+    Args:
+        seconds: Time budget from now
+    """
+    _render.deadline = time.monotonic() + seconds
+
+
+def _render_time_left() -> Optional[float]:
+    deadline = getattr(_render, "deadline", None)
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0.0)
+
+
+def _fetch(texts: Sequence[str], source_code: str, target_code: str) -> Dict[str, str]:
+    """Translate texts upstream and store the results."""
     try:
-        translator = GoogleTranslator(source=source_code, target=target_code)
-        translated = translator.translate(text)
-        return translated if translated else text
+        translated = _translate_upstream(texts, source_code, target_code)
+        get_translation_store().put_many(translated, source_code, target_code)
+        return translated
     except Exception as e:
+        print(f"Error fetching translations: {e}")
+        return {}
+
+
+def _finish(texts: Sequence[str], source_code: str, target_code: str, future: Future):
+    with _in_flight_lock:
+        for text in texts:
+            if _in_flight.get((text, source_code, target_code)) is future:
+                del _in_flight[(text, source_code, target_code)]
+
+
+def _submit(texts: Sequence[str], source_code: str, target_code: str) -> Dict[str, Future]:
+    """
+    Queue texts for upstream translation on the worker pool.
+    
+    Texts already being translated share the pending request; the others are
+    packed into batches, one task per batch, so batches run concurrently.
+    
+    Returns:
+        The future that will hold each text's translation, keyed by text
+    """
+    futures: Dict[str, Future] = {}
+    submitted = []
+    with _in_flight_lock:
+        new = []
+        for text in texts:
+            future = _in_flight.get((text, source_code, target_code))
+            if future is None:
+                new.append(text)
+            else:
+                futures[text] = future
+        for batch in _pack_batches(new, Settings.TRANSLATION_BATCH_CHARS):
+            future = _upstream_executor.submit(_fetch, batch, source_code, target_code)
+            submitted.append((batch, future))
+            for text in batch:
+                _in_flight[(text, source_code, target_code)] = future
+                futures[text] = future
+    for batch, future in submitted:
+        future.add_done_callback(lambda f, batch=batch: _finish(batch, source_code, target_code, f))
+    return futures
+
+
+def _fetch_within(texts: Sequence[str], source_code: str, target_code: str,
+                  timeout: Optional[float]) -> Dict[str, str]:
+    """Translate texts on the worker pool, returning those done within ``timeout`` seconds."""
+    futures = _submit(texts, source_code, target_code)
+    done, _ = wait(set(futures.values()), timeout=timeout)
+    results: Dict[str, str] = {}
+    for text, future in futures.items():
+        if future in done and text in future.result():
+            results[text] = future.result()[text]
+    return results
+
+
+def translate_many(texts: Sequence[str], target_lang: str, source_lang: str = "en") -> List[str]:
+    """
+    Translate several texts, fetching all uncached ones in as few requests as possible.
+    
+    English source strings are looked up in the precompiled catalog first.
+    The rest come from the shared translation store; stale entries are
+    served as they are and refreshed in the background. Uncached texts are
+    translated on the worker pool; during a script run with a render
+    deadline (``start_render_deadline``), those not done in time are
+    returned untranslated.
+    
+    Args:
+        texts: Texts to translate (duplicates and empty strings are fine)
+        target_lang: Target language key, e.g. "telugu"
+        source_lang: Source language key or "en"
+        
+    Returns:
+        Translations in the order of ``texts``; a text that could not be
+        translated is returned unchanged
+    """
+    if target_lang == "english" or target_lang == source_lang:
+        return list(texts)
+    source_code, target_code = _language_codes(target_lang, source_lang)
+    
+    catalog = get_catalog(target_code) if source_code == "en" else {}
+    translations = {text: catalog[text] for text in dict.fromkeys(texts) if text in catalog}
+    unique = [text for text in dict.fromkeys(texts) if text and text not in translations]
+    if not unique:
+        return [translations.get(text, text) for text in texts]
+    
+    store = get_translation_store()
+    cached = store.get_many(unique, source_code, target_code)
+    translations.update((text, translated) for text, (translated, _) in cached.items())
+    
+    stale = [text for text, (_, is_stale) in cached.items() if is_stale]
+    if stale:
+        _submit(stale, source_code, target_code)
+    
+    missing = [text for text in unique if text not in cached]
+    if missing:
+        translations.update(_fetch_within(missing, source_code, target_code, _render_time_left()))
+    
+    return [translations.get(text, text) if text else text for text in texts]
+
+
+def translate_text(text: str, target_lang: str, source_lang: str = "en") -> str:
+    """Translate text to target language, from the precompiled catalog when it has the text."""
+    if not text or target_lang == "english" or target_lang == source_lang:
         return text
+    if source_lang == "en":
+        translated = get_catalog(LANGUAGE_CODES.get(target_lang, "en")).get(text)
+        if translated is not None:
+            return translated
+    return translate_many([text], target_lang, source_lang)[0]
 
 def get_available_languages():
     """Return list of available languages with their details."""
@@ -67,16 +341,24 @@ def get_available_languages():
     ]
 
 def translate_ui_elements(elements: dict, target_lang: str) -> dict:
-    """Translate a dictionary of UI elements."""
+    """Translate a dictionary of UI elements with a single ``translate_many`` call."""
     if target_lang == "english":
         return elements
     
+    strings = []
+    for value in elements.values():
+        if isinstance(value, str):
+            strings.append(value)
+        elif isinstance(value, list):
+            strings.extend(item for item in value if isinstance(item, str))
+    lookup = dict(zip(strings, translate_many(strings, target_lang)))
+    
     translated = {}
     for key, value in elements.items():
         if isinstance(value, str):
-            translated[key] = translate_text(value, target_lang)
+            translated[key] = lookup[value]
         elif isinstance(value, list):
-            translated[key] = [translate_text(item, target_lang) if isinstance(item, str) else item for item in value]
+            translated[key] = [lookup[item] if isinstance(item, str) else item for item in value]
         else:
             translated[key] = value
     return translated
@@ -0,0 +1,602 @@
+"""Vector storage backends behind ``EmbeddingService``.
+
+``EmbeddingService`` embeds texts itself and talks to its store only through
+the ``VectorBackend`` interface, so the store can be swapped by setting
+``Settings.VECTOR_BACKEND``:
+
+    numpy   NumpyFlatBackend - exact search over an in-memory float32 matrix,
+                               optionally through compressed int8 codes
+    chroma  ChromaBackend    - ChromaDB persistent collection (HNSW + SQLite),
+                               split per subject by PartitionedBackend
+
+A ``subject_filter`` is one subject or a sequence of subjects. Results are
+dictionaries with ``id``, ``document``, ``metadata``,
+``distance`` (cosine distance) and ``similarity`` (``1 - distance / 2``).
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..config.settings import Settings
+from .vector_compression import VectorQuantizer
+
+SubjectFilter = Optional[Union[str, Sequence[str]]]
+
+
+def _subjects(subject_filter: SubjectFilter) -> Optional[List[str]]:
+    """Normalize a subject filter to a list of distinct subjects, or None for no filter."""
+    if not subject_filter:
+        return None
+    if isinstance(subject_filter, str):
+        return [subject_filter]
+    return list(dict.fromkeys(subject_filter))
+
+
+class VectorBackend:
+    """Interface every vector store implements."""
+
+    name = ""
+
+    def ids(self) -> List[str]:
+        """Return every stored document id."""
+        raise NotImplementedError
+
+    def ids_with_hashes(self, content_hashes: Sequence[str]) -> List[str]:
+        """Return ids of documents whose ``content_hash`` metadata is in ``content_hashes``."""
+        raise NotImplementedError
+
+    def upsert(self, ids: Sequence[str], embeddings: Sequence, documents: Sequence[str],
+               metadatas: Sequence[Dict]):
+        """Insert documents or replace the ones with the same id."""
+        raise NotImplementedError
+
+    def delete(self, ids: Sequence[str]):
+        """Remove documents by id."""
+        raise NotImplementedError
+
+    def query(self, embeddings: Sequence, n_results: int,
+              subject_filter: SubjectFilter = None) -> List[List[Dict]]:
+        """Return the ``n_results`` nearest documents for each query embedding."""
+        raise NotImplementedError
+
+    def count(self) -> int:
+        """Return the number of stored documents."""
+        raise NotImplementedError
+
+    def clear(self):
+        """Remove every document."""
+        raise NotImplementedError
+
+    def flush(self):
+        """Persist pending changes; a no-op for stores that write through."""
+
+
+def _top_k(similarities: np.ndarray, k: int) -> np.ndarray:
+    """Return the columns of the ``k`` largest values per row, best first."""
+    k = min(k, similarities.shape[1])
+    if k < similarities.shape[1]:
+        top = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+    else:
+        top = np.tile(np.arange(similarities.shape[1]), (len(similarities), 1))
+    order = np.argsort(-np.take_along_axis(similarities, top, axis=1), axis=1, kind="stable")
+    return np.take_along_axis(top, order, axis=1)
+
+
+def _result(doc_id: str, document: str, metadata: Dict, distance: float) -> Dict:
+    return {
+        "id": doc_id,
+        "document": document,
+        "metadata": metadata,
+        "distance": distance,
+        "similarity": 1.0 - (distance / 2.0)
+    }
+
+
+def hnsw_settings() -> Dict[str, int]:
+    """HNSW graph parameters from ``Settings``, keyed as ChromaDB's collection configuration expects."""
+    return {
+        "max_neighbors": Settings.VECTOR_HNSW_M,
+        "ef_construction": Settings.VECTOR_HNSW_EF_CONSTRUCTION,
+        "ef_search": Settings.VECTOR_HNSW_EF_SEARCH,
+    }
+
+
+class ChromaBackend(VectorBackend):
+    """ChromaDB persistent collection with cosine HNSW search.
+
+    ``max_neighbors`` (M) and ``ef_construction`` only apply when a
+    collection is created, so changing them requires a rebuild
+    (``clear_collection`` followed by a sync). ``ef_search`` is updated on
+    existing collections when they are opened, and applies once the process
+    loads the index.
+    """
+
+    name = "chroma"
+    COLLECTION_NAME = "knowledge_base"
+
+    def __init__(self, persist_directory: str, embedding_fn, collection_name: str = COLLECTION_NAME,
+                 hnsw: Optional[Dict[str, int]] = None):
+        import chromadb
+
+        self.embedding_fn = embedding_fn
+        self.collection_name = collection_name
+        self.hnsw = hnsw if hnsw is not None else hnsw_settings()
+        self.client = chromadb.PersistentClient(path=persist_directory)
+        self.collection = self._create_collection()
+
+    @classmethod
+    def partition_collection_name(cls, partition: str) -> str:
+        """Collection name for a ``PartitionedBackend`` partition (Chroma allows 3-63 safe characters)."""
+        if partition == PartitionedBackend.GLOBAL:
+            return cls.COLLECTION_NAME
+        safe = re.sub(r"[^A-Za-z0-9_-]", "_", partition)
+        name = f"{cls.COLLECTION_NAME}__{safe}"
+        if safe != partition or len(name) > 63 or not name[-1].isalnum():
+            name = f"{cls.COLLECTION_NAME}__{safe[:36]}_{hashlib.sha256(partition.encode('utf-8')).hexdigest()[:8]}"
+        return name
+
+    def _create_collection(self):
+        collection = self.client.get_or_create_collection(
+            name=self.collection_name,
+            embedding_function=self.embedding_fn,
+            configuration={"hnsw": {"space": "cosine", **self.hnsw}},
+            metadata={"description": "JNTU EduAssist knowledge base embeddings"}
+        )
+        current = (collection.configuration or {}).get("hnsw") or {}
+        if "ef_search" in self.hnsw and current.get("ef_search") != self.hnsw["ef_search"]:
+            collection.modify(configuration={"hnsw": {"ef_search": self.hnsw["ef_search"]}})
+        stale = [key for key in ("max_neighbors", "ef_construction")
+                 if key in self.hnsw and key in current and current[key] != self.hnsw[key]]
+        if stale:
+            print(f"Collection {self.collection_name} was built with different HNSW {', '.join(stale)}; "
+                  f"clear and re-sync it to apply the new values")
+        return collection
+
+    def ids(self) -> List[str]:
+        return self.collection.get(include=[])["ids"]
+
+    def ids_with_hashes(self, content_hashes: Sequence[str]) -> List[str]:
+        if not content_hashes:
+            return []
+        return self.collection.get(where={"content_hash": {"$in": list(content_hashes)}}, include=[])["ids"]
+
+    def upsert(self, ids, embeddings, documents, metadatas):
+        self.collection.upsert(ids=list(ids), embeddings=[np.asarray(v, dtype=np.float32) for v in embeddings],
+                               documents=list(documents), metadatas=list(metadatas))
+
+    def delete(self, ids):
+        if ids:
+            self.collection.delete(ids=list(ids))
+
+    def query(self, embeddings, n_results, subject_filter=None):
+        subjects = _subjects(subject_filter)
+        where = None
+        if subjects:
+            where = {"subject": subjects[0] if len(subjects) == 1 else {"$in": subjects}}
+        results = self.collection.query(
+            query_embeddings=[np.asarray(v, dtype=np.float32) for v in embeddings],
+            n_results=n_results,
+            where=where,
+            include=["documents", "metadatas", "distances"]
+        )
+        return [self._format_results(results, row) for row in range(len(embeddings))]
+
+    @staticmethod
+    def _format_results(results: Dict, row: int) -> List[Dict]:
+        """Convert one row of a ChromaDB query response into result dictionaries."""
+        if not results or not results.get("ids") or len(results["ids"]) <= row or not results["ids"][row]:
+            return []
+
+        formatted_results = []
+        for i, doc_id in enumerate(results["ids"][row]):
+            formatted_results.append(_result(
+                doc_id,
+                results["documents"][row][i] if results.get("documents") else "",
+                results["metadatas"][row][i] if results.get("metadatas") else {},
+                results["distances"][row][i] if results.get("distances") else 2.0
+            ))
+        return formatted_results
+
+    def count(self) -> int:
+        return self.collection.count()
+
+    def clear(self):
+        self.client.delete_collection(name=self.collection_name)
+        self.collection = self._create_collection()
+
+
+class NumpyFlatBackend(VectorBackend):
+    """Exact cosine search over a contiguous, L2-normalized float32 matrix.
+
+    A query is one matrix product plus ``np.argpartition`` for the top k.
+    Subject filters use row index arrays precomputed per subject, rebuilt
+    only after the stored documents change. The matrix and records are saved
+    to ``<persist_directory>/numpy_index`` on ``flush``.
+    
+    With ``compression="int8"`` queries scan int8 codes instead (optionally
+    after a PCA projection to ``pca_dim`` dimensions), and only the best
+    ``rerank_factor * n_results`` candidates are re-scored exactly. The
+    float32 matrix is then memory-mapped from disk after each flush, so it is
+    only paged in for those candidates.
+    """
+
+    name = "numpy"
+    DIRECTORY_NAME = "numpy_index"
+
+    def __init__(self, persist_directory: Optional[str] = None,
+                 compression: str = Settings.VECTOR_COMPRESSION,
+                 pca_dim: int = Settings.VECTOR_PCA_DIM,
+                 rerank_factor: int = Settings.VECTOR_RERANK_FACTOR):
+        if compression not in ("none", "int8"):
+            raise ValueError(f"Unknown vector compression: {compression}")
+        self.directory = os.path.join(persist_directory, self.DIRECTORY_NAME) if persist_directory else None
+        self.quantizer = VectorQuantizer(pca_dim) if compression == "int8" else None
+        self.rerank_factor = max(rerank_factor, 1)
+        self._codes: Optional[np.ndarray] = None
+        self._matrix = np.zeros((0, 0), dtype=np.float32)
+        self._size = 0
+        self._ids: List[str] = []
+        self._documents: List[str] = []
+        self._metadatas: List[Dict] = []
+        self._rows: Dict[str, int] = {}
+        self._subject_rows: Optional[Dict[str, np.ndarray]] = None
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        if not self.directory:
+            return
+        try:
+            matrix = np.load(os.path.join(self.directory, "vectors.npy"),
+                             mmap_mode="r" if self.quantizer is not None else None)
+            with open(os.path.join(self.directory, "records.json"), "r", encoding="utf-8") as f:
+                records = json.load(f)
+        except (FileNotFoundError, ValueError) as e:
+            if not isinstance(e, FileNotFoundError):
+                print(f"Could not load NumPy vector index from {self.directory}: {e}")
+            return
+        if len(records["ids"]) != matrix.shape[0]:
+            print(f"NumPy vector index in {self.directory} is inconsistent; starting empty")
+            return
+        self._matrix = matrix if self.quantizer is not None else np.ascontiguousarray(matrix, dtype=np.float32)
+        self._size = matrix.shape[0]
+        self._ids, self._documents, self._metadatas = records["ids"], records["documents"], records["metadatas"]
+        self._rows = {doc_id: row for row, doc_id in enumerate(self._ids)}
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """The stored, normalized vectors (one row per document)."""
+        return self._matrix[:self._size]
+
+    def _subject_index(self) -> Dict[str, np.ndarray]:
+        if self._subject_rows is None:
+            subjects: Dict[str, List[int]] = {}
+            for row, metadata in enumerate(self._metadatas):
+                subjects.setdefault(metadata.get("subject", ""), []).append(row)
+            self._subject_rows = {key: np.asarray(rows, dtype=np.int64) for key, rows in subjects.items()}
+        return self._subject_rows
+
+    def _compressed_codes(self) -> np.ndarray:
+        if self._codes is None:
+            self._codes = self.quantizer.fit(self.matrix).encode(self.matrix)
+        return self._codes
+
+    def _changed(self):
+        self._subject_rows = None
+        self._codes = None
+        self._dirty = True
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Bytes held in memory by the float32 matrix and by the compressed codes.
+
+        The float32 matrix counts as zero while it is memory-mapped from disk.
+        """
+        return {
+            "float_vectors": 0 if isinstance(self._matrix, np.memmap) else self.matrix.nbytes,
+            "compressed": self._codes.nbytes + self.quantizer.nbytes if self._codes is not None else 0,
+        }
+
+    def ids(self) -> List[str]:
+        return list(self._ids)
+
+    def ids_with_hashes(self, content_hashes):
+        wanted = set(content_hashes)
+        return [doc_id for doc_id, metadata in zip(self._ids, self._metadatas)
+                if metadata.get("content_hash") in wanted]
+
+    def upsert(self, ids, embeddings, documents, metadatas):
+        vectors = np.asarray([np.asarray(v, dtype=np.float32).ravel() for v in embeddings], dtype=np.float32)
+        if not len(vectors):
+            return
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors /= np.where(norms > 0, norms, 1.0)
+
+        if self._matrix.shape[1] != vectors.shape[1]:
+            if self._size:
+                raise ValueError(f"Embedding dimension {vectors.shape[1]} does not match index "
+                                 f"dimension {self._matrix.shape[1]}")
+            self._matrix = np.zeros((0, vectors.shape[1]), dtype=np.float32)
+        elif not self._matrix.flags.writeable:
+            self._matrix = np.array(self.matrix)
+
+        for doc_id, vector, document, metadata in zip(ids, vectors, documents, metadatas):
+            row = self._rows.get(doc_id)
+            if row is None:
+                if self._size == self._matrix.shape[0]:
+                    grown = np.zeros((max(2 * self._size, 64), self._matrix.shape[1]), dtype=np.float32)
+                    grown[:self._size] = self._matrix[:self._size]
+                    self._matrix = grown
+                row = self._size
+                self._size += 1
+                self._rows[doc_id] = row
+                self._ids.append(doc_id)
+                self._documents.append(document)
+                self._metadatas.append(metadata)
+            else:
+                self._documents[row] = document
+                self._metadatas[row] = metadata
+            self._matrix[row] = vector
+        self._changed()
+
+    def delete(self, ids):
+        doomed = {self._rows[doc_id] for doc_id in ids if doc_id in self._rows}
+        if not doomed:
+            return
+        keep = np.asarray([row for row in range(self._size) if row not in doomed], dtype=np.int64)
+        self._matrix = np.ascontiguousarray(self._matrix[keep])
+        self._size = len(keep)
+        self._ids = [self._ids[row] for row in keep]
+        self._documents = [self._documents[row] for row in keep]
+        self._metadatas = [self._metadatas[row] for row in keep]
+        self._rows = {doc_id: row for row, doc_id in enumerate(self._ids)}
+        self._changed()
+
+    def query(self, embeddings, n_results, subject_filter=None):
+        queries = np.asarray([np.asarray(v, dtype=np.float32).ravel() for v in embeddings], dtype=np.float32)
+        if not self._size or not len(queries) or n_results <= 0:
+            return [[] for _ in range(len(queries))]
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        queries /= np.where(norms > 0, norms, 1.0)
+
+        subjects = _subjects(subject_filter)
+        if subjects:
+            index = self._subject_index()
+            parts = [index[subject] for subject in subjects if subject in index]
+            if not parts:
+                return [[] for _ in range(len(queries))]
+            rows = parts[0] if len(parts) == 1 else np.concatenate(parts)
+        else:
+            rows = None
+
+        if self.quantizer is not None:
+            top, scores = self._compressed_search(queries, rows, n_results)
+        else:
+            similarities = queries @ (self.matrix if rows is None else self._matrix[rows]).T
+            top = _top_k(similarities, n_results)
+            scores = np.take_along_axis(similarities, top, axis=1)
+
+        all_results = []
+        for query_row, candidates in enumerate(top):
+            results = []
+            for column, score in zip(candidates, scores[query_row]):
+                row = int(column if rows is None else rows[column])
+                distance = 1.0 - float(score)
+                results.append(_result(self._ids[row], self._documents[row], self._metadatas[row], distance))
+            all_results.append(results)
+        return all_results
+
+    def _compressed_search(self, queries: np.ndarray, rows: Optional[np.ndarray],
+                           n_results: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Pick candidates from the int8 codes and re-rank them on the float32 vectors."""
+        codes = self._compressed_codes()
+        approximate = self.quantizer.score(queries, codes if rows is None else codes[rows])
+        candidates = _top_k(approximate, n_results * self.rerank_factor)
+        stored = candidates if rows is None else rows[candidates]
+        exact = np.einsum("qd,qcd->qc", queries, self.matrix[stored])
+        order = _top_k(exact, n_results)
+        return np.take_along_axis(candidates, order, axis=1), np.take_along_axis(exact, order, axis=1)
+
+    def count(self) -> int:
+        return self._size
+
+    def clear(self):
+        self._matrix = np.zeros((0, self._matrix.shape[1]), dtype=np.float32)
+        self._size = 0
+        self._ids, self._documents, self._metadatas = [], [], []
+        self._rows = {}
+        self._changed()
+        self.flush()
+
+    def flush(self):
+        if not self._dirty or not self.directory:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        records = json.dumps({"ids": self._ids, "documents": self._documents, "metadatas": self._metadatas},
+                             ensure_ascii=False).encode("utf-8")
+        for file_name, write in (("vectors.npy", lambda f: np.save(f, self.matrix)),
+                                 ("records.json", lambda f: f.write(records))):
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    write(f)
+                os.replace(tmp_path, os.path.join(self.directory, file_name))
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+        self._dirty = False
+        if self.quantizer is not None and self._size:
+            self._matrix = np.load(os.path.join(self.directory, "vectors.npy"), mmap_mode="r")
+
+
+def _merge(result_lists: Sequence[List[Dict]], n_results: int) -> List[Dict]:
+    """Merge per-partition results for one query into the ``n_results`` closest."""
+    merged = [result for results in result_lists for result in results]
+    merged.sort(key=lambda result: result["distance"])
+    return merged[:n_results]
+
+
+class PartitionedBackend(VectorBackend):
+    """One backend per subject, plus an optional global backend holding every document.
+
+    A filtered query is routed only to the partitions of the requested
+    subjects and their results are merged by distance, so a small subject is
+    searched in its own index instead of through a metadata filter on one
+    large graph. Unfiltered queries use the global partition, or fan out to
+    every partition when there is none. Partition names are recorded in
+    ``partitions.json`` under the persist directory.
+    """
+
+    GLOBAL = "_global"
+    MANIFEST_NAME = "partitions.json"
+
+    def __init__(self, persist_directory: Optional[str], make_partition: Callable[[str], VectorBackend],
+                 global_partition: bool = True):
+        self.make_partition = make_partition
+        self.manifest_path = os.path.join(persist_directory, self.MANIFEST_NAME) if persist_directory else None
+        self.partitions: Dict[str, VectorBackend] = {}
+        self.global_partition = make_partition(self.GLOBAL) if global_partition else None
+        self.name = f"{self.global_partition.name if self.global_partition else 'partitioned'}/subject"
+        self._owners: Optional[Dict[str, str]] = None
+        for subject in self._read_manifest():
+            self.partitions[subject] = make_partition(subject)
+
+    def _read_manifest(self) -> List[str]:
+        if not self.manifest_path:
+            return []
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return []
+        except ValueError as e:
+            print(f"Could not read vector partition manifest {self.manifest_path}: {e}")
+            return []
+
+    def _write_manifest(self):
+        if not self.manifest_path:
+            return
+        directory = os.path.dirname(self.manifest_path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(sorted(self.partitions), f)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _partition(self, subject: str) -> VectorBackend:
+        partition = self.partitions.get(subject)
+        if partition is None:
+            partition = self.partitions[subject] = self.make_partition(subject)
+            self._write_manifest()
+        return partition
+
+    def _document_owners(self) -> Dict[str, str]:
+        """Map each stored id to its subject partition, built on first use."""
+        if self._owners is None:
+            self._owners = {doc_id: subject for subject, partition in self.partitions.items()
+                            for doc_id in partition.ids()}
+        return self._owners
+
+    def ids(self) -> List[str]:
+        stored = dict.fromkeys(self._document_owners())
+        if self.global_partition is not None:
+            stored.update(dict.fromkeys(self.global_partition.ids()))
+        return list(stored)
+
+    def ids_with_hashes(self, content_hashes):
+        """Ids stored with a current hash in their subject partition and, if kept, the global one."""
+        found = [doc_id for partition in self.partitions.values()
+                 for doc_id in partition.ids_with_hashes(content_hashes)]
+        if self.global_partition is not None:
+            in_global = set(self.global_partition.ids_with_hashes(content_hashes))
+            found = [doc_id for doc_id in found if doc_id in in_global]
+        return found
+
+    def upsert(self, ids, embeddings, documents, metadatas):
+        owners = self._document_owners()
+        groups: Dict[str, List[int]] = {}
+        moved: Dict[str, List[str]] = {}
+        for i, (doc_id, metadata) in enumerate(zip(ids, metadatas)):
+            subject = metadata.get("subject") or ""
+            groups.setdefault(subject, []).append(i)
+            previous = owners.get(doc_id)
+            if previous is not None and previous != subject:
+                moved.setdefault(previous, []).append(doc_id)
+            owners[doc_id] = subject
+
+        for subject, moved_ids in moved.items():
+            self.partitions[subject].delete(moved_ids)
+        for subject, rows in groups.items():
+            self._partition(subject).upsert([ids[i] for i in rows], [embeddings[i] for i in rows],
+                                            [documents[i] for i in rows], [metadatas[i] for i in rows])
+        if self.global_partition is not None:
+            self.global_partition.upsert(ids, embeddings, documents, metadatas)
+
+    def delete(self, ids):
+        owners = self._document_owners()
+        groups: Dict[str, List[str]] = {}
+        for doc_id in ids:
+            subject = owners.pop(doc_id, None)
+            if subject is not None:
+                groups.setdefault(subject, []).append(doc_id)
+        for subject, subject_ids in groups.items():
+            self.partitions[subject].delete(subject_ids)
+        if self.global_partition is not None:
+            self.global_partition.delete(ids)
+
+    def query(self, embeddings, n_results, subject_filter=None):
+        subjects = _subjects(subject_filter)
+        if subjects is None and self.global_partition is not None:
+            return self.global_partition.query(embeddings, n_results)
+        targets = [self.partitions[s] for s in (subjects or self.partitions) if s in self.partitions]
+        if len(targets) == 1:
+            return targets[0].query(embeddings, n_results)
+        per_partition = [target.query(embeddings, n_results) for target in targets]
+        return [_merge([results[row] for results in per_partition], n_results) for row in range(len(embeddings))]
+
+    def count(self) -> int:
+        if self.global_partition is not None:
+            return self.global_partition.count()
+        return sum(partition.count() for partition in self.partitions.values())
+
+    def clear(self):
+        for partition in self.partitions.values():
+            partition.clear()
+        if self.global_partition is not None:
+            self.global_partition.clear()
+        self._owners = {}
+
+    def flush(self):
+        for partition in self.partitions.values():
+            partition.flush()
+        if self.global_partition is not None:
+            self.global_partition.flush()
+
+
+def create_backend(name: str, persist_directory: str, embedding_fn,
+                   partitioned: Optional[bool] = None) -> VectorBackend:
+    """Create the vector backend called ``name`` ("numpy" or "chroma").
+
+    ChromaDB is split into per-subject collections when ``partitioned`` (by
+    default ``Settings.VECTOR_SUBJECT_PARTITIONS``) is true. The NumPy
+    backend already searches a subject through its own row index array, so
+    it is never wrapped.
+    """
+    if name == NumpyFlatBackend.name:
+        return NumpyFlatBackend(persist_directory)
+    if name == ChromaBackend.name:
+        if not (Settings.VECTOR_SUBJECT_PARTITIONS if partitioned is None else partitioned):
+            return ChromaBackend(persist_directory, embedding_fn)
+        return PartitionedBackend(
+            persist_directory,
+            lambda partition: ChromaBackend(persist_directory, embedding_fn,
+                                            ChromaBackend.partition_collection_name(partition)),
+            Settings.VECTOR_GLOBAL_PARTITION
+        )
+    raise ValueError(f"Unknown vector backend: {name}")
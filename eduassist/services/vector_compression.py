@@ -0,0 +1,86 @@
+"""Compressed vector codes for approximate inner-product search.
+
+``VectorQuantizer`` optionally projects vectors onto their top principal
+directions (an uncentered PCA, so inner products are preserved as well as
+possible) and then stores every dimension as int8 with its own scale. Scores
+computed from the codes are only used to pick candidates; callers re-rank
+those candidates against the full-precision vectors.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+CHUNK_ROWS = 16384
+FIT_SAMPLE_ROWS = 20000
+
+
+class VectorQuantizer:
+    """Optional PCA projection followed by per-dimension int8 scalar quantization."""
+
+    def __init__(self, pca_dim: int = 0, seed: int = 0):
+        self.pca_dim = pca_dim
+        self.seed = seed
+        self.components: Optional[np.ndarray] = None
+        self.scales: Optional[np.ndarray] = None
+
+    def project(self, vectors: np.ndarray) -> np.ndarray:
+        """Map vectors into the (possibly reduced) coded space."""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        return vectors @ self.components.T if self.components is not None else vectors
+
+    def fit(self, matrix: np.ndarray) -> "VectorQuantizer":
+        """
+        Learn the projection and per-dimension scales from stored vectors.
+
+        Args:
+            matrix: Vectors to be encoded, one per row (may be memory-mapped)
+
+        Returns:
+            self
+        """
+        dim = matrix.shape[1]
+        self.components = None
+        if 0 < self.pca_dim < dim and len(matrix):
+            rows = np.arange(len(matrix))
+            if len(rows) > FIT_SAMPLE_ROWS:
+                rows = np.sort(np.random.default_rng(self.seed).choice(rows, FIT_SAMPLE_ROWS, replace=False))
+            _, _, vt = np.linalg.svd(np.asarray(matrix[rows], dtype=np.float32), full_matrices=False)
+            self.components = np.ascontiguousarray(vt[:self.pca_dim], dtype=np.float32)
+
+        peak = np.zeros(self.pca_dim if self.components is not None else dim, dtype=np.float32)
+        for start in range(0, len(matrix), CHUNK_ROWS):
+            np.maximum(peak, np.abs(self.project(matrix[start:start + CHUNK_ROWS])).max(axis=0), out=peak)
+        self.scales = np.where(peak > 0, peak / 127.0, 1.0).astype(np.float32)
+        return self
+
+    def encode(self, matrix: np.ndarray) -> np.ndarray:
+        """Quantize vectors to an int8 code matrix."""
+        codes = np.empty((len(matrix), len(self.scales)), dtype=np.int8)
+        for start in range(0, len(matrix), CHUNK_ROWS):
+            scaled = self.project(matrix[start:start + CHUNK_ROWS]) / self.scales
+            codes[start:start + CHUNK_ROWS] = np.clip(np.rint(scaled), -127, 127)
+        return codes
+
+    def score(self, queries: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        """
+        Approximate inner products between queries and encoded vectors.
+
+        Args:
+            queries: Query vectors in the original space
+            codes: Int8 codes from ``encode``
+
+        Returns:
+            Float32 matrix with one row per query and one column per code
+        """
+        weights = self.project(queries) * self.scales
+        scores = np.empty((len(weights), len(codes)), dtype=np.float32)
+        for start in range(0, len(codes), CHUNK_ROWS):
+            block = codes[start:start + CHUNK_ROWS].astype(np.float32)
+            scores[:, start:start + len(block)] = weights @ block.T
+        return scores
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the projection and scales."""
+        return sum(a.nbytes for a in (self.components, self.scales) if a is not None)
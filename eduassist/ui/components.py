@@ -1,13 +1,91 @@
 """Reusable UI components for the application."""
 
 import streamlit as st
-from typing import Dict, Tuple
+from typing import Dict, Sequence, Tuple
 from ..config.settings import Settings
 from ..services.translation_service import (
-    translate_text, get_available_languages, 
+    translate_many, translate_ui_elements, get_available_languages, 
     LANGUAGE_NAMES, LANGUAGE_NATIVE
 )
 
+HEADER_TEXT = {
+    "title": "JNTU EduAssist AI",
+    "subtitle": "Your Multilingual Educational Assistant for JNTU Students. Advanced AI-powered platform designed to provide instant answers, study materials, and comprehensive academic support.",
+    "label": "EDUCATIONAL PLATFORM"
+}
+
+DASHBOARD_TEXT = {
+    "dashboard_title": "YOUR LEARNING DASHBOARD",
+    "ask_title": "Ask Questions",
+    "ask_desc": "Get instant answers to your coursework with AI-powered assistance built on semantic search technology.",
+    "results_title": "Check Results",
+    "results_desc": "Fetch your academic results directly from JNTUH servers quickly and easily.",
+    "practice_title": "Practice Questions",
+    "practice_desc": "Generate practice questions to test your knowledge and prepare for exams.",
+    "forum_title": "Discussion Forum",
+    "forum_desc": "Connect with fellow students and teachers to discuss academics and share knowledge.",
+    "service": "SERVICE",
+    "open": "OPEN",
+    "login": "LOGIN"
+}
+
+COURSE_SELECTOR_TEXT = {
+    "section_title": "SELECT YOUR COURSE",
+    "degree": "Degree Type",
+    "select_degree": "Select Degree",
+    "branch": "Branch",
+    "select_branch": "Select Branch",
+    "year": "Year",
+    "select_year": "Select Year",
+    "semester": "Semester",
+    "select_semester": "Select Semester"
+}
+
+SUBJECT_CARD_TEXT = {
+    "code": "Code",
+    "syllabus": "Syllabus",
+    "notes": "Notes",
+    "papers": "Papers",
+    "view_topics": "View Topics"
+}
+
+SIDEBAR_TEXT = {
+    "app_name": "JNTU EduAssist",
+    "quick_info": "Quick Info",
+    "degree": "Degree",
+    "branch": "Branch",
+    "year": "Year",
+    "semester": "Semester",
+    "tips": "Tips",
+    "tips_list": [
+        "Select your course details first",
+        "Use the Results tab to check grades",
+        "Generate practice questions",
+        "Ask questions in chat"
+    ],
+    "clear_chat": "Clear Chat History",
+    "about": "About",
+    "helps": "helps JNTUH students with",
+    "about_list": [
+        "Course materials & syllabi",
+        "Academic results lookup",
+        "Practice question generation",
+        "Q&A assistance"
+    ]
+}
+
+PAGE_TEXTS = [
+    text
+    for elements in (HEADER_TEXT, DASHBOARD_TEXT, COURSE_SELECTOR_TEXT, SUBJECT_CARD_TEXT, SIDEBAR_TEXT)
+    for value in elements.values()
+    for text in (value if isinstance(value, list) else [value])
+]
+
+
+def prefetch_page_text(lang: str, extra: Sequence[str] = ()):
+    """Translate every string of the dashboard components, plus ``extra``, in one ``translate_many`` call."""
+    translate_many(PAGE_TEXTS + list(extra), lang)
+
 
 def render_top_bar():
     """Render the top navigation bar with logo, language selector and auth buttons."""
@@ -113,9 +191,8 @@ def render_auth_buttons():
 def render_header():
     """Render the main application header."""
     lang = st.session_state.get('selected_language', 'english')
-    title = translate_text("JNTU EduAssist AI", lang)
-    subtitle = translate_text("Your Multilingual Educational Assistant for JNTU Students. Advanced AI-powered platform designed to provide instant answers, study materials, and comprehensive academic support.", lang)
-    label = translate_text("EDUCATIONAL PLATFORM", lang)
+    text = translate_ui_elements(HEADER_TEXT, lang)
+    title, subtitle, label = text["title"], text["subtitle"], text["label"]
     
     st.markdown(f"""
         <div class="main-header">
@@ -136,7 +213,8 @@ def render_dashboard():
     lang = st.session_state.get('selected_language', 'english')
     user = st.session_state.get('user')
     
-    dashboard_title = translate_text("YOUR LEARNING DASHBOARD", lang)
+    text = translate_ui_elements(DASHBOARD_TEXT, lang)
+    dashboard_title = text["dashboard_title"]
     
     st.markdown(f"""
         <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1.5rem; margin-top: 2rem;">
@@ -148,40 +226,40 @@ def render_dashboard():
     apps = [
         {
             "number": "01",
-            "title": translate_text("Ask Questions", lang),
-            "desc": translate_text("Get instant answers to your coursework with AI-powered assistance built on semantic search technology.", lang),
+            "title": text["ask_title"],
+            "desc": text["ask_desc"],
             "key": "ask",
             "requires_login": False,
             "badge": None
         },
         {
             "number": "02",
-            "title": translate_text("Check Results", lang),
-            "desc": translate_text("Fetch your academic results directly from JNTUH servers quickly and easily.", lang),
+            "title": text["results_title"],
+            "desc": text["results_desc"],
             "key": "results",
             "requires_login": False,
             "badge": "NEW"
         },
         {
             "number": "03",
-            "title": translate_text("Practice Questions", lang),
-            "desc": translate_text("Generate practice questions to test your knowledge and prepare for exams.", lang),
+            "title": text["practice_title"],
+            "desc": text["practice_desc"],
             "key": "practice",
             "requires_login": False,
             "badge": None
         },
         {
             "number": "04",
-            "title": translate_text("Discussion Forum", lang),
-            "desc": translate_text("Connect with fellow students and teachers to discuss academics and share knowledge.", lang),
+            "title": text["forum_title"],
+            "desc": text["forum_desc"],
             "key": "forum",
             "requires_login": True,
             "badge": None
         }
     ]
     
-    service_label = translate_text("SERVICE", lang)
-    open_text = translate_text("OPEN", lang)
+    service_label = text["service"]
+    open_text = text["open"]
     
     col1, col2 = st.columns(2)
     
@@ -190,7 +268,7 @@ def render_dashboard():
         if app["badge"]:
             badge_html = f'<span style="position: absolute; top: 1rem; right: 1rem; background: #1a1a1a; color: white; padding: 0.25rem 0.5rem; border-radius: 4px; font-size: 0.65rem; font-weight: 600; letter-spacing: 0.05em;">{app["badge"]}</span>'
         elif app["requires_login"]:
-            badge_text = translate_text("LOGIN", lang)
+            badge_text = text["login"]
             badge_html = f'<span style="position: absolute; top: 1rem; right: 1rem; background: #1a1a1a; color: white; padding: 0.25rem 0.5rem; border-radius: 4px; font-size: 0.65rem; font-weight: 600; letter-spacing: 0.05em;">{badge_text}</span>'
         
         card_html = f'<div style="background: white; padding: 1.5rem; position: relative; border: 1px solid #e5e5e5; border-radius: 12px; margin-bottom: 0.5rem; min-height: 160px;">{badge_html}<div style="font-size: 0.7rem; font-weight: 500; letter-spacing: 0.08em; text-transform: uppercase; color: #999; margin-bottom: 0.75rem;">{service_label} {app["number"]}</div><h3 style="font-size: 1.125rem; font-weight: 600; color: #1a1a1a; margin-bottom: 0.5rem;">{app["title"]}</h3><p style="font-size: 0.8rem; color: #666; line-height: 1.5;">{app["desc"]}</p></div>'
@@ -228,7 +306,8 @@ def render_course_selector(
     """Render course selection UI."""
     lang = st.session_state.get('selected_language', 'english')
     
-    section_title = translate_text("SELECT YOUR COURSE", lang)
+    text = translate_ui_elements(COURSE_SELECTOR_TEXT, lang)
+    section_title = text["section_title"]
     
     st.markdown(f"""
         <div style="font-size: 0.75rem; font-weight: 500; letter-spacing: 0.1em; text-transform: uppercase; color: #999; margin-bottom: 1rem; margin-top: 2rem;">{section_title}</div>
@@ -238,9 +317,9 @@ def render_course_selector(
     
     with col1:
         selected_degree = st.selectbox(
-            translate_text("Degree Type", lang),
+            text["degree"],
             options=[""] + list(degree_options.keys()),
-            format_func=lambda x: translate_text("Select Degree", lang) if x == "" else degree_options.get(x, x),
+            format_func=lambda x: text["select_degree"] if x == "" else degree_options.get(x, x),
             key="degree_select"
         )
     
@@ -249,9 +328,9 @@ def render_course_selector(
     with col2:
         branch_keys = list(branch_options.keys())
         selected_branch = st.selectbox(
-            translate_text("Branch", lang),
+            text["branch"],
             options=[""] + branch_keys,
-            format_func=lambda x: translate_text("Select Branch", lang) if x == "" else f"{branch_options.get(x, {}).get('abbreviation', x)} - {branch_options.get(x, {}).get('name', x)}",
+            format_func=lambda x: text["select_branch"] if x == "" else f"{branch_options.get(x, {}).get('abbreviation', x)} - {branch_options.get(x, {}).get('name', x)}",
             key="branch_select",
             disabled=not selected_degree
         )
@@ -260,9 +339,9 @@ def render_course_selector(
     
     with col3:
         selected_year = st.selectbox(
-            translate_text("Year", lang),
+            text["year"],
             options=[""] + list(year_options.keys()),
-            format_func=lambda x: translate_text("Select Year", lang) if x == "" else year_options.get(x, x),
+            format_func=lambda x: text["select_year"] if x == "" else year_options.get(x, x),
             key="year_select",
             disabled=not selected_branch
         )
@@ -271,9 +350,9 @@ def render_course_selector(
     
     with col4:
         selected_semester = st.selectbox(
-            translate_text("Semester", lang),
+            text["semester"],
             options=[""] + list(semester_options.keys()),
-            format_func=lambda x: translate_text("Select Semester", lang) if x == "" else semester_options.get(x, x),
+            format_func=lambda x: text["select_semester"] if x == "" else semester_options.get(x, x),
             key="semester_select",
             disabled=not selected_year
         )
@@ -284,25 +363,26 @@ def render_course_selector(
 def render_subject_card(subject_key: str, subject_data: Dict):
     """Render a subject card with links."""
     lang = st.session_state.get('selected_language', 'english')
+    text = translate_ui_elements(SUBJECT_CARD_TEXT, lang)
     
     st.markdown(f"""
         <div class="subject-card">
             <h4 style="font-size: 1.1rem; font-weight: 600; color: #1a1a1a; margin-bottom: 0.5rem;">{subject_data.get('name', subject_key)}</h4>
-            <p style="font-size: 0.875rem; color: #666;"><strong>{translate_text("Code", lang)}:</strong> {subject_data.get('code', 'N/A')}</p>
+            <p style="font-size: 0.875rem; color: #666;"><strong>{text["code"]}:</strong> {subject_data.get('code', 'N/A')}</p>
         </div>
     """, unsafe_allow_html=True)
     
     link_col1, link_col2, link_col3 = st.columns(3)
     with link_col1:
-        st.link_button(translate_text("Syllabus", lang), subject_data.get('syllabus_link', '#'), use_container_width=True)
+        st.link_button(text["syllabus"], subject_data.get('syllabus_link', '#'), use_container_width=True)
     with link_col2:
-        st.link_button(translate_text("Notes", lang), subject_data.get('notes_link', '#'), use_container_width=True)
+        st.link_button(text["notes"], subject_data.get('notes_link', '#'), use_container_width=True)
     with link_col3:
-        st.link_button(translate_text("Papers", lang), subject_data.get('previous_papers_link', '#'), use_container_width=True)
+        st.link_button(text["papers"], subject_data.get('previous_papers_link', '#'), use_container_width=True)
     
     topics = subject_data.get('topics', [])
     if topics:
-        with st.expander(translate_text("View Topics", lang)):
+        with st.expander(text["view_topics"]):
             topic_list = ", ".join([topic.replace("_", " ").title() for topic in topics])
             st.write(topic_list)
 
@@ -320,46 +400,37 @@ def render_sidebar(
     """Render the sidebar with quick info and tips."""
     lang = st.session_state.get('selected_language', 'english')
     
+    text = translate_ui_elements(SIDEBAR_TEXT, lang)
+    
     with st.sidebar:
         st.markdown(f"""
             <div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 1rem;">
                 <div style="width: 28px; height: 28px; background: #1a1a1a; border-radius: 6px; display: flex; align-items: center; justify-content: center; color: white; font-weight: 700; font-size: 0.75rem;">JE</div>
-                <span style="font-size: 0.9rem; font-weight: 600; color: #1a1a1a;">{translate_text('JNTU EduAssist', lang)}</span>
+                <span style="font-size: 0.9rem; font-weight: 600; color: #1a1a1a;">{text['app_name']}</span>
             </div>
         """, unsafe_allow_html=True)
         st.markdown("---")
         
-        st.markdown(f"### {translate_text('Quick Info', lang)}")
+        st.markdown(f"### {text['quick_info']}")
         if selected_degree:
-            st.success(f"**{translate_text('Degree', lang)}:** {degree_options.get(selected_degree, '')}")
+            st.success(f"**{text['degree']}:** {degree_options.get(selected_degree, '')}")
         if selected_branch and selected_branch in branch_options:
             branch_info = branch_options[selected_branch]
-            st.info(f"**{translate_text('Branch', lang)}:** {branch_info.get('abbreviation', '')} ({branch_info.get('name', '')})")
+            st.info(f"**{text['branch']}:** {branch_info.get('abbreviation', '')} ({branch_info.get('name', '')})")
         if selected_year:
-            st.write(f"**{translate_text('Year', lang)}:** {year_options.get(selected_year, '')}")
+            st.write(f"**{text['year']}:** {year_options.get(selected_year, '')}")
         if selected_semester:
-            st.write(f"**{translate_text('Semester', lang)}:** {semester_options.get(selected_semester, '')}")
+            st.write(f"**{text['semester']}:** {semester_options.get(selected_semester, '')}")
         
         st.markdown("---")
-        st.markdown(f"### {translate_text('Tips', lang)}")
-        st.markdown(f"""
-        - {translate_text('Select your course details first', lang)}
-        - {translate_text('Use the Results tab to check grades', lang)}
-        - {translate_text('Generate practice questions', lang)}
-        - {translate_text('Ask questions in chat', lang)}
-        """)
+        st.markdown(f"### {text['tips']}")
+        st.markdown("\n".join(f"- {tip}" for tip in text["tips_list"]))
         
         st.markdown("---")
-        if st.button(translate_text("Clear Chat History", lang), use_container_width=True):
+        if st.button(text["clear_chat"], use_container_width=True):
             st.session_state.messages = []
             st.rerun()
         
         st.markdown("---")
-        st.markdown(f"### {translate_text('About', lang)}")
-        st.markdown(f"""
-        **JNTU EduAssist AI** {translate_text('helps JNTUH students with', lang)}:
-        - {translate_text('Course materials & syllabi', lang)}
-        - {translate_text('Academic results lookup', lang)}
-        - {translate_text('Practice question generation', lang)}
-        - {translate_text('Q&A assistance', lang)}
-        """)
+        st.markdown(f"### {text['about']}")
+        st.markdown(f"**JNTU EduAssist AI** {text['helps']}:\n" + "\n".join(f"- {item}" for item in text["about_list"]))
@@ -0,0 +1,98 @@
+"""Process-wide registry of heavyweight shared resources.
+
+Streamlit runs every session's script on its own thread, so a bare
+``if _x is None: _x = X()`` global can be built several times by concurrent
+first requests. Resources registered here are created lazily, at most once per
+process, under a per-resource lock (a slow model load does not block the
+database pool), and their shutdown hooks run in reverse creation order when
+the process exits.
+"""
+
+import atexit
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+
+class ServiceRegistry:
+    """Lock-protected lazy singletons with shutdown hooks and init timings."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._shutdown_hooks: Dict[str, Optional[Callable[[Any], None]]] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._instances: Dict[str, Any] = {}
+        self._init_seconds: Dict[str, float] = {}
+        self._order: List[str] = []
+
+    def register(self, name: str, factory: Callable[[], Any],
+                 shutdown: Optional[Callable[[Any], None]] = None):
+        """
+        Register how to build a resource; registering an existing name is a no-op.
+
+        Args:
+            name: Resource name
+            factory: Builds the resource on first ``get``
+            shutdown: Called with the instance by ``shutdown``
+        """
+        with self._lock:
+            if name not in self._factories:
+                self._factories[name] = factory
+                self._shutdown_hooks[name] = shutdown
+                self._locks[name] = threading.Lock()
+
+    def get(self, name: str) -> Any:
+        """Return the resource, building it on first use; concurrent callers wait for one build."""
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+        with self._lock:
+            if name not in self._factories:
+                raise KeyError(f"Unknown service: {name}")
+            resource_lock = self._locks[name]
+        with resource_lock:
+            instance = self._instances.get(name)
+            if instance is None:
+                started = time.perf_counter()
+                instance = self._factories[name]()
+                with self._lock:
+                    self._init_seconds[name] = time.perf_counter() - started
+                    self._instances[name] = instance
+                    self._order.append(name)
+            return instance
+
+    def peek(self, name: str) -> Any:
+        """Return the resource if it has been built, without building it."""
+        return self._instances.get(name)
+
+    def shutdown(self):
+        """Run shutdown hooks in reverse creation order and forget every instance."""
+        with self._lock:
+            created = [(name, self._instances.pop(name)) for name in reversed(self._order)]
+            self._order.clear()
+        for name, instance in created:
+            hook = self._shutdown_hooks.get(name)
+            if hook is None:
+                continue
+            try:
+                hook(instance)
+            except Exception as e:
+                print(f"Error shutting down {name}: {e}")
+
+    def stats(self) -> Dict[str, Dict]:
+        """Return, per registered resource, whether it is built and how long the build took."""
+        with self._lock:
+            return {
+                name: {"initialized": name in self._instances, "init_seconds": self._init_seconds.get(name)}
+                for name in self._factories
+            }
+
+
+_registry = ServiceRegistry()
+atexit.register(_registry.shutdown)
+
+
+def get_registry() -> ServiceRegistry:
+    """Get the process-wide service registry."""
+    return _registry
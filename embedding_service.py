@@ -1,32 +1,82 @@
 """
 Embedding Service for JNTU EduAssist AI
-Uses ChromaDB with built-in DefaultEmbeddingFunction for semantic search.
+Uses ChromaDB's built-in DefaultEmbeddingFunction for semantic search, over a
+pluggable vector backend (in-memory NumPy flat index or a ChromaDB collection).
 """
 
-import chromadb
 from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
+import hashlib
+import itertools
 import json
 import os
-from typing import List, Dict, Tuple, Optional
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, List, Dict, Tuple, Optional
+
+import numpy as np
+
+from eduassist.config.settings import Settings
+from eduassist.services.embedding_cache import EmbeddingCache, embedding_model_id
+from eduassist.services.knowledge_index import load_index
+from eduassist.services.semantic_cache import SemanticQueryCache
+from eduassist.services.vector_backends import SubjectFilter, VectorBackend, create_backend
+from eduassist.utils.registry import get_registry
+
+Document = Tuple[str, str, Dict]
+ProgressCallback = Callable[[int, int, float], None]
+
+_worker_embedding_fn = None
+
+
+def _init_embedding_worker(embedding_fn_factory: Callable):
+    """Create the embedding function once per pool process."""
+    global _worker_embedding_fn
+    _worker_embedding_fn = embedding_fn_factory()
+
+
+def _embed_batch(texts: List[str]) -> np.ndarray:
+    """Embed one batch of texts in a pool process."""
+    return np.asarray(_worker_embedding_fn(texts), dtype=np.float32)
+
+
+def _freeze_filter(subject_filter: SubjectFilter) -> SubjectFilter:
+    """Make a multi-subject filter a tuple so the semantic cache can compare and keep it."""
+    if subject_filter and not isinstance(subject_filter, str):
+        return tuple(subject_filter)
+    return subject_filter
+
+
+def print_progress(done: int, total: int, docs_per_second: float):
+    """Progress callback that prints embedded documents and throughput."""
+    print(f"Embedded {done}/{total} documents ({docs_per_second:.1f} docs/s)")
 
 
 class EmbeddingService:
-    """Service for managing embeddings and semantic search using ChromaDB."""
+    """Service for managing embeddings and semantic search over a vector backend."""
     
-    def __init__(self, persist_directory: str = "./chroma_db"):
-        """Initialize the embedding service with ChromaDB.
+    def __init__(self, persist_directory: str = "./chroma_db",
+                 query_cache: Optional[SemanticQueryCache] = None,
+                 embedding_cache_dir: Optional[str] = Settings.EMBEDDING_CACHE_DIR,
+                 backend: Optional[str] = None):
+        """Initialize the embedding service and its vector backend.
         
         Args:
-            persist_directory: Directory to persist ChromaDB data
+            persist_directory: Directory to persist the vector store
+            query_cache: Near-duplicate query cache in front of ``search``
+            embedding_cache_dir: Directory of the on-disk document embedding
+                cache, or None to always recompute embeddings
+            backend: "numpy" or "chroma" (defaults to ``Settings.VECTOR_BACKEND``)
         """
         self.persist_directory = persist_directory
+        self.query_cache = query_cache if query_cache is not None else SemanticQueryCache()
         self.embedding_fn = DefaultEmbeddingFunction()
-        self.client = chromadb.PersistentClient(path=persist_directory)
-        self.collection = self.client.get_or_create_collection(
-            name="knowledge_base",
-            embedding_function=self.embedding_fn,
-            metadata={"hnsw:space": "cosine", "description": "JNTU EduAssist knowledge base embeddings"}
-        )
+        self.embedding_cache = None
+        if embedding_cache_dir:
+            self.embedding_cache = EmbeddingCache(embedding_cache_dir, embedding_model_id(self.embedding_fn))
+        self.backend: VectorBackend = create_backend(backend or Settings.VECTOR_BACKEND,
+                                                     persist_directory, self.embedding_fn)
     
     def load_knowledge_base(self, kb_path: str = "knowledge_base.json") -> Dict:
         """Load knowledge base from JSON file.
@@ -47,124 +97,256 @@ class EmbeddingService:
             print(f"Invalid JSON in knowledge base: {kb_path}")
             return {}
     
-    def populate_from_knowledge_base(self, kb_path: str = "knowledge_base.json") -> int:
-        """Populate ChromaDB with content from knowledge base.
+    def _knowledge_base_documents(self, kb_path: str) -> Dict[str, Tuple[str, Dict]]:
+        """Build the document text and metadata for every topic, keyed by doc id."""
+        documents = {}
+        for subject_key, topic_key, keywords, answer in load_index(kb_path).iter_topics():
+            if not answer:
+                continue
+            
+            keywords_text = ", ".join(keywords) if keywords else ""
+            document_text = f"Topic: {topic_key.replace('_', ' ').title()}\nKeywords: {keywords_text}\n\n{answer}"
+            
+            doc_id = f"{subject_key}_{topic_key}"
+            metadata = {
+                "subject": subject_key,
+                "topic": topic_key,
+                "keywords": keywords_text,
+                "answer": answer
+            }
+            metadata["content_hash"] = hashlib.sha256(
+                json.dumps([doc_id, document_text, metadata], sort_keys=True, ensure_ascii=False).encode("utf-8")
+            ).hexdigest()
+            documents[doc_id] = (document_text, metadata)
+        return documents
+    
+    def sync_knowledge_base(self, kb_path: str = "knowledge_base.json", batch_size: int = 500,
+                            embed_batch_size: int = Settings.EMBEDDING_BATCH_SIZE,
+                            workers: int = 1, progress: Optional[ProgressCallback] = None) -> Dict[str, float]:
+        """Bring the collection in line with the knowledge base, re-embedding only changes.
+        
+        Every document carries a ``content_hash`` of its id, text and metadata.
+        Only ids are fetched from the backend: all stored ids, plus the ids whose
+        stored hash is one of the current hashes (those are unchanged). Added
+        and edited documents are re-embedded through ``upsert_documents``,
+        removed topics are deleted.
         
         Args:
             kb_path: Path to knowledge base JSON file
+            batch_size: Hashes per ``$in`` lookup and ids per delete
+            embed_batch_size: Documents per embedding call and per upsert
+            workers: Embedding processes (see ``upsert_documents``)
+            progress: Optional per-batch progress callback
             
         Returns:
-            Number of documents added
+            Dictionary with added, updated, deleted and unchanged counts and
+            the embedding throughput in docs/s
         """
-        knowledge_base = self.load_knowledge_base(kb_path)
-        if not knowledge_base:
-            return 0
+        documents = self._knowledge_base_documents(kb_path)
+        existing_ids = set(self.backend.ids())
         
-        documents = []
-        metadatas = []
-        ids = []
+        hashes = [metadata["content_hash"] for _, metadata in documents.values()]
+        unchanged_ids = set()
+        for offset in range(0, len(hashes), batch_size):
+            chunk = hashes[offset:offset + batch_size]
+            unchanged_ids.update(self.backend.ids_with_hashes(chunk))
+        unchanged_ids &= existing_ids & set(documents)
         
-        for subject_key, topics in knowledge_base.items():
-            if not isinstance(topics, dict):
-                continue
-                
-            for topic_key, topic_data in topics.items():
-                if not isinstance(topic_data, dict):
-                    continue
-                    
-                answer = topic_data.get("answer", "")
-                keywords = topic_data.get("keywords", [])
-                
-                if not answer:
-                    continue
-                
-                keywords_text = ", ".join(keywords) if keywords else ""
-                document_text = f"Topic: {topic_key.replace('_', ' ').title()}\nKeywords: {keywords_text}\n\n{answer}"
-                
-                doc_id = f"{subject_key}_{topic_key}"
-                
-                documents.append(document_text)
-                metadatas.append({
-                    "subject": subject_key,
-                    "topic": topic_key,
-                    "keywords": keywords_text,
-                    "answer": answer
-                })
-                ids.append(doc_id)
+        deleted_ids = sorted(existing_ids - set(documents))
+        changed_ids = [doc_id for doc_id in documents if doc_id not in unchanged_ids]
         
-        if documents:
-            existing_ids = set(self.collection.get()["ids"])
-            new_docs = []
-            new_metas = []
-            new_ids = []
-            
-            for doc, meta, doc_id in zip(documents, metadatas, ids):
-                if doc_id not in existing_ids:
-                    new_docs.append(doc)
-                    new_metas.append(meta)
-                    new_ids.append(doc_id)
+        for offset in range(0, len(deleted_ids), batch_size):
+            self.backend.delete(deleted_ids[offset:offset + batch_size])
+        docs_per_second = self.upsert_documents(
+            ((doc_id, *documents[doc_id]) for doc_id in changed_ids),
+            total=len(changed_ids),
+            batch_size=embed_batch_size,
+            workers=workers,
+            progress=progress
+        )
+        
+        if deleted_ids or changed_ids:
+            self.backend.flush()
+            self.query_cache.clear()
+        
+        added = sum(1 for doc_id in changed_ids if doc_id not in existing_ids)
+        return {
+            "added": added,
+            "updated": len(changed_ids) - added,
+            "deleted": len(deleted_ids),
+            "unchanged": len(unchanged_ids),
+            "docs_per_second": docs_per_second
+        }
+    
+    def upsert_documents(self, documents: Iterable[Document], total: int = 0,
+                         batch_size: int = Settings.EMBEDDING_BATCH_SIZE,
+                         workers: int = Settings.EMBEDDING_WORKERS,
+                         progress: Optional[ProgressCallback] = None) -> float:
+        """Embed and write documents in fixed-size batches.
+        
+        Documents are consumed lazily, ``batch_size`` at a time. With more than
+        one worker the batches are embedded on a process pool with at most
+        ``2 * workers`` batches in flight, so memory stays bounded however
+        many documents are streamed; each finished batch is written with its
+        own backend upsert. Texts found in the on-disk embedding cache
+        are not embedded again, and new vectors are added to it. Every written
+        document carries its content hash, so after a crash the next
+        ``sync_knowledge_base`` only embeds the documents that were not written
+        yet.
+        
+        Args:
+            documents: (doc_id, text, metadata) tuples
+            total: Number of documents, for progress reporting
+            batch_size: Documents per embedding call and per upsert
+            workers: Embedding processes; 1 or less embeds in this process
+            progress: Called with (done, total, docs/s) after each batch
             
-            if new_docs:
-                self.collection.add(
-                    documents=new_docs,
-                    metadatas=new_metas,
-                    ids=new_ids
-                )
-                return len(new_docs)
+        Returns:
+            Throughput in documents per second
+        """
+        started = time.perf_counter()
+        done = 0
+        iterator = iter(documents)
+        batches = iter(lambda: list(itertools.islice(iterator, batch_size)), [])
+        
+        def cached_vectors(batch: List[Document]) -> Tuple[List, List[int]]:
+            texts = [text for _, text, _ in batch]
+            vectors = self.embedding_cache.get_many(texts) if self.embedding_cache else [None] * len(batch)
+            return vectors, [i for i, vector in enumerate(vectors) if vector is None]
+        
+        def write(batch: List[Document], vectors: List, missing: List[int], embeddings):
+            nonlocal done
+            if missing:
+                missing_texts = [batch[i][1] for i in missing]
+                for i, vector in zip(missing, embeddings):
+                    vectors[i] = vector
+                if self.embedding_cache is not None:
+                    self.embedding_cache.put_many(missing_texts, embeddings)
+            self.backend.upsert(
+                [doc_id for doc_id, _, _ in batch],
+                [np.asarray(vector, dtype=np.float32) for vector in vectors],
+                [text for _, text, _ in batch],
+                [metadata for _, _, metadata in batch]
+            )
+            done += len(batch)
+            if progress is not None:
+                progress(done, max(total, done), done / max(time.perf_counter() - started, 1e-9))
+        
+        if workers <= 1:
+            for batch in batches:
+                vectors, missing = cached_vectors(batch)
+                embeddings = self.embedding_fn([batch[i][1] for i in missing]) if missing else []
+                write(batch, vectors, missing, embeddings)
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_embedding_worker,
+                                     initargs=(type(self.embedding_fn),)) as pool:
+                in_flight = deque()
+                for batch in batches:
+                    vectors, missing = cached_vectors(batch)
+                    if not missing:
+                        write(batch, vectors, missing, [])
+                        continue
+                    future = pool.submit(_embed_batch, [batch[i][1] for i in missing])
+                    in_flight.append((batch, vectors, missing, future))
+                    if len(in_flight) >= 2 * workers:
+                        pending_batch, pending_vectors, pending_missing, pending = in_flight.popleft()
+                        write(pending_batch, pending_vectors, pending_missing, pending.result())
+                while in_flight:
+                    pending_batch, pending_vectors, pending_missing, pending = in_flight.popleft()
+                    write(pending_batch, pending_vectors, pending_missing, pending.result())
         
-        return 0
+        self.backend.flush()
+        return done / max(time.perf_counter() - started, 1e-9)
     
-    def search(self, query: str, n_results: int = 3, subject_filter: Optional[str] = None) -> List[Dict]:
+    def populate_from_knowledge_base(self, kb_path: str = "knowledge_base.json") -> int:
+        """Populate the vector store with content from knowledge base.
+        
+        Args:
+            kb_path: Path to knowledge base JSON file
+            
+        Returns:
+            Number of documents added or re-embedded
+        """
+        result = self.sync_knowledge_base(kb_path)
+        return result["added"] + result["updated"]
+    
+    def search(self, query: str, n_results: int = 3, subject_filter: SubjectFilter = None) -> List[Dict]:
         """Search for relevant content using semantic similarity.
         
+        The query is embedded once; if a near-duplicate query is in the
+        semantic cache its results are returned without querying the index.
+        
         Args:
             query: User's question or search query
             n_results: Number of results to return
-            subject_filter: Optional subject to filter results
+            subject_filter: Optional subject, or sequence of subjects, to filter results
             
         Returns:
             List of matching documents with metadata and scores
         """
-        where_filter = None
-        if subject_filter:
-            where_filter = {"subject": subject_filter}
-        
+        subject_filter = _freeze_filter(subject_filter)
         try:
-            results = self.collection.query(
-                query_texts=[query],
-                n_results=n_results,
-                where=where_filter,
-                include=["documents", "metadatas", "distances"]
-            )
+            embedding = self.embedding_fn([query])[0]
+            cached = self.query_cache.lookup(embedding, n_results, subject_filter)
+            if cached is not None:
+                return cached
+            formatted_results = self.backend.query([embedding], n_results, subject_filter)[0]
         except Exception as e:
             print(f"Search error: {e}")
             return []
         
-        if not results or not results.get("ids") or not results["ids"][0]:
-            return []
+        self.query_cache.store(embedding, n_results, subject_filter, formatted_results)
+        return formatted_results
+    
+    def search_many(self, queries: List[str], n_results: int = 3, subject_filter: SubjectFilter = None,
+                    batch_size: int = 64) -> List[List[Dict]]:
+        """Search for many queries, embedding and querying them in batches.
         
-        formatted_results = []
-        for i, doc_id in enumerate(results["ids"][0]):
-            distance = results["distances"][0][i] if results.get("distances") else 2.0
-            similarity = 1.0 - (distance / 2.0)
-            result = {
-                "id": doc_id,
-                "document": results["documents"][0][i] if results.get("documents") else "",
-                "metadata": results["metadatas"][0][i] if results.get("metadatas") else {},
-                "distance": distance,
-                "similarity": similarity
-            }
-            formatted_results.append(result)
+        Each batch is embedded with one call to the embedding function; the
+        queries the semantic cache cannot answer are sent to the backend as a
+        single query, instead of one round trip per question.
         
-        return formatted_results
+        Args:
+            queries: User questions or search queries
+            n_results: Number of results to return per query
+            subject_filter: Optional subject, or sequence of subjects, to filter results
+            batch_size: Queries embedded and queried together
+            
+        Returns:
+            One list of results per query, in the same format as ``search``
+        """
+        subject_filter = _freeze_filter(subject_filter)
+        all_results = []
+        for offset in range(0, len(queries), batch_size):
+            batch = queries[offset:offset + batch_size]
+            batch_results: List[List[Dict]] = [[] for _ in batch]
+            try:
+                embeddings = self.embedding_fn(batch)
+                pending = []
+                for row, embedding in enumerate(embeddings):
+                    cached = self.query_cache.lookup(embedding, n_results, subject_filter)
+                    if cached is None:
+                        pending.append(row)
+                    else:
+                        batch_results[row] = cached
+                if pending:
+                    results = self.backend.query([embeddings[row] for row in pending], n_results, subject_filter)
+                    for i, row in enumerate(pending):
+                        batch_results[row] = results[i]
+                        self.query_cache.store(embeddings[row], n_results, subject_filter, batch_results[row])
+            except Exception as e:
+                print(f"Search error: {e}")
+            all_results.extend(batch_results)
+        
+        return all_results
     
-    def get_best_answer(self, query: str, subject_filter: Optional[str] = None, 
+    def get_best_answer(self, query: str, subject_filter: SubjectFilter = None, 
                         similarity_threshold: float = 0.5) -> Tuple[str, str, float]:
         """Get the best matching answer for a query.
         
         Args:
             query: User's question
-            subject_filter: Optional subject to filter results
+            subject_filter: Optional subject, or sequence of subjects, to filter results
             similarity_threshold: Minimum similarity score to consider a match
             
         Returns:
@@ -195,9 +377,10 @@ class EmbeddingService:
             Dictionary with collection statistics
         """
         try:
-            count = self.collection.count()
+            count = self.backend.count()
             return {
                 "total_documents": count,
+                "backend": self.backend.name,
                 "persist_directory": self.persist_directory
             }
         except Exception as e:
@@ -206,31 +389,132 @@ class EmbeddingService:
     def clear_collection(self):
         """Clear all documents from the collection."""
         try:
-            self.client.delete_collection(name="knowledge_base")
-            self.collection = self.client.get_or_create_collection(
-                name="knowledge_base",
-                embedding_function=self.embedding_fn,
-                metadata={"hnsw:space": "cosine", "description": "JNTU EduAssist knowledge base embeddings"}
-            )
+            self.backend.clear()
         except Exception as e:
             print(f"Error clearing collection: {e}")
+        self.query_cache.clear()
 
 
-_embedding_service: Optional[EmbeddingService] = None
+class EmbeddingWarmup:
+    """Build the shared embedding service on a background thread.
+    
+    Creating the service loads the embedding model and opens the vector
+    store, and the first sync may embed the whole knowledge base. Running
+    that off the request path lets callers use ``get`` (never blocks, None
+    until ready) and fall back to keyword retrieval meanwhile. The state
+    goes from "idle" to "loading" and then to "ready" or "failed"; a failed
+    warm-up is not retried automatically.
+    """
+    
+    IDLE = "idle"
+    LOADING = "loading"
+    READY = "ready"
+    FAILED = "failed"
+    
+    def __init__(self, factory: Callable[[], EmbeddingService] = EmbeddingService,
+                 kb_path: str = "knowledge_base.json"):
+        self.factory = factory
+        self.kb_path = kb_path
+        self.state = self.IDLE
+        self.service: Optional[EmbeddingService] = None
+        self.error = ""
+        self.timings: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self) -> "EmbeddingWarmup":
+        """Start warming up in a daemon thread; later calls do nothing."""
+        with self._lock:
+            if self._thread is None:
+                self.state = self.LOADING
+                self._thread = threading.Thread(target=self._run, name="embedding-warmup", daemon=True)
+                self._thread.start()
+        return self
+    
+    def _run(self):
+        started = time.perf_counter()
+        try:
+            service = self.factory()
+            self.timings["init_seconds"] = time.perf_counter() - started
+            
+            phase = time.perf_counter()
+            service.embedding_fn(["warm up"])
+            self.timings["model_seconds"] = time.perf_counter() - phase
+            
+            phase = time.perf_counter()
+            docs_added = service.populate_from_knowledge_base(self.kb_path)
+            self.timings["sync_seconds"] = time.perf_counter() - phase
+            if docs_added > 0:
+                print(f"Embedded {docs_added} new or changed documents into the vector store")
+            
+            self.service = service
+            self.state = self.READY
+        except Exception as e:
+            self.error = str(e)
+            self.state = self.FAILED
+            print(f"Embedding service warm-up failed: {e}")
+        finally:
+            self.timings["total_seconds"] = time.perf_counter() - started
+            self._done.set()
+    
+    def get(self) -> Optional[EmbeddingService]:
+        """Return the service if it is ready, starting the warm-up if needed, without blocking."""
+        self.start()
+        return self.service if self.state == self.READY else None
+    
+    def wait(self, timeout: Optional[float] = None) -> Optional[EmbeddingService]:
+        """Block until the warm-up finishes (or ``timeout`` seconds pass) and return the service."""
+        self.start()
+        self._done.wait(timeout)
+        return self.get()
+    
+    def status(self) -> Dict:
+        """Return the state, the error message if it failed, and phase timings in seconds."""
+        return {"state": self.state, "error": self.error, "timings": dict(self.timings)}
+
+
+def _shutdown_embedding_service(warmup: EmbeddingWarmup):
+    if warmup.service is not None:
+        warmup.service.backend.flush()
+
+
+get_registry().register("embedding_service", EmbeddingWarmup, _shutdown_embedding_service)
+
+
+def _embedding_warmup() -> EmbeddingWarmup:
+    return get_registry().get("embedding_service")
+
+
+def start_embedding_warmup() -> EmbeddingWarmup:
+    """Start building the shared embedding service in the background (idempotent)."""
+    return _embedding_warmup().start()
+
+
+def get_ready_embedding_service() -> Optional[EmbeddingService]:
+    """Return the shared embedding service if it has finished warming up, else None."""
+    return _embedding_warmup().get()
+
+
+def embedding_status() -> Dict:
+    """Return the readiness state and warm-up timings of the shared embedding service."""
+    return _embedding_warmup().status()
+
 
 def get_embedding_service() -> EmbeddingService:
-    """Get or create a singleton embedding service instance.
+    """Get the shared embedding service, waiting for the warm-up to finish.
     
     Returns:
         EmbeddingService instance
+        
+    Raises:
+        RuntimeError: If the warm-up failed
     """
-    global _embedding_service
-    if _embedding_service is None:
-        _embedding_service = EmbeddingService()
-        docs_added = _embedding_service.populate_from_knowledge_base()
-        if docs_added > 0:
-            print(f"Added {docs_added} documents to ChromaDB")
-    return _embedding_service
+    warmup = _embedding_warmup()
+    service = warmup.wait()
+    if service is None:
+        raise RuntimeError(f"Embedding service failed to initialize: {warmup.error}")
+    return service
 
 
 def initialize_embeddings() -> Dict:
@@ -243,18 +527,27 @@ def initialize_embeddings() -> Dict:
     stats = service.get_collection_stats()
     return {
         "status": "initialized",
-        "stats": stats
+        "stats": stats,
+        "warmup": _embedding_warmup().status()
     }
 
 
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Sync the knowledge base into the vector store.")
+    parser.add_argument("--reset", action="store_true",
+                        help="Clear the vector store first instead of resuming from the stored hashes")
+    args = parser.parse_args()
+    
     print("Initializing Embedding Service...")
     service = EmbeddingService()
     
-    service.clear_collection()
+    if args.reset:
+        service.clear_collection()
     
-    docs_added = service.populate_from_knowledge_base()
-    print(f"Added {docs_added} documents to ChromaDB")
+    result = service.sync_knowledge_base(workers=Settings.EMBEDDING_WORKERS, progress=print_progress)
+    print(f"Added {result['added']} documents to the vector store ({result['docs_per_second']:.1f} docs/s)")
     
     stats = service.get_collection_stats()
     print(f"Collection stats: {stats}")
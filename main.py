@@ -4,6 +4,8 @@ JNTU EduAssist AI - Main Entry Point
 A multilingual AI educational assistant for JNTU-H university students.
 """
 
+import threading
+
 import streamlit as st
 
 st.set_page_config(
@@ -16,18 +18,21 @@ from eduassist.config import apply_theme
 from eduassist.config.settings import Settings
 from eduassist.data import (
     load_courses,
-    load_knowledge_base,
+    load_subject_index,
+    knowledge_base_version,
     get_degree_options,
     get_branch_options,
     get_year_options,
     get_semester_options,
-    get_subjects
+    get_subjects,
+    get_subject_keys
 )
 from eduassist.ui.components import (
     render_header,
     render_top_bar,
     render_dashboard,
     render_course_selector,
+    prefetch_page_text,
     render_subject_card,
     render_sidebar
 )
@@ -40,7 +45,7 @@ from eduassist.pages import (
 )
 from eduassist.utils.session import initialize_session_state
 from eduassist.data.database import init_database
-from eduassist.services.translation_service import translate_text
+from eduassist.services.translation_service import translate_text, start_render_deadline
 
 @st.cache_resource
 def setup_database():
@@ -52,9 +57,30 @@ def setup_database():
         return False
 
 
+@st.cache_resource
+def start_embedding_warmup():
+    """Start loading the embedding service in the background once per process.
+
+    Importing ``embedding_service`` pulls in chromadb, which alone takes
+    seconds, so the import runs on the launcher thread too and the first
+    script run never waits for it.
+    """
+    def launch():
+        try:
+            from embedding_service import start_embedding_warmup as start
+        except ImportError:
+            return
+        start()
+
+    launcher = threading.Thread(target=launch, name="embedding-warmup-launcher", daemon=True)
+    launcher.start()
+    return launcher
+
+
 def main():
     """Main application entry point."""
     initialize_session_state()
+    start_render_deadline()
     
     if 'selected_language' not in st.session_state:
         st.session_state.selected_language = 'english'
@@ -64,9 +90,9 @@ def main():
         st.session_state.current_page = 'home'
     
     db_ready = setup_database()
+    start_embedding_warmup()
     
     courses = load_courses()
-    knowledge_base = load_knowledge_base()
     
     apply_theme()
     
@@ -76,11 +102,12 @@ def main():
         render_auth_section(db_ready)
         return
     
-    render_header()
-    
     lang = st.session_state.get('selected_language', 'english')
     user = st.session_state.get('user')
     
+    prefetch_page_text(lang, ["Welcome back", "Available Subjects", "Back to Dashboard"])
+    render_header()
+    
     if user:
         st.markdown(f"""
             <div style="text-align: center; margin-bottom: 2rem;">
@@ -140,7 +167,7 @@ def main():
             semester_options=semester_options
         )
     else:
-        render_active_app(courses, knowledge_base, db_ready, lang)
+        render_active_app(courses, db_ready, lang)
 
 
 def render_auth_section(db_ready):
@@ -171,7 +198,7 @@ def render_auth_section(db_ready):
         st.rerun()
 
 
-def render_active_app(courses, knowledge_base, db_ready, lang):
+def render_active_app(courses, db_ready, lang):
     """Render the currently active app/tab."""
     
     if st.button(translate_text("Back to Dashboard", lang)):
@@ -206,7 +233,7 @@ def render_active_app(courses, knowledge_base, db_ready, lang):
             <h2 class="section-title">{translate_text("Ask Questions", lang)}</h2>
         """, unsafe_allow_html=True)
         render_assistant_tab(
-            knowledge_base=knowledge_base,
+            knowledge_index=load_subject_index(get_subject_keys(subjects), knowledge_base_version()),
             subjects=subjects
         )
     elif active == "results":
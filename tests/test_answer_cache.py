@@ -0,0 +1,85 @@
+from eduassist.services.answer_cache import AnswerCache, normalize_question
+
+ANSWER = ("Lists are ordered.", "subject", 2.0)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_questions_are_normalized():
+    assert normalize_question("  What   is a LIST?? ") == "what is a list"
+    assert AnswerCache.make_key("What is a list?", "python", None, "v1") == \
+        AnswerCache.make_key("what is a list", "python", "", "v1")
+
+
+def test_kb_version_is_part_of_the_key():
+    cache = AnswerCache()
+    cache.put(AnswerCache.make_key("q", "python", None, "v1"), ANSWER)
+
+    assert cache.get(AnswerCache.make_key("q", "python", None, "v2")) is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = AnswerCache(max_entries=2)
+    cache.put("a", ANSWER)
+    cache.put("b", ANSWER)
+    cache.get("a")
+
+    cache.put("c", ANSWER)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == ANSWER and cache.get("c") == ANSWER
+    assert cache.stats()["evictions"] == 1
+
+
+def test_entries_expire_after_their_ttl():
+    clock = Clock()
+    cache = AnswerCache(ttl_seconds=60, clock=clock)
+    cache.put("a", ANSWER)
+    cache.put("b", ANSWER, ttl_seconds=5)
+
+    clock.now = 10
+    assert cache.get("a") == ANSWER
+    assert cache.get("b") is None
+
+    clock.now = 61
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 2
+
+
+def test_degraded_and_not_found_answers_get_the_short_ttl():
+    clock = Clock()
+    cache = AnswerCache(ttl_seconds=3600, degraded_ttl_seconds=30, clock=clock)
+    calls = []
+
+    def compute(answer, complete):
+        def run():
+            calls.append(answer)
+            return answer, complete
+        return run
+
+    cache.get_or_compute("full", "python", None, "v1", compute(ANSWER, True))
+    cache.get_or_compute("keyword only", "python", None, "v1", compute(ANSWER, False))
+    cache.get_or_compute("unknown", "python", None, "v1", compute(("", "not_found", 0.0), True))
+    cache.get_or_compute("full", "python", None, "v1", compute(ANSWER, True))
+    assert len(calls) == 3
+
+    clock.now = 31
+    for question in ("full", "keyword only", "unknown"):
+        cache.get_or_compute(question, "python", None, "v1", compute(ANSWER, True))
+    assert len(calls) == 5
+
+
+def test_stats_report_hit_rate():
+    cache = AnswerCache()
+    cache.put("a", ANSWER)
+    cache.get("a")
+    cache.get("missing")
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
@@ -0,0 +1,77 @@
+import numpy as np
+
+from eduassist.services.bm25 import BM25Ranker, tokenize
+from eduassist.services.knowledge_service import KnowledgeService
+
+DOCUMENTS = [
+    "Lists are ordered, mutable sequences; append adds an item to a list",
+    "Dictionaries map keys to values; a dictionary lookup uses the key hash",
+    "Recursion is when a function calls itself until it reaches a base case",
+    "A tuple is an ordered, immutable sequence",
+]
+
+
+def test_tokenize_drops_stopwords_and_punctuation():
+    assert tokenize("What is a Python list, please?") == ["python", "list"]
+
+
+def test_top_ranks_the_matching_document_first():
+    ranker = BM25Ranker.build(DOCUMENTS)
+
+    results = ranker.top("how does a function call itself", k=2)
+
+    assert results[0][0] == 2
+    assert all(score > 0 for _, score in results)
+
+
+def test_rare_term_outweighs_common_term():
+    ranker = BM25Ranker.build(DOCUMENTS)
+
+    scores = ranker.scores("ordered immutable")
+
+    # "ordered" is in two documents, "immutable" only in the tuple one
+    assert int(np.argmax(scores)) == 3
+
+
+def test_unknown_terms_score_nothing():
+    ranker = BM25Ranker.build(DOCUMENTS)
+
+    assert ranker.top("zebra quantum", k=3) == []
+    assert ranker.best("zebra quantum") == (-1, 0.0)
+
+
+def test_range_restricts_scored_documents():
+    ranker = BM25Ranker.build(DOCUMENTS)
+    full = ranker.scores("ordered sequence")
+
+    results = ranker.top("ordered sequence", k=4, start=2, stop=4)
+
+    assert [doc_id for doc_id, _ in results] == [3]
+    np.testing.assert_allclose(ranker.scores("ordered sequence", 2, 4), full[2:4])
+
+
+def test_scores_many_matches_scores():
+    ranker = BM25Ranker.build(DOCUMENTS)
+    queries = ["mutable list append", "key hash", "", "base case recursion"]
+
+    matrix = ranker.scores_many(queries, 1, 4)
+
+    for row, query in enumerate(queries):
+        np.testing.assert_allclose(matrix[row], ranker.scores(query, 1, 4), rtol=1e-6)
+
+
+def test_find_answer_falls_back_to_fulltext_when_no_keyword_matches():
+    knowledge_base = {
+        "python_programming": {
+            "recursion": {"keywords": ["recursion"], "answer": DOCUMENTS[2]},
+            "dictionaries": {"keywords": ["dictionary"], "answer": DOCUMENTS[1]},
+            "lists": {"keywords": ["list"], "answer": DOCUMENTS[0]},
+        },
+        "general": {},
+    }
+    service = KnowledgeService(knowledge_base)
+
+    answer, match_type, score = service.find_answer("my function calls itself until a base case")
+
+    assert (answer, match_type) == (DOCUMENTS[2], "fulltext")
+    assert score >= KnowledgeService.FULLTEXT_MIN_SCORE
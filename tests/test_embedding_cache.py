@@ -0,0 +1,81 @@
+import multiprocessing
+import os
+
+import numpy as np
+
+from eduassist.services.embedding_cache import EmbeddingCache
+
+
+def vector(text, dim=8):
+    return np.full(dim, float(sum(map(ord, text)) % 97), dtype=np.float32)
+
+
+def put_texts(cache_dir, prefix, count):
+    cache = EmbeddingCache(cache_dir, "model", "float32")
+    for i in range(count):
+        texts = [f"{prefix}-{i}-{j}" for j in range(3)]
+        cache.put_many(texts, [vector(text) for text in texts])
+
+
+def test_round_trip_and_duplicates(tmp_path):
+    cache = EmbeddingCache(str(tmp_path), "model", "float32")
+
+    assert cache.put_many(["a", "b", "a"], [vector("a"), vector("b"), vector("a")]) == 2
+    assert cache.put_many(["a"], [vector("a")]) == 0
+
+    found = cache.get_many(["b", "missing", "a"])
+    assert found[1] is None
+    np.testing.assert_array_equal(found[0], vector("b"))
+    np.testing.assert_array_equal(found[2], vector("a"))
+
+
+def test_reopened_cache_keeps_vectors_per_model(tmp_path):
+    EmbeddingCache(str(tmp_path), "model", "float16").put_many(["a"], [vector("a")])
+
+    assert len(EmbeddingCache(str(tmp_path), "model", "float16")) == 1
+    assert len(EmbeddingCache(str(tmp_path), "other model", "float16")) == 0
+    assert len(EmbeddingCache(str(tmp_path), "model", "float32")) == 0
+
+
+def test_torn_append_is_truncated_on_open(tmp_path):
+    cache = EmbeddingCache(str(tmp_path), "model", "float32")
+    cache.put_many(["a", "b"], [vector("a"), vector("b")])
+    # A writer that died after appending its vector but before its digest
+    with open(cache._vector_path, "ab") as f:
+        f.write(vector("c").tobytes()[:10])
+
+    reopened = EmbeddingCache(str(tmp_path), "model", "float32")
+
+    assert os.path.getsize(reopened._vector_path) == 2 * 8 * 4
+    reopened.put_many(["c"], [vector("c")])
+    np.testing.assert_array_equal(reopened.get_many(["c"])[0], vector("c"))
+
+
+def test_reader_sees_rows_appended_by_another_instance(tmp_path):
+    reader = EmbeddingCache(str(tmp_path), "model", "float32")
+    writer = EmbeddingCache(str(tmp_path), "model", "float32")
+
+    writer.put_many(["a"], [vector("a")])
+    np.testing.assert_array_equal(reader.get_many(["a"])[0], vector("a"))
+
+    reader.put_many(["b"], [vector("b")])
+    np.testing.assert_array_equal(writer.get_many(["b"])[0], vector("b"))
+    np.testing.assert_array_equal(writer.get_many(["a"])[0], vector("a"))
+
+
+def test_concurrent_writer_processes_never_share_rows(tmp_path):
+    cache_dir = str(tmp_path)
+    EmbeddingCache(cache_dir, "model", "float32").put_many(["seed"], [vector("seed")])
+    context = multiprocessing.get_context("fork")
+    writers = [context.Process(target=put_texts, args=(cache_dir, f"w{w}", 30)) for w in range(4)]
+    for process in writers:
+        process.start()
+    for process in writers:
+        process.join()
+
+    texts = ["seed"] + [f"w{w}-{i}-{j}" for w in range(4) for i in range(30) for j in range(3)]
+    found = EmbeddingCache(cache_dir, "model", "float32").get_many(texts)
+
+    assert all(vector_found is not None for vector_found in found)
+    for text, vector_found in zip(texts, found):
+        np.testing.assert_array_equal(vector_found, vector(text))
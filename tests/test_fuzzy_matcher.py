@@ -0,0 +1,87 @@
+import itertools
+import random
+
+import pytest
+
+from eduassist.services.fuzzy_matcher import FuzzyKeywordMatcher, bounded_edit_distance, trigrams
+
+
+def osa_distance(a: str, b: str) -> int:
+    """Unbounded optimal string alignment distance, the reference for the banded version."""
+    d = [[0] * (len(b) + 1) for _ in range(len(a) + 1)]
+    for i in range(len(a) + 1):
+        d[i][0] = i
+    for j in range(len(b) + 1):
+        d[0][j] = j
+    for i, j in itertools.product(range(1, len(a) + 1), range(1, len(b) + 1)):
+        cost = 0 if a[i - 1] == b[j - 1] else 1
+        d[i][j] = min(d[i - 1][j] + 1, d[i][j - 1] + 1, d[i - 1][j - 1] + cost)
+        if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+            d[i][j] = min(d[i][j], d[i - 2][j - 2] + 1)
+    return d[len(a)][len(b)]
+
+
+@pytest.mark.parametrize("a,b,expected", [
+    ("python", "python", 0),
+    ("python", "pyhton", 1),
+    ("variable", "varaible", 1),
+    ("function", "funtion", 1),
+    ("function", "fnuction", 1),
+    ("recursion", "recusrion", 1),
+    ("kitten", "sitting", 3),
+    ("", "abc", 3),
+])
+def test_bounded_distance_matches_reference_within_bound(a, b, expected):
+    assert osa_distance(a, b) == expected
+    assert bounded_edit_distance(a, b, 3) == expected
+
+
+def test_distance_beyond_bound_is_capped():
+    assert bounded_edit_distance("kitten", "sitting", 1) == 2
+    assert bounded_edit_distance("abc", "abcdefgh", 2) == 3
+    assert bounded_edit_distance("dictionary", "recursion", 2) == 3
+
+
+def test_bounded_distance_agrees_with_reference_on_random_pairs():
+    rng = random.Random(7)
+    for _ in range(500):
+        a = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 8)))
+        b = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 8)))
+        for bound in range(4):
+            assert bounded_edit_distance(a, b, bound) == min(osa_distance(a, b), bound + 1), (a, b, bound)
+
+
+def test_trigrams_are_padded():
+    assert trigrams("ab") == {"  a", " ab", "ab "}
+
+
+KEYWORDS = ["variable", "function", "dictionary", "list", "for loop", "recursion", "inheritance"]
+
+
+def test_find_tolerates_length_based_number_of_edits():
+    matcher = FuzzyKeywordMatcher(KEYWORDS)
+
+    found = {KEYWORDS[keyword_id] for keyword_id in matcher.find("how do I use a fucntion with a dictonary")}
+
+    assert found == {"function", "dictionary"}
+
+
+def test_find_ignores_exact_short_and_known_words():
+    matcher = FuzzyKeywordMatcher(KEYWORDS, known_words={"functions"})
+
+    # exact matches are the keyword matcher's job; "lsit" is too short for any edit;
+    # "functions" is a real word of the knowledge base, not a typo of "function"
+    assert matcher.find("variable lsit functions") == set()
+
+
+def test_find_matches_multi_word_keywords():
+    matcher = FuzzyKeywordMatcher(KEYWORDS)
+
+    assert {KEYWORDS[keyword_id] for keyword_id in matcher.find("write a for lop")} == {"for loop"}
+
+
+def test_suggest_allows_one_more_edit_closest_first():
+    matcher = FuzzyKeywordMatcher(KEYWORDS)
+
+    assert matcher.find("inhertance fnctoin") == {KEYWORDS.index("inheritance")}
+    assert matcher.suggest("inhertance fnctoin") == ["inheritance", "function"]
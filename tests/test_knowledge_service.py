@@ -0,0 +1,59 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from eduassist.services.knowledge_service import KnowledgeService
+
+ROOT = Path(__file__).resolve().parent.parent
+
+EXTRA_QUESTIONS = [
+    "",
+    "hello there",
+    "what is a varaible in pyhton",
+    "explain dictionaries and lists",
+    "how do I open a file",
+    "tell me about quantum chromodynamics",
+    "my function calls itself until a base case",
+    "anonymous one line expression",
+]
+
+
+@pytest.fixture(scope="module")
+def service():
+    with open(ROOT / "knowledge_base.json", "r", encoding="utf-8") as f:
+        knowledge_base = json.load(f)
+    # A second subject, so the fallback subject path is exercised too
+    knowledge_base["data_structures"] = {
+        "stacks": {"keywords": ["stack", "push", "pop"], "answer": "A stack is a LIFO collection."},
+        "queues": {"keywords": ["queue", "enqueue"], "answer": "A queue is a FIFO collection."},
+    }
+    return KnowledgeService(knowledge_base)
+
+
+@pytest.fixture(scope="module")
+def questions():
+    with open(ROOT / "benchmarks" / "golden" / "retrieval_v1.json", "r", encoding="utf-8") as f:
+        golden = json.load(f)
+    return [entry["question"] for entry in golden["questions"]] + EXTRA_QUESTIONS + [
+        "how do I push onto a stack", "what is a queue",
+    ]
+
+
+@pytest.mark.parametrize("subject_key,fallback_subject_key", [
+    ("python_programming", None),
+    ("python_programming", "data_structures"),
+    ("data_structures", "python_programming"),
+])
+def test_answer_many_matches_find_answer(service, questions, subject_key, fallback_subject_key):
+    expected = [service.find_answer(question, subject_key, fallback_subject_key) for question in questions]
+
+    answers = service.answer_many(questions, subject_key, fallback_subject_key, batch_size=7)
+
+    assert [(answer, match_type) for answer, match_type, _ in answers] == \
+        [(answer, match_type) for answer, match_type, _ in expected]
+    assert [score for _, _, score in answers] == pytest.approx([score for _, _, score in expected], rel=1e-5)
+
+
+def test_answer_many_of_nothing(service):
+    assert service.answer_many([]) == []
@@ -0,0 +1,66 @@
+import json
+
+import pytest
+
+from eduassist.services.practice_bank import PracticeBank
+
+
+def write_seed(path, data):
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def positions(bank, subject, topic, difficulty):
+    return bank._conn.execute(
+        "SELECT position, question FROM questions WHERE subject = ? AND topic = ? AND difficulty = ? "
+        "ORDER BY position", (subject, topic, difficulty)
+    ).fetchall()
+
+
+@pytest.fixture
+def bank(tmp_path):
+    bank = PracticeBank(str(tmp_path / "bank.db"))
+    yield bank
+    bank.close()
+
+
+def test_sample_is_reproducible_and_rounds_do_not_repeat(bank):
+    bank.import_questions(("python", "default", "easy", f"q{i}") for i in range(10))
+
+    first = bank.sample("python", k=5, seed="student-1")
+    second = bank.sample("python", k=5, seed="student-1", round_number=1)
+
+    assert first == bank.sample("python", k=5, seed="student-1")
+    assert len(set(first)) == 5
+    assert set(first) | set(second) == {f"q{i}" for i in range(10)}
+
+
+def test_sample_falls_back_to_default_topic(bank):
+    bank.import_questions([("python", "default", "medium", "general question")])
+
+    assert bank.sample("python", topic="loops", k=3) == ["general question"]
+    assert bank.sample("unknown", k=3) == []
+
+
+def test_import_skips_duplicates(bank):
+    rows = [("python", "default", "easy", "q1"), ("python", "default", "easy", "q2")]
+
+    assert bank.import_questions(rows) == 2
+    assert bank.import_questions(rows) == 0
+    assert bank.count("python") == 2
+
+
+def test_sync_replaces_edited_and_removed_seed_questions(bank, tmp_path):
+    seed = tmp_path / "seed.json"
+    write_seed(seed, {"python": {"default": {"easy": ["a", "b", "c"], "hard": ["h"]}}})
+    assert bank.sync(str(seed)) == 4
+    assert bank.sync(str(seed)) == 0
+    bank.import_questions([("python", "default", "easy", "imported")])
+
+    write_seed(seed, {"python": {"default": {"easy": ["a", "b edited"]}}})
+    bank.sync(str(seed))
+
+    easy = positions(bank, "python", "default", "easy")
+    assert sorted(question for _, question in easy) == ["a", "b edited", "imported"]
+    assert [position for position, _ in easy] == [0, 1, 2]
+    assert bank.count("python", difficulty="hard") == 0
+    assert len(bank.sample("python", difficulty="easy", k=10)) == 3
@@ -0,0 +1,48 @@
+import json
+
+import pytest
+
+from benchmarks import retrieval_benchmark as benchmark
+
+QUESTIONS = [
+    {"question": "q1", "subject": "python_programming", "topic": "lists"},
+    {"question": "q2", "subject": "python_programming", "topic": "tuples"},
+    {"question": "q3", "subject": "python_programming", "topic": "sets"},
+    {"question": "q4", "subject": "python_programming", "topic": "loops"},
+]
+
+RANKINGS = {
+    "q1": ["python_programming_lists", "python_programming_tuples"],
+    "q2": ["python_programming_lists", "python_programming_tuples"],
+    "q3": ["python_programming_lists", "python_programming_tuples", "python_programming_sets"],
+    "q4": [],
+}
+
+
+def test_percentile_is_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+
+    assert benchmark.percentile(values, 50) == 50.0
+    assert benchmark.percentile(values, 99) == 99.0
+    assert benchmark.percentile([], 95) == 0.0
+
+
+def test_evaluate_scores_recall_and_mrr():
+    report = benchmark.evaluate(lambda question: RANKINGS[question], QUESTIONS, repeat=1)
+
+    assert report["questions"] == 4
+    assert report["recall_at_1"] == pytest.approx(1 / 4)
+    assert report["recall_at_3"] == pytest.approx(3 / 4)
+    assert report["mrr"] == pytest.approx((1 + 1 / 2 + 1 / 3) / 4)
+    assert [miss["question"] for miss in report["misses"]] == ["q2", "q3", "q4"]
+
+
+def test_golden_set_is_versioned_and_hashed(tmp_path):
+    path = tmp_path / "golden.json"
+    path.write_text(json.dumps({"version": 3, "questions": QUESTIONS}), encoding="utf-8")
+
+    golden = benchmark.load_golden(path)
+
+    assert golden["version"] == 3
+    assert len(golden["sha256"]) == 64
+    assert golden["sha256"] == benchmark.load_golden(path)["sha256"]
@@ -0,0 +1,139 @@
+import pytest
+
+from eduassist.services import translation_backends, translation_service
+from eduassist.services.translation_backends import (CircuitBreaker, GoogleBackend, StubBackend, UpstreamError,
+                                                     create_translation_backend)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(translation_backends.time, "monotonic", clock)
+    return clock
+
+
+def open_breaker(breaker):
+    for _ in range(breaker.threshold):
+        breaker.allow()
+        breaker.record_failure()
+
+
+def test_opens_after_threshold_consecutive_failures(clock):
+    breaker = CircuitBreaker(threshold=3, reset_seconds=30)
+
+    assert not breaker.record_failure()
+    assert not breaker.record_failure()
+    assert breaker.state == "closed" and breaker.allow()
+    assert breaker.record_failure()
+
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+
+def test_success_resets_the_failure_count(clock):
+    breaker = CircuitBreaker(threshold=3, reset_seconds=30)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+
+    assert not breaker.record_failure()
+    assert breaker.state == "closed"
+
+
+def test_half_open_lets_exactly_one_probe_through(clock):
+    breaker = CircuitBreaker(threshold=2, reset_seconds=30)
+    open_breaker(breaker)
+
+    clock.now += 29
+    assert not breaker.allow()
+    clock.now += 1
+    assert breaker.state == "half-open"
+    assert breaker.allow()
+    assert not breaker.allow()
+
+
+def test_successful_probe_closes(clock):
+    breaker = CircuitBreaker(threshold=2, reset_seconds=30)
+    open_breaker(breaker)
+    clock.now += 30
+    breaker.allow()
+
+    breaker.record_success()
+
+    assert breaker.state == "closed" and breaker.allow()
+
+
+def test_failed_probe_reopens_for_a_full_cool_down(clock):
+    breaker = CircuitBreaker(threshold=2, reset_seconds=30)
+    open_breaker(breaker)
+    clock.now += 30
+    breaker.allow()
+
+    assert breaker.record_failure()
+
+    assert breaker.state == "open"
+    clock.now += 29
+    assert not breaker.allow()
+
+
+def test_inconclusive_probe_lets_the_next_caller_probe(clock):
+    breaker = CircuitBreaker(threshold=2, reset_seconds=30)
+    open_breaker(breaker)
+    clock.now += 30
+    breaker.allow()
+
+    breaker.record_inconclusive()
+
+    assert breaker.state == "half-open"
+    assert breaker.allow()
+
+
+class _BrokenBackend(StubBackend):
+    def __init__(self, error):
+        super().__init__()
+        self.error = error
+        self.calls = 0
+
+    def translate(self, text, source_code, target_code):
+        self.calls += 1
+        raise self.error
+
+
+@pytest.mark.parametrize("error", [UpstreamError("HTTP 429"), RuntimeError("unexpected")])
+def test_request_fails_fast_once_the_breaker_opens(monkeypatch, error):
+    backend = _BrokenBackend(error)
+    monkeypatch.setattr(translation_service, "get_translation_backend", lambda: backend)
+    monkeypatch.setattr(translation_service, "_breaker", CircuitBreaker(threshold=3, reset_seconds=30))
+
+    for _ in range(5):
+        with pytest.raises(UpstreamError):
+            translation_service._request("Home", "en", "te")
+
+    assert backend.calls == 3
+
+
+def test_empty_translation_does_not_close_an_open_breaker(monkeypatch, clock):
+    breaker = CircuitBreaker(threshold=1, reset_seconds=30)
+    open_breaker(breaker)
+    clock.now += 30
+    monkeypatch.setattr(translation_service, "_breaker", breaker)
+    monkeypatch.setattr(translation_service, "get_translation_backend", lambda: type(
+        "Empty", (StubBackend,), {"translate": lambda self, text, source, target: None})())
+
+    assert translation_service._request("Home", "en", "te") is None
+    assert breaker.state == "half-open"
+
+
+def test_create_translation_backend():
+    assert isinstance(create_translation_backend("google"), GoogleBackend)
+    assert isinstance(create_translation_backend("stub"), StubBackend)
+    with pytest.raises(ValueError):
+        create_translation_backend("bing")
@@ -0,0 +1,84 @@
+import pytest
+
+from eduassist.services import translation_cache
+from eduassist.services.translation_cache import TranslationStore
+
+
+@pytest.fixture
+def make_store(tmp_path):
+    stores = []
+
+    def make(**kwargs):
+        store = TranslationStore(str(tmp_path / "translations.db"), **kwargs)
+        stores.append(store)
+        return store
+
+    yield make
+    for store in stores:
+        store.close()
+
+
+def test_round_trip_per_language_pair(make_store):
+    store = make_store()
+    store.put_many({"Home": "హోమ్"}, "en", "te")
+
+    assert store.get_many(["Home", "Forum"], "en", "te") == {"Home": ("హోమ్", False)}
+    assert store.get_many(["Home"], "en", "hi") == {}
+
+
+def test_translations_survive_a_restart(make_store):
+    make_store().put_many({"Home": "हो"}, "en", "hi")
+
+    assert make_store().get_many(["Home"], "en", "hi") == {"Home": ("हो", False)}
+
+
+def test_old_entries_are_served_as_stale(make_store, monkeypatch):
+    store = make_store(stale_seconds=100)
+    now = [1000.0]
+    monkeypatch.setattr(translation_cache.time, "time", lambda: now[0])
+    store.put_many({"Home": "x"}, "en", "te")
+
+    now[0] = 1101.0
+
+    assert store.get_many(["Home"], "en", "te") == {"Home": ("x", True)}
+
+
+def test_memory_lru_is_bounded(make_store):
+    store = make_store(memory_size=2)
+    store.put_many({"a": "1", "b": "2", "c": "3"}, "en", "te")
+
+    assert list(store._memory) == [("b", "en", "te"), ("c", "en", "te")]
+    assert store.get_many(["a"], "en", "te") == {"a": ("1", False)}
+
+
+def test_reads_do_not_write(make_store):
+    store = make_store(touch_flush_seconds=3600)
+    store.put_many({"a": "1", "b": "2"}, "en", "te")
+    store._memory.clear()
+    writes = store._conn.total_changes
+
+    store.get_many(["a", "b"], "en", "te")
+    store.get_many(["a"], "en", "te")
+
+    assert store._conn.total_changes == writes
+
+
+def test_prune_keeps_entries_used_from_memory(make_store, monkeypatch):
+    store = make_store(memory_size=16, max_entries=4, touch_flush_seconds=3600)
+    now = [1000.0]
+    monkeypatch.setattr(translation_cache.time, "time", lambda: now[0])
+    store.put_many({"a": "A"}, "en", "te")
+    now[0] = 1500.0
+    store.put_many({text: text.upper() for text in "bcd"}, "en", "te")
+
+    # "a" was inserted first, but used last, and only ever from the in-memory LRU
+    now[0] = 2000.0
+    store.get_many(["a"], "en", "te")
+    now[0] = 3000.0
+    store.put_many({"e": "E"}, "en", "te")
+    store._prune()
+
+    store._memory.clear()
+    kept = store.get_many(list("abcde"), "en", "te")
+    assert store.count() == 4
+    assert "a" in kept and "e" in kept
@@ -0,0 +1,116 @@
+import time
+from concurrent.futures import wait
+
+import pytest
+
+from eduassist.services import translation_backends, translation_service
+from eduassist.services.translation_backends import CircuitBreaker, GoogleBackend, StubBackend
+from eduassist.services.translation_cache import TranslationStore
+
+
+class _Response:
+    status_code = 200
+
+    def __init__(self, text):
+        self.text = text
+
+
+@pytest.fixture
+def google(monkeypatch):
+    """A GoogleBackend whose sessions answer every request with a canned page."""
+    calls = []
+
+    def get(session, url, params=None, timeout=None):
+        calls.append(params["q"])
+        lines = params["q"].split("\n")
+        # One element per segment, with whitespace and blank lines between them
+        body = "\n\n".join(f"  <span>te:{line}</span>  " for line in lines)
+        return _Response(f'<html><div class="result-container">\n{body}\n</div></html>')
+
+    monkeypatch.setattr(translation_backends.requests.Session, "get", get)
+    backend = GoogleBackend()
+    monkeypatch.setattr(translation_service, "get_translation_backend", lambda: backend)
+    monkeypatch.setattr(translation_service, "_breaker", CircuitBreaker(threshold=5, reset_seconds=30))
+    return calls
+
+
+def test_batch_of_strings_takes_one_request(google):
+    texts = ["Home", "Courses", "Practice questions", "Forum"]
+
+    results = translation_service._translate_upstream(texts, "en", "te")
+
+    assert len(google) == 1
+    assert results == {text: f"te:{text}" for text in texts}
+
+
+def test_text_with_newline_is_requested_on_its_own(google):
+    results = translation_service._translate_upstream(["Home", "line one\nline two"], "en", "te")
+
+    assert len(google) == 2
+    assert results["Home"] == "te:Home"
+    assert [line.strip() for line in results["line one\nline two"].split("\n") if line.strip()] == \
+        ["te:line one", "te:line two"]
+
+
+class _CountingStub(StubBackend):
+    def __init__(self, latency):
+        super().__init__(latency)
+        self.requests = []
+
+    def translate(self, text, source_code, target_code):
+        self.requests.append(text)
+        return super().translate(text, source_code, target_code)
+
+
+@pytest.fixture
+def slow_backend(monkeypatch, tmp_path):
+    """A stub backend taking 0.3s per request, with an empty store and catalog."""
+    backend = _CountingStub(latency=0.3)
+    store = TranslationStore(str(tmp_path / "translations.db"))
+    monkeypatch.setattr(translation_service, "get_translation_backend", lambda: backend)
+    monkeypatch.setattr(translation_service, "get_translation_store", lambda: store)
+    monkeypatch.setattr(translation_service, "_breaker", CircuitBreaker(threshold=5, reset_seconds=30))
+    monkeypatch.setattr(translation_service, "_catalogs", {"te": {}})
+    yield backend
+    wait(list(translation_service._in_flight.values()))
+    if hasattr(translation_service._render, "deadline"):
+        del translation_service._render.deadline
+    store.close()
+
+
+def test_render_deadline_returns_source_text_and_fills_the_store(slow_backend):
+    translation_service.start_render_deadline(0.05)
+    started = time.monotonic()
+
+    first = translation_service.translate_many(["Home", "Forum"], "telugu")
+
+    assert first == ["Home", "Forum"]
+    assert time.monotonic() - started < 0.25
+    wait(list(translation_service._in_flight.values()))
+
+    translation_service.start_render_deadline(0.05)
+    assert translation_service.translate_many(["Home", "Forum"], "telugu") == ["[te] Home", "[te] Forum"]
+    assert len(slow_backend.requests) == 1
+
+
+def test_deadline_is_shared_by_every_call_of_a_run(slow_backend):
+    translation_service.start_render_deadline(0.5)
+
+    assert translation_service.translate_text("Home", "telugu") == "[te] Home"
+    # The first call used most of the budget, so the second one gives up early
+    started = time.monotonic()
+    assert translation_service.translate_text("Forum", "telugu") == "Forum"
+    assert time.monotonic() - started < 0.3
+
+
+def test_without_a_deadline_calls_wait_for_translations(slow_backend):
+    assert translation_service.translate_many(["Home", "Home", ""], "telugu") == ["[te] Home", "[te] Home", ""]
+
+
+def test_concurrent_requests_for_a_text_share_one_upstream_call(slow_backend):
+    translation_service.start_render_deadline(0.0)
+    translation_service.translate_many(["Home"], "telugu")
+    translation_service.translate_many(["Home"], "telugu")
+    wait(list(translation_service._in_flight.values()))
+
+    assert slow_backend.requests == ["Home"]